@@ -44,6 +44,26 @@ nitpick_ignore = [
     ('py:class', 'datetime.datetime'),
     ('py:class', 'datetime.date'),
     ('py:class', 'date'),
+    ('py:class', 'datetime'),
+    ('py:class', 'datetime.timedelta'),
+    ('py:class', 'pathlib.Path'),
+    ('py:class', 'argparse.ArgumentParser'),
+    # Private type aliases, only defined when type checking
+    ('py:class', 'IntArray'),
+    ('py:class', 'IntArrayLike'),
+    ('py:class', 'Moments'),
+    ('py:class', 'BoolArray'),
+    ('py:class', 'Times'),
+    ('py:class', 'FloatArrayLike'),
+    ('py:class', 'Row'),
+    ('py:class', 'numpy.datetime64'),
+    # Type variables of the generic cache, and the empty arguments of a callable
+    # that are parsed as a separate reference
+    ('py:class', 'K'),
+    ('py:class', 'V'),
+    ('py:class', 'Callable[[]'),
+    # The private default of a setting that is not changed
+    ('py:class', 'jewcal.utils.cache._Keep'),
 ]
 
 # -- Options for HTML output -------------------------------------------------
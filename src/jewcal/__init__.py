@@ -7,7 +7,7 @@ from warnings import warn
 
 from .core import JewCal
 from .models.events import Events
-from .models.jewish_date import JewishDate, Month
+from .models.jewish_date import JewishDate, Month, from_jewish, from_jewish_bulk
 from .models.zmanim import Location, Zmanim
 
 Jewcal = JewCal
@@ -38,4 +38,6 @@ __all__ = [
     'Location',
     'Month',
     'Zmanim',
+    'from_jewish',
+    'from_jewish_bulk',
 ]
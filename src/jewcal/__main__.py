@@ -2,16 +2,33 @@
 
 This script can be invoked from the command line:
     `jewcal`
+
+The zmanim of many locations are calculated with a subcommand, see
+:py:mod:`jewcal.zmanim_batch`:
+    `jewcal zmanim-batch locations.csv --from 2024-01-01 --to 2025-01-01`
 """
 
+import sys
+from collections.abc import Sequence
 from pprint import pprint
 
-from jewcal import JewCal
+from jewcal import JewCal, zmanim_batch
 from jewcal.models.zmanim import Location
 
 
-def main() -> None:
-    """Run a simple example."""
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run a simple example, or the subcommand `zmanim-batch`.
+
+    Args:
+        argv: The command line arguments, default is `sys.argv`.
+
+    Returns:
+        The exit code.
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] == 'zmanim-batch':
+        return zmanim_batch.main(argv[1:])
+
     today = JewCal()
 
     print(f'Today is {today.jewish_date!s}', end='\n\n')
@@ -41,6 +58,8 @@ def main() -> None:
 
     print(f'\n{location}')
 
+    return 0
+
 
 if __name__ == '__main__':  # pragma: no cover
-    main()
+    sys.exit(main())
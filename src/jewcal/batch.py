@@ -0,0 +1,188 @@
+"""Convert many dates between the Gregorian and Jewish calendar at once.
+
+The conversions are vectorized with NumPy over a table of the Jewish years in range.
+NumPy is optional, install it with the extra ``pip install jewcal[numpy]``. Without
+NumPy the dates are converted one by one and lists are returned.
+
+>>> from datetime import date
+
+>>> from jewcal import batch
+
+>>> years, months, days = batch.to_jewish([date(2022, 4, 16).toordinal()])
+>>> print(int(years[0]), int(months[0]), int(days[0]))
+5782 1 15
+
+>>> ordinals = batch.to_gregorian([5782], [1], [15])
+>>> print(date.fromordinal(int(ordinals[0])))
+2022-04-16
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .utils.calculations import (
+    JEWISH_EPOCH,
+    MEAN_YEAR_DENOMINATOR,
+    MEAN_YEAR_NUMERATOR,
+    absdate_to_jewish,
+    jewish_to_absdate,
+    jewish_year,
+)
+
+try:
+    import numpy as np
+
+    HAS_NUMPY = True
+except ImportError:  # pragma: no cover
+    HAS_NUMPY = False
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence  # pragma: no cover
+
+    import numpy.typing as npt  # pragma: no cover
+
+    IntArray = npt.NDArray[np.int64] | list[int]  # pragma: no cover
+    IntArrayLike = npt.NDArray[np.integer[Any]] | Sequence[int]  # pragma: no cover
+
+# Longest Jewish year
+MAX_DAYS_IN_YEAR = 385
+
+# Adar II, the last month of a leap year
+MAX_MONTH = 13
+
+
+class _YearTable(NamedTuple):
+    """The structure of consecutive Jewish years as arrays."""
+
+    first_year: int
+    first_days: npt.NDArray[np.int64]
+    days: npt.NDArray[np.int64]
+    month_offsets: npt.NDArray[np.int64]
+    months: npt.NDArray[np.int64]
+    days_of_month: npt.NDArray[np.int64]
+
+
+def to_jewish(ordinals: IntArrayLike) -> tuple[IntArray, IntArray, IntArray]:
+    """Convert Gregorian ordinals (absolute date numbers) to Jewish dates.
+
+    Args:
+        ordinals: The Gregorian ordinals, as returned by ``date.toordinal``.
+
+    Returns:
+        The Jewish years, months and days.
+    """
+    if not HAS_NUMPY:
+        dates = [absdate_to_jewish(int(ordinal)) for ordinal in ordinals]
+        return (
+            [year for year, _, _ in dates],
+            [month for _, month, _ in dates],
+            [day for _, _, day in dates],
+        )
+
+    absdates = np.asarray(ordinals, dtype=np.int64)
+    if not absdates.size:
+        empty = np.zeros(absdates.shape, dtype=np.int64)
+        return (empty, empty.copy(), empty.copy())
+
+    # Years elapsed half a mean year ago: the year is this or the next one.
+    elapsed = absdates + (JEWISH_EPOCH - 1)
+    years = (2 * elapsed * MEAN_YEAR_DENOMINATOR - MEAN_YEAR_NUMERATOR) // (
+        2 * MEAN_YEAR_NUMERATOR
+    ) + 1
+
+    table = _year_table(int(years.min()), int(years.max()) + 1)
+
+    index = years - table.first_year
+    index += absdates >= table.first_days[index] + table.days[index]
+
+    day_of_year = absdates - table.first_days[index]
+
+    return (
+        index + table.first_year,
+        table.months[index, day_of_year],
+        table.days_of_month[index, day_of_year],
+    )
+
+
+def to_gregorian(
+    years: IntArrayLike,
+    months: IntArrayLike,
+    days: IntArrayLike,
+) -> IntArray:
+    """Convert Jewish dates to Gregorian ordinals (absolute date numbers).
+
+    Args:
+        years: The Jewish years.
+        months: The Jewish months.
+        days: The Jewish days.
+
+    Returns:
+        The Gregorian ordinals, to be converted with ``date.fromordinal``.
+
+    Raises:
+        ValueError: If a month is not in 1 to 13.
+    """
+    if not HAS_NUMPY:
+        if any(not 1 <= int(month) <= MAX_MONTH for month in months):
+            msg = f'month must be in 1 to {MAX_MONTH}'
+            raise ValueError(msg)
+
+        return [
+            jewish_to_absdate(int(year), int(month), int(day))
+            for year, month, day in zip(years, months, days, strict=True)
+        ]
+
+    year_array = np.asarray(years, dtype=np.int64)
+    month_array = np.asarray(months, dtype=np.int64)
+    day_array = np.asarray(days, dtype=np.int64)
+    if not year_array.size:
+        return np.zeros(year_array.shape, dtype=np.int64)
+    if ((month_array < 1) | (month_array > MAX_MONTH)).any():
+        msg = f'month must be in 1 to {MAX_MONTH}'
+        raise ValueError(msg)
+
+    table = _year_table(int(year_array.min()), int(year_array.max()))
+    index = year_array - table.first_year
+
+    absdates: npt.NDArray[np.int64] = (
+        table.first_days[index]
+        + table.month_offsets[index, month_array]
+        + day_array
+        - 1
+    )
+    return absdates
+
+
+def _year_table(first_year: int, last_year: int) -> _YearTable:
+    """Get the structure of the Jewish years as arrays.
+
+    Each day of the year is mapped to its month and day in the month, so a date is
+    converted with a lookup instead of a search.
+
+    Args:
+        first_year: The first Jewish year.
+        last_year: The last Jewish year (inclusive).
+
+    Returns:
+        The structure of the Jewish years.
+    """
+    structures = [jewish_year(year) for year in range(first_year, last_year + 1)]
+
+    months = np.zeros((len(structures), MAX_DAYS_IN_YEAR), dtype=np.int64)
+    days_of_month = np.zeros((len(structures), MAX_DAYS_IN_YEAR), dtype=np.int64)
+    for row, structure in enumerate(structures):
+        for month in structure.months:
+            start = structure.month_offsets[month]
+            end = start + structure.month_days[month]
+            months[row, start:end] = month
+            days_of_month[row, start:end] = np.arange(1, end - start + 1)
+
+    return _YearTable(
+        first_year,
+        np.array([structure.first_day for structure in structures], dtype=np.int64),
+        np.array([structure.days for structure in structures], dtype=np.int64),
+        np.array([structure.month_offsets for structure in structures], np.int64),
+        months,
+        days_of_month,
+    )
@@ -0,0 +1,229 @@
+"""Benchmarks for the conversion, events and zmanim hot paths.
+
+The results are written as JSON to track them across releases.
+
+This script can be invoked from the command line:
+    `python -m jewcal.bench --output bench.json`
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from datetime import date, datetime, timedelta, timezone
+from importlib.metadata import PackageNotFoundError, version
+from timeit import Timer
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+from .core import JewCal
+from .helpers import sun_batch
+from .helpers.sun import Sun
+from .models.events import Events
+from .models.zmanim import SUN_EVENTS_CACHE, Location, Zmanim
+from .utils.calculations import absdate_to_jewish
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence  # pragma: no cover
+
+DATE = date(2024, 5, 31)
+ABSDATE = DATE.toordinal()
+DECADE = DATE + timedelta(days=3652)
+ANTWERP = Location(latitude=51.22047, longitude=4.40026)
+
+
+class Benchmark(NamedTuple):
+    """A benchmark of a function."""
+
+    name: str
+    """The name of the benchmark."""
+
+    function: Callable[[], object]
+    """The function to time."""
+
+    number: int
+    """The number of calls per timing."""
+
+    cached: bool = False
+    """`True` to time with the cache of the sun events, `False` without."""
+
+
+class MemoryBenchmark(NamedTuple):
+    """A benchmark of the memory of objects."""
+
+    name: str
+    """The name of the benchmark."""
+
+    function: Callable[[], list[object]]
+    """The function creating the objects to measure."""
+
+
+def _dates(start: date, days: int) -> list[date]:
+    return [start + timedelta(days=day) for day in range(days)]
+
+
+def _jewcal_range(
+    days: int,
+    location: Location | None = None,
+    *,
+    diaspora: bool = True,
+) -> list[object]:
+    return [
+        JewCal(gregorian, location, diaspora=diaspora)
+        for gregorian in _dates(DATE, days)
+    ]
+
+
+BENCHMARKS: tuple[Benchmark, ...] = (
+    Benchmark('absdate_to_jewish', lambda: absdate_to_jewish(ABSDATE), 10000),
+    Benchmark('events', lambda: Events(5, 2, 23, diaspora=True), 10000),
+    Benchmark('events_get', lambda: Events.get(5, 2, 23, diaspora=True), 10000),
+    Benchmark('sun', lambda: Sun(DATE, ANTWERP.latitude, ANTWERP.longitude), 100),
+    Benchmark('zmanim', lambda: Zmanim(DATE, ANTWERP), 100),
+    Benchmark('zmanim_cached', lambda: Zmanim(DATE, ANTWERP), 10000, cached=True),
+    Benchmark(
+        'zmanim_batch_year',
+        lambda: sun_batch.zmanim(range(ABSDATE, ABSDATE + 365), [ANTWERP]),
+        10,
+    ),
+    Benchmark(
+        'zmanim_table_year',
+        lambda: Zmanim.table(ANTWERP, DATE, DATE + timedelta(days=365)),
+        10,
+    ),
+    Benchmark('jewcal', lambda: JewCal(DATE), 10000),
+    Benchmark('jewcal_israel', lambda: JewCal(DATE, diaspora=False), 10000),
+    Benchmark('jewcal_location', lambda: JewCal(DATE, ANTWERP), 100),
+    Benchmark(
+        'jewcal_location_lazy',
+        lambda: JewCal(DATE, ANTWERP, lazy=True).jewish_date,
+        10000,
+    ),
+    Benchmark('jewcal_year', lambda: _jewcal_range(365), 10),
+    Benchmark('jewcal_year_israel', lambda: _jewcal_range(365, diaspora=False), 10),
+    Benchmark('jewcal_year_location', lambda: _jewcal_range(365, ANTWERP), 1),
+    Benchmark('jewcal_decade', lambda: _jewcal_range(3652), 1),
+    Benchmark('jewcal_decade_israel', lambda: _jewcal_range(3652, diaspora=False), 1),
+    Benchmark('jewcal_range_decade', lambda: list(JewCal.range(DATE, DECADE)), 1),
+)
+
+MEMORY_BENCHMARKS: tuple[MemoryBenchmark, ...] = (
+    MemoryBenchmark('jewcal_decade', lambda: _jewcal_range(3652)),
+    MemoryBenchmark('jewcal_range_decade', lambda: list(JewCal.range(DATE, DECADE))),
+    MemoryBenchmark('jewcal_year_location', lambda: _jewcal_range(365, ANTWERP)),
+)
+
+
+def run_benchmark(benchmark: Benchmark, repeat: int) -> dict[str, Any]:
+    """Time a benchmark.
+
+    Args:
+        benchmark: The benchmark to run.
+        repeat: The number of timings.
+
+    Returns:
+        The result with the seconds per call.
+    """
+    maxsize, ttl = SUN_EVENTS_CACHE.maxsize, SUN_EVENTS_CACHE.ttl
+    SUN_EVENTS_CACHE.configure(maxsize if benchmark.cached else 0, ttl)
+    try:
+        timings = Timer(benchmark.function).repeat(repeat, benchmark.number)
+    finally:
+        SUN_EVENTS_CACHE.configure(maxsize, ttl)
+    per_call = [timing / benchmark.number for timing in timings]
+
+    return {
+        'name': benchmark.name,
+        'number': benchmark.number,
+        'repeat': repeat,
+        'best': min(per_call),
+        'mean': sum(per_call) / len(per_call),
+    }
+
+
+def run_memory_benchmark(benchmark: MemoryBenchmark) -> dict[str, Any]:
+    """Measure the memory allocated for the objects of a benchmark.
+
+    Args:
+        benchmark: The benchmark to run.
+
+    Returns:
+        The result with the bytes per object.
+    """
+    tracemalloc.start()
+    try:
+        objects = benchmark.function()
+        allocated, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'name': benchmark.name,
+        'objects': len(objects),
+        'bytes': allocated,
+        'bytes_per_object': allocated / len(objects),
+    }
+
+
+def run(names: Sequence[str] = (), repeat: int = 5) -> dict[str, Any]:
+    """Run the benchmarks.
+
+    Args:
+        names: Run only the benchmarks containing one of the names, all if empty.
+        repeat: The number of timings per benchmark.
+
+    Returns:
+        The environment and the results of the benchmarks.
+    """
+
+    def selected(name: str) -> bool:
+        return not names or any(part in name for part in names)
+
+    try:
+        jewcal_version = version('jewcal')
+    except PackageNotFoundError:  # pragma: no cover
+        jewcal_version = None
+
+    return {
+        'jewcal': jewcal_version,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': datetime.now(tz=timezone.utc).isoformat(),
+        'timings': [
+            run_benchmark(benchmark, repeat)
+            for benchmark in BENCHMARKS
+            if selected(benchmark.name)
+        ],
+        'memory': [
+            run_memory_benchmark(benchmark)
+            for benchmark in MEMORY_BENCHMARKS
+            if selected(benchmark.name)
+        ],
+    }
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    """Run the benchmarks and write the results as JSON.
+
+    Args:
+        argv: The command line arguments, default is `sys.argv`.
+    """
+    parser = ArgumentParser(prog='python -m jewcal.bench', description=__doc__)
+    parser.add_argument('names', nargs='*', help='run only the matching benchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='timings per benchmark')
+    parser.add_argument('--output', help='the JSON file, default is stdout')
+    args = parser.parse_args(argv)
+
+    results = json.dumps(run(args.names, args.repeat), indent=2)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:  # noqa: PTH123
+            file.write(results + '\n')
+    else:
+        sys.stdout.write(results + '\n')
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main()
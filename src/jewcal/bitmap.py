@@ -0,0 +1,226 @@
+"""An index of the Issur Melacha days as a bitmap.
+
+Every day of a span of Jewish years is one bit, set if it is Issur Melacha. The bits
+of a year are the bits of its year type (keviah), so a year type is evaluated once.
+A century takes about 4.5 kB.
+
+>>> from datetime import date
+
+>>> from jewcal.bitmap import IssurMelachaIndex
+
+>>> index = IssurMelachaIndex(5784, 5785)
+>>> index.is_issur_melacha(date(2024, 6, 1))  # Shabbos
+True
+>>> index.count(date(2024, 6, 1), date(2024, 6, 15))  # 2 x Shabbos, Shavuos 1 & 2
+4
+"""
+
+from __future__ import annotations
+
+from functools import cache
+from struct import Struct
+from typing import TYPE_CHECKING, Final
+
+from .constants import EventKind
+from .models.events import Events
+from .utils.calculations import jewish_year, keviah, year_type
+
+if TYPE_CHECKING:
+    from datetime import date  # pragma: no cover
+
+# first year, last year, diaspora
+HEADER: Final = Struct('<iiB')
+
+
+class IssurMelachaIndex:
+    """The Issur Melacha days of a span of Jewish years for Diaspora or Israel."""
+
+    __slots__ = ('_bitmap', '_days', '_diaspora', '_first_day', '_years')
+
+    def __init__(
+        self,
+        first_year: int,
+        last_year: int,
+        *,
+        diaspora: bool = True,
+        bitmap: bytes | None = None,
+    ) -> None:
+        """Create the index of the Issur Melacha days.
+
+        Args:
+            first_year: The first Jewish year.
+            last_year: The last Jewish year (inclusive).
+            diaspora: `True` if outside of Israel, `False` if in Israel.
+            bitmap: The bitmap of the years, default is to build it.
+
+        Raises:
+            ValueError: If the last year is before the first year, or if the bitmap
+                does not match the years.
+        """
+        if last_year < first_year:
+            msg = 'last_year must not be before first_year'
+            raise ValueError(msg)
+
+        self._years = (first_year, last_year)
+        self._diaspora = diaspora
+        self._first_day = jewish_year(first_year).first_day
+
+        last = jewish_year(last_year)
+        self._days = last.first_day + last.days - self._first_day
+
+        if bitmap is None:
+            bits = 0
+            for year in range(first_year, last_year + 1):
+                offset = jewish_year(year).first_day - self._first_day
+                bits |= (
+                    _issur_melacha_bits(year_type(year), diaspora=diaspora) << offset
+                )
+            bitmap = bits.to_bytes(_bitmap_size(self._days), 'little')
+        elif len(bitmap) != _bitmap_size(self._days):
+            msg = 'bitmap does not match the years of the index'
+            raise ValueError(msg)
+
+        self._bitmap = bytes(bitmap)
+
+    @classmethod
+    def from_bytes(cls: type[IssurMelachaIndex], data: bytes) -> IssurMelachaIndex:
+        """Load an index exported with :py:meth:`to_bytes`.
+
+        Args:
+            data: The exported index.
+
+        Returns:
+            The index.
+
+        Raises:
+            ValueError: If the data is not an exported index.
+        """
+        if len(data) < HEADER.size:
+            msg = 'data is too short for an Issur Melacha index'
+            raise ValueError(msg)
+
+        first_year, last_year, diaspora = HEADER.unpack_from(data)
+
+        return cls(
+            first_year,
+            last_year,
+            diaspora=bool(diaspora),
+            bitmap=data[HEADER.size :],
+        )
+
+    def to_bytes(self) -> bytes:
+        """Export the index, the years and Diaspora or Israel followed by the bitmap.
+
+        Returns:
+            The exported index.
+        """
+        return HEADER.pack(*self._years, self._diaspora) + self._bitmap
+
+    @property
+    def first_year(self) -> int:
+        """Get the first Jewish year.
+
+        Returns:
+            The first Jewish year.
+        """
+        return self._years[0]
+
+    @property
+    def last_year(self) -> int:
+        """Get the last Jewish year (inclusive).
+
+        Returns:
+            The last Jewish year.
+        """
+        return self._years[1]
+
+    @property
+    def diaspora(self) -> bool:
+        """Is the index for Diaspora or Israel.
+
+        Returns:
+            `True` if outside of Israel, `False` if in Israel.
+        """
+        return self._diaspora
+
+    def is_issur_melacha(self, gregorian_date: date) -> bool:
+        """Is it Issur Melacha.
+
+        Equal to :py:meth:`jewcal.JewCal.is_issur_melacha` for the Gregorian date,
+        the Jewish date does not change at nightfall.
+
+        Args:
+            gregorian_date: The Gregorian date.
+
+        Returns:
+            `True` if it is Issur Melacha, `False` otherwise.
+        """
+        day = self._day(gregorian_date)
+        return bool(self._bitmap[day >> 3] >> (day & 7) & 1)
+
+    def count(self, start: date, end: date) -> int:
+        """Count the Issur Melacha days from start up to, but not including, end.
+
+        Args:
+            start: The first Gregorian date.
+            end: The Gregorian date to stop before.
+
+        Returns:
+            The number of Issur Melacha days.
+        """
+        first = self._day(start)
+        last = self._day(end, end=True)
+        if last <= first:
+            return 0
+
+        bits = int.from_bytes(self._bitmap[first >> 3 : (last + 7) >> 3], 'little')
+        bits >>= first & 7
+        bits &= (1 << (last - first)) - 1
+
+        return bits.bit_count()
+
+    def _day(self, gregorian_date: date, *, end: bool = False) -> int:
+        """Get the day in the index.
+
+        Args:
+            gregorian_date: The Gregorian date.
+            end: `True` if the day after the last day is allowed.
+
+        Returns:
+            The number of days since the first day.
+
+        Raises:
+            ValueError: If the date is not in the years of the index.
+        """
+        day = gregorian_date.toordinal() - self._first_day
+        if not 0 <= day < self._days + end:
+            msg = f'{gregorian_date} is not in the years {self._years} of the index'
+            raise ValueError(msg)
+
+        return day
+
+
+@cache
+def _issur_melacha_bits(code: int, *, diaspora: bool) -> int:
+    """Get the Issur Melacha days of a year type as bits.
+
+    Args:
+        code: The year type code.
+        diaspora: `True` if outside of Israel, `False` if in Israel.
+
+    Returns:
+        The bits, bit 0 is Rosh Hashana.
+    """
+    template = keviah(code)
+    events = template.events if diaspora else template.events_israel
+
+    bits = 0
+    for day_of_year, (shabbos, yomtov) in enumerate(events):
+        if Events.kind_of(shabbos, yomtov) & EventKind.ISSUR_MELACHA:
+            bits |= 1 << day_of_year
+
+    return bits
+
+
+def _bitmap_size(days: int) -> int:
+    return (days + 7) >> 3
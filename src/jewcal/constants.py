@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from enum import Enum, unique
+from enum import Enum, IntFlag, unique
 from typing import Final, NamedTuple
 
 
@@ -14,87 +14,122 @@ class Action(Enum):
     HAVDALAH = 'Havdalah'
 
 
+@unique
+class EventKind(IntFlag):
+    """The kind of the events of a day, combined as flags."""
+
+    SHABBOS = 1
+    EREV_SHABBOS = 2
+    YOMTOV = 4
+    EREV_YOMTOV = 8
+    CHOL_HAMOED = 16
+    CANDLES = 32
+    HAVDALAH = 64
+    ISSUR_MELACHA = 128
+
+
 class Event(NamedTuple):
     """Named tuple for shabbos and yom tov."""
 
     title: str
     action: str | None
+    kind: EventKind = EventKind(0)
 
 
 YOMTOV: Final[dict[int, dict[int, Event]]] = {
     6: {
-        29: Event('Erev Rosh Hashana', Action.CANDLES.value),
+        29: Event('Erev Rosh Hashana', Action.CANDLES.value, EventKind.EREV_YOMTOV),
     },
     7: {
-        1: Event('Rosh Hashana 1', Action.CANDLES.value),
-        2: Event('Rosh Hashana 2', Action.HAVDALAH.value),
-        9: Event('Erev Yom Kippur', Action.CANDLES.value),
-        10: Event('Yom Kippur', Action.HAVDALAH.value),
-        14: Event('Erev Sukkos', Action.CANDLES.value),
-        15: Event('Sukkos 1', Action.CANDLES.value),
-        16: Event('Sukkos 2', Action.HAVDALAH.value),
-        17: Event('Chol HaMoed 1 (Sukkos 3)', None),
-        18: Event('Chol HaMoed 2 (Sukkos 4)', None),
-        19: Event('Chol HaMoed 3 (Sukkos 5)', None),
-        20: Event('Chol HaMoed 4 (Sukkos 6)', None),
-        21: Event('Hoshana Rabba (Sukkos 7)', Action.CANDLES.value),
-        22: Event('Shmini Atzeres (Sukkos 8)', Action.CANDLES.value),
-        23: Event('Simchas Tora', Action.HAVDALAH.value),
+        1: Event('Rosh Hashana 1', Action.CANDLES.value, EventKind.YOMTOV),
+        2: Event('Rosh Hashana 2', Action.HAVDALAH.value, EventKind.YOMTOV),
+        9: Event('Erev Yom Kippur', Action.CANDLES.value, EventKind.EREV_YOMTOV),
+        10: Event('Yom Kippur', Action.HAVDALAH.value, EventKind.YOMTOV),
+        14: Event('Erev Sukkos', Action.CANDLES.value, EventKind.EREV_YOMTOV),
+        15: Event('Sukkos 1', Action.CANDLES.value, EventKind.YOMTOV),
+        16: Event('Sukkos 2', Action.HAVDALAH.value, EventKind.YOMTOV),
+        17: Event('Chol HaMoed 1 (Sukkos 3)', None, EventKind.CHOL_HAMOED),
+        18: Event('Chol HaMoed 2 (Sukkos 4)', None, EventKind.CHOL_HAMOED),
+        19: Event('Chol HaMoed 3 (Sukkos 5)', None, EventKind.CHOL_HAMOED),
+        20: Event('Chol HaMoed 4 (Sukkos 6)', None, EventKind.CHOL_HAMOED),
+        21: Event(
+            'Hoshana Rabba (Sukkos 7)',
+            Action.CANDLES.value,
+            EventKind.EREV_YOMTOV,
+        ),
+        22: Event('Shmini Atzeres (Sukkos 8)', Action.CANDLES.value, EventKind.YOMTOV),
+        23: Event('Simchas Tora', Action.HAVDALAH.value, EventKind.YOMTOV),
     },
     1: {
-        14: Event('Erev Pesach', Action.CANDLES.value),
-        15: Event('Pesach 1', Action.CANDLES.value),
-        16: Event('Pesach 2', Action.HAVDALAH.value),
-        17: Event('Chol HaMoed 1 (Pesach 3)', None),
-        18: Event('Chol HaMoed 2 (Pesach 4)', None),
-        19: Event('Chol HaMoed 3 (Pesach 5)', None),
-        20: Event('Chol HaMoed 4 (Pesach 6)', Action.CANDLES.value),
-        21: Event('Pesach 7', Action.CANDLES.value),
-        22: Event('Pesach 8', Action.HAVDALAH.value),
+        14: Event('Erev Pesach', Action.CANDLES.value, EventKind.EREV_YOMTOV),
+        15: Event('Pesach 1', Action.CANDLES.value, EventKind.YOMTOV),
+        16: Event('Pesach 2', Action.HAVDALAH.value, EventKind.YOMTOV),
+        17: Event('Chol HaMoed 1 (Pesach 3)', None, EventKind.CHOL_HAMOED),
+        18: Event('Chol HaMoed 2 (Pesach 4)', None, EventKind.CHOL_HAMOED),
+        19: Event('Chol HaMoed 3 (Pesach 5)', None, EventKind.CHOL_HAMOED),
+        20: Event(
+            'Chol HaMoed 4 (Pesach 6)',
+            Action.CANDLES.value,
+            EventKind.CHOL_HAMOED | EventKind.EREV_YOMTOV,
+        ),
+        21: Event('Pesach 7', Action.CANDLES.value, EventKind.YOMTOV),
+        22: Event('Pesach 8', Action.HAVDALAH.value, EventKind.YOMTOV),
     },
     3: {
-        5: Event('Erev Shavuos', Action.CANDLES.value),
-        6: Event('Shavuos 1', Action.CANDLES.value),
-        7: Event('Shavuos 2', Action.HAVDALAH.value),
+        5: Event('Erev Shavuos', Action.CANDLES.value, EventKind.EREV_YOMTOV),
+        6: Event('Shavuos 1', Action.CANDLES.value, EventKind.YOMTOV),
+        7: Event('Shavuos 2', Action.HAVDALAH.value, EventKind.YOMTOV),
     },
 }
 
 YOMTOV_ISRAEL: Final[dict[int, dict[int, Event]]] = {
     6: {
-        29: Event('Erev Rosh Hashana', Action.CANDLES.value),
+        29: Event('Erev Rosh Hashana', Action.CANDLES.value, EventKind.EREV_YOMTOV),
     },
     7: {
-        1: Event('Rosh Hashana 1', Action.CANDLES.value),
-        2: Event('Rosh Hashana 2', Action.HAVDALAH.value),
-        9: Event('Erev Yom Kippur', Action.CANDLES.value),
-        10: Event('Yom Kippur', Action.HAVDALAH.value),
-        14: Event('Erev Sukkot', Action.CANDLES.value),
-        15: Event('Sukkot 1', Action.HAVDALAH.value),
-        16: Event('Chol HaMoed 1 (Sukkot 2)', None),
-        17: Event('Chol HaMoed 2 (Sukkot 3)', None),
-        18: Event('Chol HaMoed 3 (Sukkot 4)', None),
-        19: Event('Chol HaMoed 4 (Sukkot 5)', None),
-        20: Event('Chol HaMoed 5 (Sukkot 6)', None),
-        21: Event('Hoshana Rabba (Sukkot 7)', Action.CANDLES.value),
-        22: Event('Shmini Atzeret / Simchat Tora', Action.HAVDALAH.value),
+        1: Event('Rosh Hashana 1', Action.CANDLES.value, EventKind.YOMTOV),
+        2: Event('Rosh Hashana 2', Action.HAVDALAH.value, EventKind.YOMTOV),
+        9: Event('Erev Yom Kippur', Action.CANDLES.value, EventKind.EREV_YOMTOV),
+        10: Event('Yom Kippur', Action.HAVDALAH.value, EventKind.YOMTOV),
+        14: Event('Erev Sukkot', Action.CANDLES.value, EventKind.EREV_YOMTOV),
+        15: Event('Sukkot 1', Action.HAVDALAH.value, EventKind.YOMTOV),
+        16: Event('Chol HaMoed 1 (Sukkot 2)', None, EventKind.CHOL_HAMOED),
+        17: Event('Chol HaMoed 2 (Sukkot 3)', None, EventKind.CHOL_HAMOED),
+        18: Event('Chol HaMoed 3 (Sukkot 4)', None, EventKind.CHOL_HAMOED),
+        19: Event('Chol HaMoed 4 (Sukkot 5)', None, EventKind.CHOL_HAMOED),
+        20: Event('Chol HaMoed 5 (Sukkot 6)', None, EventKind.CHOL_HAMOED),
+        21: Event(
+            'Hoshana Rabba (Sukkot 7)',
+            Action.CANDLES.value,
+            EventKind.EREV_YOMTOV,
+        ),
+        22: Event(
+            'Shmini Atzeret / Simchat Tora',
+            Action.HAVDALAH.value,
+            EventKind.YOMTOV,
+        ),
     },
     1: {
-        14: Event('Erev Pesach', Action.CANDLES.value),
-        15: Event('Pesach 1', Action.HAVDALAH.value),
-        16: Event('Chol HaMoed 1 (Pesach 2)', None),
-        17: Event('Chol HaMoed 2 (Pesach 3)', None),
-        18: Event('Chol HaMoed 3 (Pesach 4)', None),
-        19: Event('Chol HaMoed 4 (Pesach 5)', None),
-        20: Event('Chol HaMoed 5 (Pesach 6)', Action.CANDLES.value),
-        21: Event('Pesach 7', Action.HAVDALAH.value),
+        14: Event('Erev Pesach', Action.CANDLES.value, EventKind.EREV_YOMTOV),
+        15: Event('Pesach 1', Action.HAVDALAH.value, EventKind.YOMTOV),
+        16: Event('Chol HaMoed 1 (Pesach 2)', None, EventKind.CHOL_HAMOED),
+        17: Event('Chol HaMoed 2 (Pesach 3)', None, EventKind.CHOL_HAMOED),
+        18: Event('Chol HaMoed 3 (Pesach 4)', None, EventKind.CHOL_HAMOED),
+        19: Event('Chol HaMoed 4 (Pesach 5)', None, EventKind.CHOL_HAMOED),
+        20: Event(
+            'Chol HaMoed 5 (Pesach 6)',
+            Action.CANDLES.value,
+            EventKind.CHOL_HAMOED | EventKind.EREV_YOMTOV,
+        ),
+        21: Event('Pesach 7', Action.HAVDALAH.value, EventKind.YOMTOV),
     },
     3: {
-        5: Event('Erev Shavuot', Action.CANDLES.value),
-        6: Event('Shavuot', Action.HAVDALAH.value),
+        5: Event('Erev Shavuot', Action.CANDLES.value, EventKind.EREV_YOMTOV),
+        6: Event('Shavuot', Action.HAVDALAH.value, EventKind.YOMTOV),
     },
 }
 
 SHABBOS: Final[dict[int, Event]] = {
-    5: Event('Erev Shabbos', Action.CANDLES.value),
-    6: Event('Shabbos', Action.HAVDALAH.value),
+    5: Event('Erev Shabbos', Action.CANDLES.value, EventKind.EREV_SHABBOS),
+    6: Event('Shabbos', Action.HAVDALAH.value, EventKind.SHABBOS),
 }
@@ -92,7 +92,10 @@ False
      'tzeis_minutes': '2022-04-17T17:21:09.670131+00:00'}
 """
 
+from __future__ import annotations
+
 from datetime import date, timedelta
+from typing import TYPE_CHECKING
 from warnings import warn
 
 from .constants import Action
@@ -103,58 +106,156 @@ from .utils.calculations import (
     absdate_to_jewish,
     gregorian_to_absdate,
     is_jewish_leap,
+    jewish_year,
+    keviah,
     weekday_from_absdate,
+    year_type,
 )
 from .utils.datetime import date_today
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator  # pragma: no cover
+
 # pylint: disable=protected-access
 
 
 class JewCal:
     """Convert Gregorian to Jewish dates with holidays and zmanim (Diaspora/Israel)."""
 
+    __slots__ = (
+        '_diaspora',
+        '_events',
+        '_gregorian',
+        '_jewish_date',
+        '_location',
+        '_zmanim',
+    )
+
     def __init__(
         self,
         gregorian_date: date | None = None,
         location: Location | None = None,
         *,
         diaspora: bool = True,
+        lazy: bool = False,
     ) -> None:
         """Create a new Jewish date with holidays and zmanim for Diaspora or Israel.
 
         - Zmanim are available only if :py:class:`Location` is set.
         - If the Gregorian date is today, check if `datetime.now` is after nightfall.
         - If it is after nightfall, the next day for :py:attr:`jewish_date` is set.
+        - If lazy, the Jewish date, events and zmanim are calculated when they are
+          first accessed.
 
         Args:
             gregorian_date: The Gregorian date to convert from, default is today.
             diaspora: `True` if outside of Israel, `False` if in Israel.
             location: The location to calculate the Zmanim for.
+            lazy: `True` to calculate on first access, `False` to calculate now.
         """
         self._diaspora: bool = diaspora
+        self._location: Location | None = location
+        self._gregorian: date = gregorian_date if gregorian_date else date_today()
+
+        self._jewish_date: JewishDate | None = None
+        self._events: Events | None = None
+        self._zmanim: Zmanim | None = None
+
+        if not lazy:
+            self._convert()
+            if self._events is None:
+                self._set_events()
+            self._set_zmanim()
+
+    @staticmethod
+    def range(
+        start: date,
+        end: date,
+        *,
+        diaspora: bool = True,
+        location: Location | None = None,
+        step: int = 1,
+    ) -> Iterator[JewCal]:
+        """Iterate over the dates from start up to, but not including, end.
 
-        gregorian = gregorian_date if gregorian_date else date_today()
+        Only the first date is converted, the next dates are stepped through the
+        months and years of the Jewish calendar. The dates are created one at a time,
+        so the memory use does not grow with the span.
 
-        self._zmanim = None
-        if location:
-            self._zmanim = Zmanim(gregorian, location, set_hadlokas_haneiros=True)
+        Args:
+            start: The first Gregorian date.
+            end: The Gregorian date to stop before.
+            diaspora: `True` if outside of Israel, `False` if in Israel.
+            location: The location to calculate the Zmanim for.
+            step: The number of days between the dates.
 
-            if gregorian == date_today() and self._zmanim.is_now_after_nightfall(
-                use_tzeis_hakochavim=location.use_tzeis_hakochavim,
-            ):
-                gregorian += timedelta(days=1)
-                self._zmanim = Zmanim(gregorian, location, set_hadlokas_haneiros=True)
+        Yields:
+            The same as ``JewCal(gregorian_date, location, diaspora=diaspora)`` for
+            every date.
 
-        absdate = gregorian_to_absdate(gregorian.year, gregorian.month, gregorian.day)
-        year, month, day = absdate_to_jewish(absdate)
-        is_leap = is_jewish_leap(year)
-        self._jewish_date = JewishDate(year, month, day, gregorian, is_leap)
+        Raises:
+            ValueError: If step is not positive.
+        """
+        if step < 1:
+            msg = 'step must be positive'
+            raise ValueError(msg)
+
+        today = date_today()
+
+        for jewish_date, weekday in _jewish_dates(start, end, step):
+            # after nightfall today is the next Jewish date
+            if location and jewish_date.gregorian_date == today:
+                yield JewCal(today, location, diaspora=diaspora)
+            else:
+                events = Events.get(
+                    weekday,
+                    jewish_date.month,
+                    jewish_date.day,
+                    diaspora=diaspora,
+                )
+                yield JewCal._from_parts(
+                    jewish_date,
+                    events,
+                    location,
+                    diaspora=diaspora,
+                )
+
+    @classmethod
+    def _from_parts(
+        cls: type[JewCal],
+        jewish_date: JewishDate,
+        events: Events,
+        location: Location | None,
+        *,
+        diaspora: bool,
+    ) -> JewCal:
+        """Create a new Jewish date from its converted parts.
+
+        Args:
+            jewish_date: The Jewish date.
+            events: The events of the Jewish date.
+            location: The location to calculate the Zmanim for.
+            diaspora: `True` if outside of Israel, `False` if in Israel.
 
-        weekday: int = weekday_from_absdate(absdate)
-        self._events = Events(weekday, month, day, diaspora)
+        Returns:
+            The Jewish date with holidays and zmanim.
+        """
+        jewcal = cls.__new__(cls)
+        jewcal._diaspora = diaspora
+        jewcal._location = location
+        jewcal._gregorian = jewish_date.gregorian_date
+        jewcal._jewish_date = jewish_date
+        jewcal._events = events
+
+        jewcal._zmanim = None
+        if location:
+            jewcal._zmanim = Zmanim(
+                jewish_date.gregorian_date,
+                location,
+                set_hadlokas_haneiros=events.action == Action.CANDLES.value,
+            )
 
-        if self._zmanim is not None and self._events.action != Action.CANDLES.value:
-            self._zmanim.hadlokas_haneiros = None
+        return jewcal
 
     @property
     def diaspora(self) -> bool:
@@ -172,6 +273,8 @@ class JewCal:
         Returns:
             The Jewish date.
         """
+        if self._jewish_date is None:
+            return self._convert()
         return self._jewish_date
 
     @property
@@ -181,6 +284,8 @@ class JewCal:
         Returns:
             The events.
         """
+        if self._events is None:
+            return self._set_events()
         return self._events
 
     @property
@@ -192,6 +297,72 @@ class JewCal:
         Returns:
             The Zmanim.
         """
+        if self._zmanim is None:
+            return self._set_zmanim()
+        return self._zmanim
+
+    def _convert(self) -> JewishDate:
+        """Convert the Gregorian date to the Jewish date.
+
+        After nightfall today is the next Jewish date, so today with a location needs
+        the zmanim, which are kept.
+
+        Returns:
+            The Jewish date.
+        """
+        gregorian = self._gregorian
+        location = self._location
+
+        zmanim = None
+        if location and gregorian == date_today():
+            zmanim = Zmanim(gregorian, location, set_hadlokas_haneiros=True)
+            if zmanim.is_now_after_nightfall(
+                use_tzeis_hakochavim=location.use_tzeis_hakochavim,
+            ):
+                gregorian += timedelta(days=1)
+                zmanim = Zmanim(gregorian, location, set_hadlokas_haneiros=True)
+
+        absdate = gregorian_to_absdate(gregorian.year, gregorian.month, gregorian.day)
+        year, month, day = absdate_to_jewish(absdate)
+        is_leap = is_jewish_leap(year)
+        self._jewish_date = JewishDate(year, month, day, gregorian, is_leap)
+
+        if zmanim is not None:
+            if self.events.action != Action.CANDLES.value:
+                zmanim.hadlokas_haneiros = None
+            self._zmanim = zmanim
+
+        return self._jewish_date
+
+    def _set_events(self) -> Events:
+        """Set the events of the Jewish date.
+
+        Returns:
+            The events.
+        """
+        jewish_date = self.jewish_date
+        weekday: int = weekday_from_absdate(jewish_date.gregorian_date.toordinal())
+        self._events = Events.get(
+            weekday,
+            jewish_date.month,
+            jewish_date.day,
+            diaspora=self._diaspora,
+        )
+        return self._events
+
+    def _set_zmanim(self) -> Zmanim | None:
+        """Set the zmanim of the Jewish date, without candle lighting if no candles.
+
+        Returns:
+            The Zmanim, `None` without a location.
+        """
+        jewish_date = self.jewish_date
+        if self._zmanim is None and self._location:
+            self._zmanim = Zmanim(
+                jewish_date.gregorian_date,
+                self._location,
+                set_hadlokas_haneiros=self.events.action == Action.CANDLES.value,
+            )
         return self._zmanim
 
     def __str__(self) -> str:
@@ -200,8 +371,8 @@ class JewCal:
         Returns:
             The Jewish date and events.
         """
-        date_str = self._jewish_date.__str__()
-        events_str = self._events.__str__()
+        date_str = self.jewish_date.__str__()
+        events_str = self.events.__str__()
 
         if events_str:
             return f'{date_str}: {events_str}'
@@ -216,10 +387,10 @@ class JewCal:
         """
         return (
             f'{self.__class__.__name__}('
-            f'jewish_date={self._jewish_date!r},'
-            f' events={self._events!r},'
+            f'jewish_date={self.jewish_date!r},'
+            f' events={self.events!r},'
             f' diaspora={self._diaspora},'
-            f' zmanim={self._zmanim!r}'
+            f' zmanim={self.zmanim!r}'
             ')'
         )
 
@@ -233,7 +404,7 @@ class JewCal:
             The year in the Jewish calendar.
         """
         warn('year is deprecated, use jewish_date.year', stacklevel=2)
-        year: int = self._jewish_date.year
+        year: int = self.jewish_date.year
         return year
 
     @property
@@ -246,7 +417,7 @@ class JewCal:
             The month in the Jewish year.
         """
         warn('month is deprecated, use jewish_date.month', stacklevel=2)
-        month: int = self._jewish_date.month
+        month: int = self.jewish_date.month
         return month
 
     @property
@@ -259,7 +430,7 @@ class JewCal:
             The day in the Jewish month.
         """
         warn('day is deprecated, use jewish_date.day', stacklevel=2)
-        day: int = self._jewish_date.day
+        day: int = self.jewish_date.day
         return day
 
     @property
@@ -275,7 +446,7 @@ class JewCal:
             'gregorian_date is deprecated, use jewish_date.gregorian_date',
             stacklevel=2,
         )
-        gregorian_date: date = self._jewish_date.gregorian_date
+        gregorian_date: date = self.jewish_date.gregorian_date
         return gregorian_date
 
     @property
@@ -288,7 +459,7 @@ class JewCal:
             The (Erev) Shabbos definition.
         """
         warn('shabbos is deprecated, use events.shabbos', stacklevel=2)
-        return self._events.shabbos
+        return self.events.shabbos
 
     @property
     def yomtov(self) -> str | None:
@@ -300,7 +471,7 @@ class JewCal:
             The (Erev) Yom Tov definition.
         """
         warn('yomtov is deprecated, use events.yomtov', stacklevel=2)
-        return self._events.yomtov
+        return self.events.yomtov
 
     @property
     def category(self) -> str | None:
@@ -312,7 +483,7 @@ class JewCal:
             The category (`Candles` or `Havdalah`).
         """
         warn('category is deprecated, use events.action', stacklevel=2)
-        return self._events.action
+        return self.events.action
 
     def has_events(self) -> bool:
         """Are there any events [(Erev) Shabbos or (Erev) Yom Tov].
@@ -320,7 +491,7 @@ class JewCal:
         Returns:
             `True` if there are any events, `False` otherwise.
         """
-        return self._events._has_events()
+        return self.events._has_events()
 
     def is_erev_shabbos(self) -> bool:
         """Is it Erev Shabbos.
@@ -328,7 +499,7 @@ class JewCal:
         Returns:
             `True` if it is Erev Shabbos, `False` otherwise.
         """
-        return self._events._is_erev_shabbos()
+        return self.events._is_erev_shabbos()
 
     def is_shabbos(self) -> bool:
         """Is it Shabbos.
@@ -336,7 +507,7 @@ class JewCal:
         Returns:
             `True` if it is Shabbos, `False` otherwise.
         """
-        return self._events._is_shabbos()
+        return self.events._is_shabbos()
 
     def is_erev_yomtov(self) -> bool:
         """Is it Erev Yom Tov.
@@ -344,7 +515,7 @@ class JewCal:
         Returns:
             `True` if it is Erev Yom Tov, `False` otherwise.
         """
-        return self._events._is_erev_yomtov()
+        return self.events._is_erev_yomtov()
 
     def is_yomtov(self) -> bool:
         """Is it Yom Tov.
@@ -354,7 +525,7 @@ class JewCal:
         Returns:
             `True` if it is Yom Tov, `False` otherwise.
         """
-        return self._events._is_yomtov()
+        return self.events._is_yomtov()
 
     def is_erev(self) -> bool:
         """Is it Erev Shabbos and/or Erev Yom Tov.
@@ -368,7 +539,7 @@ class JewCal:
         Returns:
             `True` if it is Erev Shabbos and/or Erev Yom Tov, `False` otherwise.
         """
-        return self._events._is_erev()
+        return self.events._is_erev()
 
     def is_issur_melacha(self) -> bool:
         """Is it Issur Melacha.
@@ -376,4 +547,41 @@ class JewCal:
         Returns:
             `True` if it is Issur Melacha, `False` otherwise.
         """
-        return self._events._is_issur_melacha()
+        return self.events._is_issur_melacha()
+
+
+def _jewish_dates(
+    start: date,
+    end: date,
+    step: int,
+) -> Iterator[tuple[JewishDate, int]]:
+    """Step through the Jewish dates from start up to, but not including, end.
+
+    Args:
+        start: The first Gregorian date.
+        end: The Gregorian date to stop before.
+        step: The number of days between the dates.
+
+    Yields:
+        The Jewish date and its weekday number.
+    """
+    absdate = gregorian_to_absdate(start.year, start.month, start.day)
+    year, _, _ = absdate_to_jewish(absdate)
+    structure = jewish_year(year)
+    template = keviah(year_type(year))
+    day_of_year = absdate - structure.first_day
+
+    for ordinal in range(absdate, end.toordinal(), step):
+        while day_of_year >= structure.days:
+            day_of_year -= structure.days
+            year += 1
+            structure = jewish_year(year)
+            template = keviah(year_type(year))
+
+        month, day = template.dates[day_of_year]
+        yield (
+            JewishDate(year, month, day, date.fromordinal(ordinal), structure.is_leap),
+            template.weekdays[day_of_year],
+        )
+
+        day_of_year += step
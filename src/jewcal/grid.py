@@ -0,0 +1,370 @@
+"""Precomputed sun events of the locations on a grid, read from a memory map.
+
+The coordinates are snapped to a grid, by default of 0.01 degrees (about 1 km). The
+sunrise, sunset and Tzeis Hakochavim of a span of dates are precomputed for the
+corners of the cells of the locations, and written to a binary file. The file is
+read through a memory map, the sun events of a location are interpolated between
+the corners of its cell. A location in a cell without precomputed corners is off
+the grid.
+
+>>> from datetime import date
+>>> from io import BytesIO
+
+>>> from jewcal.grid import ZmanimGrid, precompute
+
+>>> output = BytesIO()
+>>> nodes = precompute(output, [(51.22047, 4.40026)], date(2024, 1, 1), 366)
+>>> grid = ZmanimGrid(output.getvalue())
+>>> sunrise, sunset, tzeis_hakochavim = grid.sun_events(
+...     date(2024, 5, 31),
+...     51.22047,
+...     4.40026,
+... )
+>>> print(sunset)
+2024-05-31 19:47:48.503000+00:00
+
+:py:class:`jewcal.models.zmanim.Zmanim` reads the sun events of the grid of a
+location, and calculates them off the grid:
+
+>>> from jewcal.models.zmanim import Location, Zmanim
+
+>>> antwerp = Location(51.22047, 4.40026, lookup=grid)
+>>> print(Zmanim(date(2024, 5, 31), antwerp).sunset)
+2024-05-31 19:47:48.503000+00:00
+
+This script can be invoked from the command line:
+    `python -m jewcal.grid locations.csv --from 2025-01-01 --to 2026-01-01`
+"""
+
+from __future__ import annotations
+
+import mmap
+import sys
+from argparse import ArgumentParser
+from datetime import date, datetime, timezone
+from math import floor
+from pathlib import Path
+from struct import Struct
+from typing import TYPE_CHECKING, BinaryIO, Final
+
+from .helpers.sun import EPOCH_ORDINAL, SolarSpan, SunEvent
+from .models.zmanim import TZEIS_HAKOCHAVIM
+from .zmanim_batch import add_date_range, read_locations
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence  # pragma: no cover
+
+MAGIC: Final = b'JCZG'
+VERSION: Final = 1
+
+# magic, version, step, first date, days, nodes
+HEADER: Final = Struct('<4sBdiII')
+
+# latitude index, longitude index
+NODE: Final = Struct('<ii')
+
+# sunrise, sunset, Tzeis Hakochavim in milliseconds since midnight UTC of the date
+EVENTS: Final = Struct('<3i')
+
+# The sun does not reach the elevation of the event
+MISSING: Final = -(2**31)
+
+DEFAULT_STEP: Final = 0.01
+
+# Corners further apart are events of different dates, e.g. a sunset around midnight
+MAX_SPREAD: Final = 3_600_000
+
+
+def nodes(
+    coordinates: Iterable[tuple[float, float]],
+    step: float,
+) -> list[tuple[int, int]]:
+    """Get the corners of the cells of the coordinates.
+
+    Args:
+        coordinates: The latitudes and longitudes in decimal degrees.
+        step: The size of a cell in degrees.
+
+    Returns:
+        The grid indices of the corners, sorted.
+    """
+    corners: set[tuple[int, int]] = set()
+    for latitude, longitude in coordinates:
+        row, column = floor(latitude / step), floor(longitude / step)
+        corners.update(
+            (row + north, column + east) for north in (0, 1) for east in (0, 1)
+        )
+
+    return sorted(corners)
+
+
+def precompute(
+    output: BinaryIO,
+    coordinates: Iterable[tuple[float, float]],
+    start: date,
+    days: int,
+    step: float = DEFAULT_STEP,
+) -> int:
+    """Precompute the sun events of the cells of the coordinates.
+
+    Args:
+        output: The binary file.
+        coordinates: The latitudes and longitudes in decimal degrees.
+        start: The first date.
+        days: The number of dates.
+        step: The size of a cell in degrees.
+
+    Returns:
+        The number of corners.
+
+    Raises:
+        ValueError: If the step is not positive or the days are negative.
+    """
+    if step <= 0 or days < 0:
+        msg = 'step must be positive and days must not be negative'
+        raise ValueError(msg)
+
+    corners = nodes(coordinates, step)
+
+    output.write(
+        HEADER.pack(MAGIC, VERSION, step, start.toordinal(), days, len(corners)),
+    )
+    output.writelines(NODE.pack(*corner) for corner in corners)
+
+    midnight = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
+    for row, column in corners:
+        span = SolarSpan(start, days, row * step, column * step)
+        columns = (
+            span.sunrise(),
+            span.sunset(),
+            span.at_elevation(TZEIS_HAKOCHAVIM, SunEvent.SET),
+        )
+        output.writelines(
+            EVENTS.pack(*(_milliseconds(time, midnight, day) for time in events))
+            for day, events in enumerate(zip(*columns, strict=True))
+        )
+
+    return len(corners)
+
+
+class ZmanimGrid:
+    """The precomputed sun events of a file written by :py:func:`precompute`."""
+
+    __slots__ = ('_data', '_days', '_first_day', '_nodes', '_step')
+
+    def __init__(self, data: str | Path | bytes) -> None:
+        """Read the grid of a file through a memory map, or of bytes.
+
+        Args:
+            data: The path of the file, or its contents.
+
+        Raises:
+            ValueError: If the data is not a grid.
+        """
+        if isinstance(data, bytes):
+            self._data: bytes | mmap.mmap = data
+        else:
+            with Path(data).open('rb') as file:
+                self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._data) < HEADER.size:
+            self.close()
+            msg = 'data is too short for a zmanim grid'
+            raise ValueError(msg)
+
+        magic, version, step, first_day, days, count = HEADER.unpack_from(self._data)
+        size = HEADER.size + count * (NODE.size + days * EVENTS.size)
+        if magic != MAGIC or version != VERSION or len(self._data) != size:
+            self.close()
+            msg = 'data is not a zmanim grid of this version'
+            raise ValueError(msg)
+
+        self._step: float = step
+        self._first_day: int = first_day
+        self._days: int = days
+        self._nodes = {
+            NODE.unpack_from(self._data, HEADER.size + index * NODE.size): index
+            for index in range(count)
+        }
+
+    @property
+    def step(self) -> float:
+        """Get the size of a cell.
+
+        Returns:
+            The size in degrees.
+        """
+        return self._step
+
+    @property
+    def start(self) -> date:
+        """Get the first date.
+
+        Returns:
+            The first date.
+        """
+        return date.fromordinal(self._first_day)
+
+    @property
+    def days(self) -> int:
+        """Get the number of dates.
+
+        Returns:
+            The number of dates.
+        """
+        return self._days
+
+    def close(self) -> None:
+        """Close the memory map of the file."""
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+
+    def sun_events(
+        self,
+        gregorian_date: date,
+        latitude: float,
+        longitude: float,
+    ) -> tuple[datetime, datetime, datetime] | None:
+        """Get the sun events of a date and coordinates.
+
+        The events are interpolated bilinearly between the corners of the cell.
+
+        Args:
+            gregorian_date: The date.
+            latitude: The latitude in decimal degrees.
+            longitude: The longitude in decimal degrees.
+
+        Returns:
+            The sunrise, sunset and Tzeis Hakochavim in UTC, `None` if the date or
+            the cell is not in the grid, or if the sun does not reach an event at a
+            corner.
+        """
+        day = gregorian_date.toordinal() - self._first_day
+        if not 0 <= day < self._days:
+            return None
+
+        corners = self._corners(day, latitude / self._step, longitude / self._step)
+        if corners is None:
+            return None
+
+        totals = _interpolate(corners)
+        if totals is None:
+            return None
+
+        midnight = (gregorian_date.toordinal() - EPOCH_ORDINAL) * 86_400
+        sunrise, sunset, tzeis_hakochavim = (
+            datetime.fromtimestamp(
+                midnight + round(milliseconds) / 1000,
+                timezone.utc,
+            )
+            for milliseconds in totals
+        )
+
+        return sunrise, sunset, tzeis_hakochavim
+
+    def _corners(
+        self,
+        day: int,
+        row_fraction: float,
+        column_fraction: float,
+    ) -> list[tuple[float, tuple[int, int, int]]] | None:
+        """Get the weights and the events of the corners of a cell.
+
+        Args:
+            day: The index of the date.
+            row_fraction: The latitude in cells.
+            column_fraction: The longitude in cells.
+
+        Returns:
+            The weight and the events in milliseconds per corner, `None` if a
+            corner is not in the grid.
+        """
+        row, column = floor(row_fraction), floor(column_fraction)
+        north, east = row_fraction - row, column_fraction - column
+
+        corners: list[tuple[float, tuple[int, int, int]]] = []
+        for corner, weight in (
+            ((row, column), (1 - north) * (1 - east)),
+            ((row, column + 1), (1 - north) * east),
+            ((row + 1, column), north * (1 - east)),
+            ((row + 1, column + 1), north * east),
+        ):
+            index = self._nodes.get(corner)
+            if index is None:
+                return None
+
+            offset = (
+                HEADER.size
+                + len(self._nodes) * NODE.size
+                + (index * self._days + day) * EVENTS.size
+            )
+            corners.append((weight, EVENTS.unpack_from(self._data, offset)))
+
+        return corners
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Precompute the sun events of the locations of a CSV file.
+
+    Args:
+        argv: The command line arguments, default is `sys.argv`.
+
+    Returns:
+        The exit code.
+    """
+    parser = ArgumentParser(prog='python -m jewcal.grid', description=__doc__)
+    parser.add_argument(
+        'locations',
+        help='the CSV file of the locations, see jewcal.zmanim_batch',
+    )
+    add_date_range(parser, '2025-01-01')
+    parser.add_argument(
+        '--step',
+        type=float,
+        default=DEFAULT_STEP,
+        help='the size of a cell in degrees',
+    )
+    parser.add_argument('--output', default='zmanim.grid', help='the binary file')
+    args = parser.parse_args(argv)
+
+    with Path(args.locations).open(newline='', encoding='utf-8') as file:
+        coordinates = [
+            (named.location.latitude, named.location.longitude)
+            for named in read_locations(file)
+        ]
+
+    with Path(args.output).open('wb') as output:
+        count = precompute(
+            output,
+            coordinates,
+            args.start,
+            (args.end - args.start).days,
+            args.step,
+        )
+
+    sys.stdout.write(f'{count} corners written to {args.output}\n')
+    return 0
+
+
+def _interpolate(
+    corners: list[tuple[float, tuple[int, int, int]]],
+) -> list[float] | None:
+    totals = []
+    for event in range(3):
+        times = [events[event] for _, events in corners]
+        if MISSING in times or max(times) - min(times) > MAX_SPREAD:
+            return None
+        totals.append(sum(weight * events[event] for weight, events in corners))
+
+    return totals
+
+
+def _milliseconds(time: datetime | None, midnight: datetime, day: int) -> int:
+    if time is None:
+        return MISSING
+
+    return round((time - midnight).total_seconds() * 1000) - day * 86_400_000
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
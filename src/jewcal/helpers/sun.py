@@ -1,11 +1,31 @@
-"""Get sunrise, sunset using `Astral` library."""
+"""Get sunrise, sunset using `Astral` library.
+
+The sun events of a day are calculated with :py:class:`SolarDay`, the NOAA algorithm
+of `Astral` with a shared position of the sun at the start of the day. The times are
+equal to the times of `Astral`.
+"""
+
+from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import date, datetime
+from datetime import date, datetime, timedelta, timezone
 from enum import Enum, unique
+from functools import cache
+from math import acos, asin, cos, degrees, radians, sin, sqrt, tan
+from typing import Final, NamedTuple
+
+from astral import refraction_at_zenith
+from astral.julian import julianday, julianday_to_juliancentury
+from astral.sun import SUN_APPARENT_RADIUS, minutes_to_timedelta
+
+# The sun is at the horizon
+HORIZON_ZENITH: Final[float] = 90.0 + SUN_APPARENT_RADIUS
 
-from astral import LocationInfo, Observer, SunDirection
-from astral.sun import sun, time_at_elevation
+# Astral limits the latitude to avoid the poles
+MAX_LATITUDE: Final[float] = 89.8
+
+# Gregorian ordinal of the Unix epoch
+EPOCH_ORDINAL: Final[int] = date(1970, 1, 1).toordinal()
 
 
 @unique
@@ -16,6 +36,386 @@ class SunEvent(Enum):
     SET = 'sunset'
 
 
+class _Position(NamedTuple):
+    """The position of the sun for the hour angle."""
+
+    sin_declination: float
+    """The sine of the declination."""
+
+    cos_declination: float
+    """The cosine of the declination."""
+
+    eq_of_time: float
+    """The equation of time in minutes."""
+
+
+class _Curve(NamedTuple):
+    """The position of the sun during a date, quadratic between the midnights."""
+
+    position: _Position
+    """The position at the start of the date."""
+
+    sin_linear: float
+    """The linear term of the sine of the declination."""
+
+    sin_quadratic: float
+    """The quadratic term of the sine of the declination."""
+
+    eq_linear: float
+    """The linear term of the equation of time."""
+
+    eq_quadratic: float
+    """The quadratic term of the equation of time."""
+
+    @classmethod
+    def between(
+        cls,
+        previous: _Position,
+        current: _Position,
+        following: _Position,
+    ) -> _Curve:
+        """Get the curve through the positions at three midnights.
+
+        The error of the interpolation is far below the error of the algorithm.
+
+        Args:
+            previous: The position at the midnight before the date.
+            current: The position at the start of the date.
+            following: The position at the midnight after the date.
+
+        Returns:
+            The curve.
+        """
+        return cls(
+            current,
+            (following.sin_declination - previous.sin_declination) / 2.0,
+            (
+                following.sin_declination
+                - 2.0 * current.sin_declination
+                + previous.sin_declination
+            )
+            / 2.0,
+            (following.eq_of_time - previous.eq_of_time) / 2.0,
+            (following.eq_of_time - 2.0 * current.eq_of_time + previous.eq_of_time)
+            / 2.0,
+        )
+
+    def at(self, fraction: float) -> _Position:
+        """Get the position of the sun at a time.
+
+        Args:
+            fraction: The fraction of the date since its start, can be negative or
+                more than 1 for a time on the previous or next date.
+
+        Returns:
+            The position of the sun.
+        """
+        sin_declination = self.position.sin_declination + fraction * (
+            self.sin_linear + fraction * self.sin_quadratic
+        )
+        eq_of_time = self.position.eq_of_time + fraction * (
+            self.eq_linear + fraction * self.eq_quadratic
+        )
+
+        return _Position(
+            sin_declination,
+            sqrt(1.0 - sin_declination * sin_declination),
+            eq_of_time,
+        )
+
+
+class _Observer(NamedTuple):
+    """The geographic location for the hour angle."""
+
+    sin_latitude: float
+    """The sine of the latitude."""
+
+    cos_latitude: float
+    """The cosine of the latitude."""
+
+    longitude: float
+    """The longitude in decimal degrees."""
+
+    @classmethod
+    def at(cls, latitude: float, longitude: float) -> _Observer:
+        """Get the observer at a geographic location.
+
+        Args:
+            latitude: The latitude in decimal degrees, limited to avoid the poles.
+            longitude: The longitude in decimal degrees.
+
+        Returns:
+            The observer.
+        """
+        latitude_rad = radians(max(-MAX_LATITUDE, min(latitude, MAX_LATITUDE)))
+        return cls(sin(latitude_rad), cos(latitude_rad), longitude)
+
+
+class SolarDay:
+    """The sun events of a geographic location on a certain date.
+
+    The position of the sun at the start of the day is the first approximation of
+    every sun event, it is calculated once for all events of the day.
+    """
+
+    __slots__ = ('_date', '_latitude', '_observer', '_position')
+
+    def __init__(self, gregorian_date: date, latitude: float, longitude: float) -> None:
+        """Create the sun events of a day.
+
+        Args:
+            gregorian_date: The date to use for the sun events.
+            latitude: The latitude in decimal degrees.
+            longitude: The longitude in decimal degrees.
+        """
+        self._date = gregorian_date
+        self._latitude = latitude
+        self._observer = _Observer.at(latitude, longitude)
+        self._position = _position(
+            julianday_to_juliancentury(julianday(gregorian_date)),
+        )
+
+    @property
+    def date(self) -> date:
+        """Get the date of the sun events.
+
+        Returns:
+            The date.
+        """
+        return self._date
+
+    def sunrise(self) -> datetime:
+        """Get the time for sunrise.
+
+        Returns:
+            The time in UTC.
+        """
+        return self._on_date(HORIZON_ZENITH, SunEvent.RISE)
+
+    def sunset(self) -> datetime:
+        """Get the time for sunset.
+
+        Returns:
+            The time in UTC.
+        """
+        return self._on_date(HORIZON_ZENITH, SunEvent.SET)
+
+    def at_elevation(self, elevation: float, sun_event: SunEvent) -> datetime:
+        """Get the time for the sun at a certain degrees above / below horizon.
+
+        Args:
+            elevation: The degrees above (positive) / below (negative) horizon.
+            sun_event: The sun event (sunrise or sunset).
+
+        Returns:
+            The time in UTC.
+
+        Raises:
+            ValueError: If the sun never reaches the elevation on this day.
+        """
+        if elevation > 90.0:  # noqa: PLR2004
+            elevation = 180.0 - elevation
+            sun_event = SunEvent.SET
+
+        try:
+            return self.transit(90 - elevation, sun_event)
+        except ValueError as exc:
+            msg = f'Sun never reaches an elevation of {elevation} degrees'
+            raise ValueError(msg) from exc
+
+    def transit(self, zenith: float, sun_event: SunEvent) -> datetime:
+        """Get the time for the sun at a zenith angle, with refraction.
+
+        Args:
+            zenith: The zenith angle of the sun in degrees.
+            sun_event: The sun event (sunrise or sunset).
+
+        Returns:
+            The time in UTC.
+        """
+        cos_zenith = _cos_refracted_zenith(zenith)
+        date_ = self._date
+
+        # first approximation at the start of the day, second at the first
+        position = self._position
+        jd = julianday(date_)
+        time_utc = _time_utc(self._observer, position, cos_zenith, sun_event)
+        position = _position(julianday_to_juliancentury(jd + time_utc / 1440.0))
+        time_utc = _time_utc(self._observer, position, cos_zenith, sun_event)
+
+        midnight = datetime(date_.year, date_.month, date_.day, tzinfo=timezone.utc)
+        return midnight + minutes_to_timedelta(time_utc)
+
+    def _on_date(self, zenith: float, sun_event: SunEvent) -> datetime:
+        """Get the time for the sun at a zenith angle on the date of the day.
+
+        Args:
+            zenith: The zenith angle of the sun in degrees.
+            sun_event: The sun event (sunrise or sunset).
+
+        Returns:
+            The time in UTC.
+
+        Raises:
+            ValueError: If the sun does not reach the zenith on the date.
+        """
+        try:
+            time = self.transit(zenith, sun_event)
+            if time.date() != self._date:
+                # the event of the next or previous day can be on the date
+                days = 1 if time.date() < self._date else -1
+                other = SolarDay(
+                    self._date + timedelta(days=days),
+                    self._latitude,
+                    self._observer.longitude,
+                )
+                time = other.transit(zenith, sun_event)
+        except ValueError as exc:
+            msg = f'Sun does not reach the horizon for {sun_event.value}'
+            raise ValueError(msg) from exc
+
+        if time.date() != self._date:
+            msg = f'Unable to find a {sun_event.value} time on the date specified'
+            raise ValueError(msg)
+
+        return time
+
+
+class SolarSpan:
+    """The sun events of a geographic location on consecutive dates.
+
+    The position of the sun is calculated once per date at midnight UTC, it is the
+    first approximation of every sun event of the date as :py:class:`SolarDay`. The
+    second approximation interpolates the positions at the midnights before and
+    after, so an event needs no position of its own. The times are within a tenth
+    of a second of :py:class:`SolarDay`.
+    """
+
+    __slots__ = ('_curves', '_days', '_observer', '_start')
+
+    def __init__(
+        self,
+        start: date,
+        days: int,
+        latitude: float,
+        longitude: float,
+    ) -> None:
+        """Create the sun events of the dates.
+
+        Args:
+            start: The first date.
+            days: The number of dates.
+            latitude: The latitude in decimal degrees.
+            longitude: The longitude in decimal degrees.
+        """
+        self._start = start
+        self._days = days
+        self._observer = _Observer.at(latitude, longitude)
+
+        # the midnights of the dates, and of the dates next to them for a sunrise or
+        # sunset on the previous or next date
+        jd = julianday(start)
+        positions = [
+            _position(julianday_to_juliancentury(jd + day))
+            for day in range(-2, days + 2)
+        ]
+        self._curves = [
+            _Curve.between(*positions[day : day + 3]) for day in range(days + 2)
+        ]
+
+    def sunrise(self) -> list[datetime | None]:
+        """Get the times for sunrise, on the dates as :py:meth:`SolarDay.sunrise`.
+
+        Returns:
+            The times in UTC, `None` if there is no sunrise on the date.
+        """
+        return self.transits(HORIZON_ZENITH, SunEvent.RISE, on_date=True)
+
+    def sunset(self) -> list[datetime | None]:
+        """Get the times for sunset, on the dates as :py:meth:`SolarDay.sunset`.
+
+        Returns:
+            The times in UTC, `None` if there is no sunset on the date.
+        """
+        return self.transits(HORIZON_ZENITH, SunEvent.SET, on_date=True)
+
+    def at_elevation(
+        self,
+        elevation: float,
+        sun_event: SunEvent,
+    ) -> list[datetime | None]:
+        """Get the times for the sun at a certain degrees above / below horizon.
+
+        Args:
+            elevation: The degrees above (positive) / below (negative) horizon.
+            sun_event: The sun event (sunrise or sunset).
+
+        Returns:
+            The times in UTC, `None` if the sun does not reach the elevation.
+        """
+        return self.transits(90 - elevation, sun_event)
+
+    def transits(
+        self,
+        zenith: float,
+        sun_event: SunEvent,
+        *,
+        on_date: bool = False,
+    ) -> list[datetime | None]:
+        """Get the times for the sun at a zenith angle, with refraction.
+
+        Args:
+            zenith: The zenith angle of the sun in degrees.
+            sun_event: The sun event (sunrise or sunset).
+            on_date: `True` to search the time on the date as sunrise and sunset,
+                `False` to allow a time on the next date as
+                :py:meth:`SolarDay.transit`.
+
+        Returns:
+            The times in UTC, `None` if the sun does not reach the zenith.
+        """
+        cos_zenith = _cos_refracted_zenith(zenith)
+        midnight = (self._start.toordinal() - EPOCH_ORDINAL) * 86400.0
+
+        times: list[datetime | None] = []
+        for day in range(self._days):
+            try:
+                minutes = self._time_utc(day, cos_zenith, sun_event)
+                if on_date and not 0.0 <= minutes < 1440.0:  # noqa: PLR2004
+                    # the event of the next or previous day can be on the date
+                    days = 1 if minutes < 0.0 else -1
+                    minutes = self._time_utc(day + days, cos_zenith, sun_event)
+                    minutes += days * 1440.0
+            except ValueError:
+                times.append(None)
+                continue
+
+            if on_date and not 0.0 <= minutes < 1440.0:  # noqa: PLR2004
+                times.append(None)
+            else:
+                timestamp = midnight + day * 86400.0 + minutes * 60.0
+                times.append(datetime.fromtimestamp(timestamp, timezone.utc))
+
+        return times
+
+    def _time_utc(self, day: int, cos_zenith: float, sun_event: SunEvent) -> float:
+        """Get the minutes since midnight UTC for the sun at a zenith angle.
+
+        Args:
+            day: The date as days since the first date.
+            cos_zenith: The cosine of the refracted zenith angle.
+            sun_event: The sun event (sunrise or sunset).
+
+        Returns:
+            The minutes since the midnight of the date.
+        """
+        curve = self._curves[day + 1]
+        observer = self._observer
+
+        minutes = _time_utc(observer, curve.position, cos_zenith, sun_event)
+        return _time_utc(observer, curve.at(minutes / 1440.0), cos_zenith, sun_event)
+
+
 @dataclass
 class Sun:
     """Sun positions for a geographic location on a certain date.
@@ -48,16 +448,14 @@ class Sun:
     sunset: datetime = field(init=False)
     """The time for sunset in UTC."""
 
-    observer: Observer = field(init=False, repr=False)
+    solar_day: SolarDay = field(init=False, repr=False)
+    """The sun events of the day."""
 
     def __post_init__(self) -> None:
         """Set sunrise and sunset times."""
-        location = LocationInfo('', '', '', self.latitude, self.longitude)
-        self.observer = location.observer
-
-        s = sun(self.observer, date=self.date)
-
-        self.sunrise, self.sunset = s['sunrise'], s['sunset']
+        self.solar_day = SolarDay(self.date, self.latitude, self.longitude)
+        self.sunrise = self.solar_day.sunrise()
+        self.sunset = self.solar_day.sunset()
 
     def deg_below_horizon(
         self,
@@ -73,8 +471,153 @@ class Sun:
         Returns:
             The time in UTC.
         """
-        direction: SunDirection = (
-            SunDirection.RISING if sun_event is SunEvent.RISE else SunDirection.SETTING
-        )
+        return self.solar_day.at_elevation(deg_below_horizon, sun_event)
+
+
+def _position(juliancentury: float) -> _Position:
+    """Get the position of the sun with the NOAA algorithm of `Astral`.
+
+    The declination and the equation of time share the terms `Astral` calculates
+    twice, the arithmetic is the same.
+
+    Args:
+        juliancentury: The Julian century.
+
+    Returns:
+        The position of the sun.
+    """
+    jc = juliancentury
+
+    l0 = (280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0
+    m = 357.52911 + jc * (35999.05029 - 0.0001537 * jc)
+    e = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+    m_rad = radians(m)
+    sin_m = sin(m_rad)
+    sin_2m = sin(m_rad + m_rad)
+    center = _equation_of_center(jc, m_rad, sin_m, sin_2m)
+
+    obliquity, apparent_long = _obliquity_and_longitude(jc, l0 + center)
+    declination = degrees(asin(sin(radians(obliquity)) * sin(radians(apparent_long))))
+    eq_of_time = _equation_of_time(l0, e, obliquity, sin_m, sin_2m)
+
+    declination_rad = radians(declination)
+    return _Position(
+        sin(declination_rad),
+        cos(declination_rad),
+        degrees(eq_of_time) * 4.0,
+    )
+
+
+def _equation_of_center(jc: float, m_rad: float, sin_m: float, sin_2m: float) -> float:
+    """Get the equation of center of the sun.
+
+    Args:
+        jc: The Julian century.
+        m_rad: The geometric mean anomaly of the sun in radians.
+        sin_m: The sine of the mean anomaly.
+        sin_2m: The sine of twice the mean anomaly.
+
+    Returns:
+        The equation of center in degrees.
+    """
+    return (
+        sin_m * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + sin_2m * (0.019993 - 0.000101 * jc)
+        + sin(m_rad + m_rad + m_rad) * 0.000289
+    )
 
-        return time_at_elevation(self.observer, deg_below_horizon, self.date, direction)
+
+def _obliquity_and_longitude(jc: float, true_long: float) -> tuple[float, float]:
+    """Get the obliquity of the ecliptic and the apparent longitude of the sun.
+
+    Args:
+        jc: The Julian century.
+        true_long: The true longitude of the sun in degrees.
+
+    Returns:
+        The corrected obliquity and the apparent longitude in degrees.
+    """
+    omega = radians(125.04 - 1934.136 * jc)
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * (0.001813)))
+    obliquity = 23.0 + (26.0 + (seconds / 60.0)) / 60.0 + 0.00256 * cos(omega)
+
+    return obliquity, true_long - 0.00569 - 0.00478 * sin(omega)
+
+
+def _equation_of_time(
+    l0: float,
+    e: float,
+    obliquity: float,
+    sin_m: float,
+    sin_2m: float,
+) -> float:
+    """Get the equation of time in radians.
+
+    Args:
+        l0: The geometric mean longitude of the sun in degrees.
+        e: The eccentricity of the orbit of the earth.
+        obliquity: The corrected obliquity of the ecliptic in degrees.
+        sin_m: The sine of the mean anomaly of the sun.
+        sin_2m: The sine of twice the mean anomaly.
+
+    Returns:
+        The equation of time.
+    """
+    y = tan(radians(obliquity) / 2.0)
+    y *= y
+    l0_rad = radians(l0)
+
+    return (
+        y * sin(2.0 * l0_rad)
+        - 2.0 * e * sin_m
+        + 4.0 * e * y * sin_m * cos(2.0 * l0_rad)
+        - 0.5 * y * y * sin(4.0 * l0_rad)
+        - 1.25 * e * e * sin_2m
+    )
+
+
+def _time_utc(
+    observer: _Observer,
+    position: _Position,
+    cos_zenith: float,
+    sun_event: SunEvent,
+) -> float:
+    """Get the minutes since midnight UTC for the sun at a zenith angle.
+
+    Args:
+        observer: The geographic location.
+        position: The position of the sun.
+        cos_zenith: The cosine of the refracted zenith angle.
+        sun_event: The sun event (sunrise or sunset).
+
+    Returns:
+        The minutes since midnight UTC.
+    """
+    h = (cos_zenith - observer.sin_latitude * position.sin_declination) / (
+        observer.cos_latitude * position.cos_declination
+    )
+
+    hour_angle = acos(h)
+    if sun_event is SunEvent.SET:
+        hour_angle = -hour_angle
+
+    delta = -observer.longitude - degrees(hour_angle)
+    offset = delta * 4.0 - position.eq_of_time
+    if offset < -720.0:  # noqa: PLR2004
+        offset += 1440
+
+    return 720.0 + offset
+
+
+@cache
+def _cos_refracted_zenith(zenith: float) -> float:
+    """Get the cosine of the zenith angle adjusted for refraction.
+
+    Args:
+        zenith: The zenith angle in degrees.
+
+    Returns:
+        The cosine of the refracted zenith angle.
+    """
+    return cos(radians(zenith + refraction_at_zenith(zenith)))
@@ -0,0 +1,511 @@
+"""Calculate the sun events for many dates and locations at once.
+
+The NOAA algorithm of ``jewcal.helpers.sun.SolarDay`` is vectorized with NumPy over
+a grid of dates and locations, one row per date and one column per location. The
+times are equal to the times of ``jewcal.helpers.sun.Sun`` up to the rounding of the
+floating point functions of NumPy, well within a millisecond.
+
+NumPy is optional, install it with the extra ``pip install jewcal[numpy]``. Without
+NumPy the sun events are calculated one by one and lists are returned.
+
+>>> from datetime import date
+
+>>> from jewcal.helpers.sun_batch import zmanim
+>>> from jewcal.models.zmanim import Location
+
+>>> antwerp = Location(latitude=51.22047, longitude=4.40026)
+>>> batch = zmanim([date(2024, 5, 31).toordinal()], [antwerp])
+>>> print(batch.to_dict(0, 0)['sunset'])
+2024-05-31T19:47:48.504226+00:00
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from math import cos, radians
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+from astral import refraction_at_zenith
+
+from jewcal.batch import HAS_NUMPY
+from jewcal.helpers.sun import (
+    EPOCH_ORDINAL,
+    HORIZON_ZENITH,
+    MAX_LATITUDE,
+    SolarDay,
+    SunEvent,
+)
+from jewcal.models.zmanim import (
+    HALACHIC_HOURS,
+    PLAG_HAMINCHA,
+    TZEIS_HAKOCHAVIM,
+)
+
+if HAS_NUMPY:
+    import numpy as np
+
+if TYPE_CHECKING:
+    # pylint: disable=possibly-used-before-assignment
+    from collections.abc import Callable, Sequence  # pragma: no cover
+
+    import numpy.typing as npt  # pragma: no cover
+
+    from jewcal.models.zmanim import Location  # pragma: no cover
+
+    FloatArray = npt.NDArray[np.float64]  # pragma: no cover
+    DatetimeArray = npt.NDArray[np.datetime64]  # pragma: no cover
+    Times = DatetimeArray | list[list[datetime | None]]  # pragma: no cover
+    IntArrayLike = npt.NDArray[np.integer[Any]] | Sequence[int]  # pragma: no cover
+    FloatArrayLike = npt.NDArray[np.floating[Any]] | Sequence[float]  # pragma: no cover
+
+# Julian day at the start of the Gregorian ordinal 0
+JULIAN_DAY_OFFSET: Final = 1721424.5
+
+MINUTES_PER_DAY: Final = 1440
+MICROSECONDS_PER_MINUTE: Final = 60_000_000
+
+
+class ZmanimBatch(NamedTuple):
+    """The zmanim of a grid of dates and locations.
+
+    The fields are the fields of :py:class:`jewcal.Zmanim`, with a row
+    per date and a column per location. With NumPy the times are `datetime64[us]` in
+    UTC and `NaT` if the sun does not reach the elevation, without NumPy they are
+    datetimes and `None`.
+    """
+
+    sunrise: Times
+    """0.833 degrees above horizon."""
+
+    sunset: Times
+    """0.833 degrees below horizon"""
+
+    plag_hamincha: Times
+    """Sunrise plus 10.75 halachic hours."""
+
+    hadlokas_haneiros: Times
+    """Hadlokas Haneiros at minutes before sunset."""
+
+    tzeis_hakochavim: Times
+    """Nightfall at 8.5 degrees below the horizon."""
+
+    tzeis_minutes: Times
+    """Nightfall at minutes after sunset."""
+
+    def to_dict(self, day: int, location: int) -> dict[str, str | None]:
+        """Get the zmanim of a date and location as a dictionary.
+
+        Args:
+            day: The row of the date.
+            location: The column of the location.
+
+        Returns:
+            A dictionary representation of the zmanim in UTC, as
+            :py:meth:`jewcal.Zmanim.to_dict`.
+        """
+        values = {}
+        for name, times in zip(ZmanimBatch._fields, self, strict=True):
+            time = to_datetime(times[day][location])
+            values[name] = time.isoformat() if time else None
+
+        return values
+
+
+def sunrise(
+    ordinals: IntArrayLike,
+    latitudes: FloatArrayLike,
+    longitudes: FloatArrayLike,
+) -> Times:
+    """Get the times for sunrise.
+
+    Args:
+        ordinals: The Gregorian ordinals, see ``date.toordinal``.
+        latitudes: The latitudes of the locations in decimal degrees.
+        longitudes: The longitudes of the locations in decimal degrees.
+
+    Returns:
+        The times in UTC, a row per date and a column per location.
+    """
+    if not HAS_NUMPY:
+        return _times_lists(ordinals, latitudes, longitudes, SunEvent.RISE)
+
+    return _times(ordinals, latitudes, longitudes, SunEvent.RISE)
+
+
+def sunset(
+    ordinals: IntArrayLike,
+    latitudes: FloatArrayLike,
+    longitudes: FloatArrayLike,
+) -> Times:
+    """Get the times for sunset.
+
+    Args:
+        ordinals: The Gregorian ordinals, see ``date.toordinal``.
+        latitudes: The latitudes of the locations in decimal degrees.
+        longitudes: The longitudes of the locations in decimal degrees.
+
+    Returns:
+        The times in UTC, a row per date and a column per location.
+    """
+    if not HAS_NUMPY:
+        return _times_lists(ordinals, latitudes, longitudes, SunEvent.SET)
+
+    return _times(ordinals, latitudes, longitudes, SunEvent.SET)
+
+
+def at_elevation(
+    ordinals: IntArrayLike,
+    latitudes: FloatArrayLike,
+    longitudes: FloatArrayLike,
+    elevation: float,
+    sun_event: SunEvent,
+) -> Times:
+    """Get the times for the sun at a certain degrees above / below horizon.
+
+    Args:
+        ordinals: The Gregorian ordinals, see ``date.toordinal``.
+        latitudes: The latitudes of the locations in decimal degrees.
+        longitudes: The longitudes of the locations in decimal degrees.
+        elevation: The degrees above (positive) / below (negative) horizon, e.g.
+            ``jewcal.models.zmanim.TZEIS_HAKOCHAVIM``.
+        sun_event: The sun event (sunrise or sunset).
+
+    Returns:
+        The times in UTC, a row per date and a column per location.
+    """
+    if not HAS_NUMPY:
+        return _times_lists(ordinals, latitudes, longitudes, sun_event, 90 - elevation)
+
+    return _times(ordinals, latitudes, longitudes, sun_event, 90 - elevation)
+
+
+def zmanim(ordinals: IntArrayLike, locations: Sequence[Location]) -> ZmanimBatch:
+    """Get the zmanim for a grid of dates and locations.
+
+    Hadlokas Haneiros is set for every date.
+
+    Args:
+        ordinals: The Gregorian ordinals, see ``date.toordinal``.
+        locations: The locations to calculate the Zmanim for.
+
+    Returns:
+        The zmanim, a row per date and a column per location.
+    """
+    if not HAS_NUMPY:
+        return _zmanim_lists(ordinals, locations)
+
+    latitudes = [location.latitude for location in locations]
+    longitudes = [location.longitude for location in locations]
+
+    rise = _times(ordinals, latitudes, longitudes, SunEvent.RISE)
+    set_ = _times(ordinals, latitudes, longitudes, SunEvent.SET)
+    tzeis_hakochavim = _times(
+        ordinals,
+        latitudes,
+        longitudes,
+        SunEvent.SET,
+        90 - TZEIS_HAKOCHAVIM,
+    )
+
+    neiros_minutes = np.array(
+        [location.hadlokas_haneiros_minutes for location in locations],
+        dtype='timedelta64[m]',
+    )
+    tzeis_minutes = np.array(
+        [location.tzeis_minutes for location in locations],
+        dtype='timedelta64[m]',
+    )
+    halachic_hour = (set_ - rise) / HALACHIC_HOURS
+
+    return ZmanimBatch(
+        rise,
+        set_,
+        rise + (halachic_hour * PLAG_HAMINCHA).astype('timedelta64[us]'),
+        set_ - neiros_minutes,
+        tzeis_hakochavim,
+        set_ + tzeis_minutes,
+    )
+
+
+def to_datetime(time: datetime | np.datetime64 | None) -> datetime | None:
+    """Get a time of the batch as an aware datetime.
+
+    Args:
+        time: The time in UTC.
+
+    Returns:
+        The datetime, `None` if there is no time.
+    """
+    if time is None or isinstance(time, datetime):
+        return time
+
+    if np.isnat(time):
+        return None
+
+    microseconds = int(time.astype('datetime64[us]').astype(np.int64))
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(
+        microseconds=microseconds,
+    )
+
+
+def _times(
+    ordinals: IntArrayLike,
+    latitudes: FloatArrayLike,
+    longitudes: FloatArrayLike,
+    sun_event: SunEvent,
+    zenith: float | None = None,
+) -> DatetimeArray:
+    """Get the times for the sun at a zenith angle.
+
+    Args:
+        ordinals: The Gregorian ordinals.
+        latitudes: The latitudes of the locations in decimal degrees.
+        longitudes: The longitudes of the locations in decimal degrees.
+        sun_event: The sun event (sunrise or sunset).
+        zenith: The zenith angle of the sun in degrees, default is the horizon with
+            the time on the date, as sunrise and sunset.
+
+    Returns:
+        The times in UTC, a row per date and a column per location.
+    """
+    days = np.asarray(ordinals, dtype=np.int64)[:, np.newaxis]
+    latitude = np.radians(
+        np.clip(np.asarray(latitudes, dtype=np.float64), -MAX_LATITUDE, MAX_LATITUDE),
+    )
+    longitude = np.asarray(longitudes, dtype=np.float64)
+
+    def transit(offset: npt.NDArray[np.int64] | int) -> FloatArray:
+        return _transit(
+            (days + offset + JULIAN_DAY_OFFSET).astype(np.float64),
+            latitude,
+            longitude,
+            HORIZON_ZENITH if zenith is None else zenith,
+            sun_event,
+        )
+
+    with np.errstate(invalid='ignore'):
+        minutes = transit(0)
+        if zenith is None:
+            # the event of the next or previous day can be on the date
+            offset = (minutes < 0).astype(np.int64) - (minutes >= MINUTES_PER_DAY)
+            if offset.any():
+                minutes = np.where(
+                    offset,
+                    transit(offset) + offset * MINUTES_PER_DAY,
+                    minutes,
+                )
+            minutes[(minutes < 0) | (minutes >= MINUTES_PER_DAY)] = np.nan
+
+    microseconds = np.trunc(np.nan_to_num(minutes) * MICROSECONDS_PER_MINUTE)
+    midnights = (days - EPOCH_ORDINAL) * MINUTES_PER_DAY * MICROSECONDS_PER_MINUTE
+    times: DatetimeArray = (midnights + microseconds.astype(np.int64)).astype(
+        'datetime64[us]',
+    )
+    times[np.isnan(minutes)] = np.datetime64('NaT')
+
+    return times
+
+
+def _transit(
+    julian_days: FloatArray,
+    latitude: FloatArray,
+    longitude: FloatArray,
+    zenith: float,
+    sun_event: SunEvent,
+) -> FloatArray:
+    """Get the minutes since midnight UTC for the sun at a zenith angle.
+
+    As :py:meth:`jewcal.helpers.sun.SolarDay.transit`, the first approximation at
+    the start of the day, the second at the first.
+
+    Args:
+        julian_days: The Julian days at the start of the dates.
+        latitude: The latitudes in radians.
+        longitude: The longitudes in decimal degrees.
+        zenith: The zenith angle of the sun in degrees.
+        sun_event: The sun event (sunrise or sunset).
+
+    Returns:
+        The minutes, `NaN` if the sun does not reach the zenith.
+    """
+    cos_zenith = cos(radians(zenith + refraction_at_zenith(zenith)))
+    sin_latitude, cos_latitude = np.sin(latitude), np.cos(latitude)
+    sign = -1.0 if sun_event is SunEvent.SET else 1.0
+
+    def time_utc(julian_day: FloatArray) -> FloatArray:
+        sin_declination, cos_declination, eq_of_time = _position(
+            (julian_day - 2451545.0) / 36525.0,
+        )
+        h = (cos_zenith - sin_latitude * sin_declination) / (
+            cos_latitude * cos_declination
+        )
+        delta = -longitude - np.degrees(sign * np.arccos(h))
+        offset: FloatArray = delta * 4.0 - eq_of_time
+        offset[offset < -720.0] += MINUTES_PER_DAY  # noqa: PLR2004
+        return 720.0 + offset
+
+    minutes = time_utc(julian_days)
+    return time_utc(julian_days + minutes / MINUTES_PER_DAY)
+
+
+def _position(jc: FloatArray) -> tuple[FloatArray, FloatArray, FloatArray]:
+    """Get the position of the sun, as :py:class:`jewcal.helpers.sun.SolarDay`.
+
+    Args:
+        jc: The Julian centuries.
+
+    Returns:
+        The sine and cosine of the declination, the equation of time in minutes.
+    """
+    l0 = (280.46646 + jc * (36000.76983 + 0.0003032 * jc)) % 360.0
+    m = np.radians(357.52911 + jc * (35999.05029 - 0.0001537 * jc))
+    e = 0.016708634 - jc * (0.000042037 + 0.0000001267 * jc)
+
+    sin_m = np.sin(m)
+    sin_2m = np.sin(m + m)
+    center = (
+        sin_m * (1.914602 - jc * (0.004817 + 0.000014 * jc))
+        + sin_2m * (0.019993 - 0.000101 * jc)
+        + np.sin(m + m + m) * 0.000289
+    )
+
+    omega = np.radians(125.04 - 1934.136 * jc)
+    seconds = 21.448 - jc * (46.815 + jc * (0.00059 - jc * (0.001813)))
+    obliquity = np.radians(
+        23.0 + (26.0 + (seconds / 60.0)) / 60.0 + 0.00256 * np.cos(omega),
+    )
+    apparent_long = np.radians(l0 + center - 0.00569 - 0.00478 * np.sin(omega))
+
+    # the declination is within 90 degrees, its cosine is positive
+    sin_declination = np.sin(obliquity) * np.sin(apparent_long)
+
+    y = np.tan(obliquity / 2.0)
+    y *= y
+    l0 = np.radians(l0)
+    eq_of_time = (
+        y * np.sin(2.0 * l0)
+        - 2.0 * e * sin_m
+        + 4.0 * e * y * sin_m * np.cos(2.0 * l0)
+        - 0.5 * y * y * np.sin(4.0 * l0)
+        - 1.25 * e * e * sin_2m
+    )
+
+    return (
+        sin_declination,
+        np.sqrt(1.0 - sin_declination * sin_declination),
+        np.degrees(eq_of_time) * 4.0,
+    )
+
+
+def _times_lists(
+    ordinals: IntArrayLike,
+    latitudes: FloatArrayLike,
+    longitudes: FloatArrayLike,
+    sun_event: SunEvent,
+    zenith: float | None = None,
+) -> list[list[datetime | None]]:
+    """Get the times for the sun at a zenith angle one by one, without NumPy.
+
+    Args:
+        ordinals: The Gregorian ordinals.
+        latitudes: The latitudes of the locations in decimal degrees.
+        longitudes: The longitudes of the locations in decimal degrees.
+        sun_event: The sun event (sunrise or sunset).
+        zenith: The zenith angle of the sun in degrees, default is the horizon with
+            the time on the date, as sunrise and sunset.
+
+    Returns:
+        The times in UTC, `None` if the sun does not reach the zenith.
+    """
+    locations = list(zip(latitudes, longitudes, strict=True))
+
+    times: list[list[datetime | None]] = []
+    for ordinal in ordinals:
+        row: list[datetime | None] = []
+        for latitude, longitude in locations:
+            solar_day = SolarDay(date.fromordinal(ordinal), latitude, longitude)
+            try:
+                if zenith is not None:
+                    row.append(solar_day.transit(zenith, sun_event))
+                elif sun_event is SunEvent.RISE:
+                    row.append(solar_day.sunrise())
+                else:
+                    row.append(solar_day.sunset())
+            except ValueError:
+                row.append(None)
+        times.append(row)
+
+    return times
+
+
+def _zmanim_lists(
+    ordinals: IntArrayLike,
+    locations: Sequence[Location],
+) -> ZmanimBatch:
+    """Get the zmanim one by one, without NumPy.
+
+    Args:
+        ordinals: The Gregorian ordinals.
+        locations: The locations to calculate the Zmanim for.
+
+    Returns:
+        The zmanim, `None` if the sun does not reach the elevation of a zman.
+    """
+    fields: tuple[list[list[datetime | None]], ...] = tuple(
+        [] for _ in ZmanimBatch._fields
+    )
+    for ordinal in ordinals:
+        for times in fields:
+            times.append([])
+
+        for location in locations:
+            day = _zmanim_of_day(date.fromordinal(ordinal), location)
+            for times, time in zip(fields, day, strict=True):
+                times[-1].append(time)
+
+    return ZmanimBatch(*fields)
+
+
+def _zmanim_of_day(
+    gregorian_date: date,
+    location: Location,
+) -> tuple[datetime | None, ...]:
+    """Get the zmanim of a date and location, as the fields of `ZmanimBatch`.
+
+    Args:
+        gregorian_date: The date.
+        location: The location to calculate the Zmanim for.
+
+    Returns:
+        The zmanim, `None` if the sun does not reach the elevation of a zman.
+    """
+    solar_day = SolarDay(gregorian_date, location.latitude, location.longitude)
+    rise = _or_none(solar_day.sunrise)
+    set_ = _or_none(solar_day.sunset)
+    tzeis_hakochavim = _or_none(
+        lambda: solar_day.at_elevation(TZEIS_HAKOCHAVIM, SunEvent.SET),
+    )
+
+    plag = neiros = tzeis_minutes = None
+    if rise and set_:
+        plag = rise + (set_ - rise) / HALACHIC_HOURS * PLAG_HAMINCHA
+    if set_:
+        neiros = set_ - timedelta(minutes=location.hadlokas_haneiros_minutes)
+        tzeis_minutes = set_ + timedelta(minutes=location.tzeis_minutes)
+
+    return rise, set_, plag, neiros, tzeis_hakochavim, tzeis_minutes
+
+
+def _or_none(event: Callable[[], datetime]) -> datetime | None:
+    """Get the time of a sun event.
+
+    Args:
+        event: The function of the sun event.
+
+    Returns:
+        The time, `None` if the sun does not reach the elevation.
+    """
+    try:
+        return event()
+    except ValueError:
+        return None
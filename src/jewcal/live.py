@@ -0,0 +1,221 @@
+"""The calendar of now for a long-running service.
+
+A :py:class:`CalendarClock` knows the next instant its state changes: candle
+lighting, nightfall (Havdalah at the end of Shabbos or Yom Tov) and midnight in the
+local mean time, when the date changes. The zmanim are of the local evenings, see
+:py:meth:`jewcal.Zmanim.evening`. The state is kept until that instant, then only
+the dates that changed are converted again. The clock is
+``jewcal.utils.datetime.datetime_now``.
+
+>>> from datetime import datetime, timezone
+
+>>> from jewcal.live import CalendarClock
+>>> from jewcal.models.zmanim import Location
+
+>>> clock = CalendarClock(Location(latitude=51.22047, longitude=4.40026))
+>>> state = clock.state_at(datetime(2024, 5, 31, 12, tzinfo=timezone.utc))
+>>> print(state.jewcal)
+23 Iyar 5784: Erev Shabbos
+>>> print(state.issur_melacha, state.until)
+False 2024-05-31 19:29:48.504226+00:00
+
+>>> state = clock.state_at(state.until)
+>>> print(state.jewcal)
+23 Iyar 5784: Erev Shabbos
+>>> print(state.issur_melacha, state.until)
+True 2024-05-31 20:58:18.519021+00:00
+
+>>> print(clock.state_at(state.until).jewcal)
+24 Iyar 5784: Shabbos
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from typing import NamedTuple
+
+from .constants import Action
+from .core import JewCal
+from .models.events import Events
+from .models.jewish_date import JewishDate
+from .models.zmanim import Location, Zmanim
+from .utils.calculations import absdate_to_jewish, is_jewish_leap, weekday_from_absdate
+from .utils.datetime import datetime_now
+
+# pylint: disable=protected-access
+
+
+class CalendarState(NamedTuple):
+    """The calendar between two transitions."""
+
+    jewcal: JewCal
+    """The date in the local mean time, from nightfall the next date."""
+
+    issur_melacha: bool
+    """`True` from candle lighting to nightfall of a day of Issur Melacha."""
+
+    since: datetime
+    """The transition the state started at, in UTC."""
+
+    until: datetime
+    """The next transition, in UTC, the state ends before it."""
+
+
+class CalendarClock:
+    """The calendar of now for a location, kept until its state changes."""
+
+    __slots__ = ('_diaspora', '_jewcals', '_location', '_state')
+
+    def __init__(self, location: Location, *, diaspora: bool = True) -> None:
+        """Create the clock.
+
+        Args:
+            location: The location to calculate the Zmanim for, nightfall is set by
+                :py:attr:`jewcal.Location.use_tzeis_hakochavim`.
+            diaspora: `True` if outside of Israel, `False` if in Israel.
+        """
+        self._location = location
+        self._diaspora = diaspora
+        self._jewcals: dict[date, JewCal] = {}
+        self._state: CalendarState | None = None
+
+    @property
+    def location(self) -> Location:
+        """Get the location.
+
+        Returns:
+            The location.
+        """
+        return self._location
+
+    @property
+    def diaspora(self) -> bool:
+        """Is the calendar for Diaspora or Israel.
+
+        Returns:
+            `True` if outside of Israel, `False` if in Israel.
+        """
+        return self._diaspora
+
+    def state(self) -> CalendarState:
+        """Get the state of now.
+
+        The state is calculated again only at or after its next transition, or if
+        the clock went back.
+
+        Returns:
+            The state.
+        """
+        now = datetime_now()
+        state = self._state
+        if state is None or not state.since <= now < state.until:
+            state = self._state = self.state_at(now)
+
+        return state
+
+    def now(self) -> JewCal:
+        """Get the calendar of now.
+
+        Returns:
+            The date in the local mean time, from nightfall the next date.
+        """
+        return self.state().jewcal
+
+    def is_issur_melacha(self) -> bool:
+        """Is it Issur Melacha now, from candle lighting to nightfall.
+
+        Returns:
+            `True` if it is Issur Melacha, `False` otherwise.
+        """
+        return self.state().issur_melacha
+
+    def next_transition(self) -> datetime:
+        """Get the next instant the state changes.
+
+        Returns:
+            The instant in UTC.
+        """
+        return self.state().until
+
+    def state_at(self, moment: datetime) -> CalendarState:
+        """Get the state at a moment.
+
+        Args:
+            moment: The timezone aware moment.
+
+        Returns:
+            The state.
+        """
+        moment = moment.astimezone(timezone.utc)
+        location = self._location
+        offset = location.mean_time_offset
+        gregorian = (moment + offset).date()
+        midnight = (
+            datetime(
+                gregorian.year,
+                gregorian.month,
+                gregorian.day,
+                tzinfo=timezone.utc,
+            )
+            - offset
+        )
+
+        sunset, nightfall = Zmanim.evening(location, gregorian)
+
+        day = self._jewcal(gregorian)
+        transitions = [midnight, nightfall, midnight + timedelta(days=1)]
+
+        candles = None
+        if day.events.action == Action.CANDLES.value:
+            candles = sunset - timedelta(minutes=location.hadlokas_haneiros_minutes)
+            transitions.append(candles)
+
+        if moment >= nightfall:
+            jewcal = self._jewcal(gregorian + timedelta(days=1))
+            issur_melacha = jewcal.is_issur_melacha()
+        else:
+            jewcal = day
+            issur_melacha = day.is_issur_melacha() or (
+                candles is not None and moment >= candles
+            )
+
+        # the dates before today are not needed again
+        self._jewcals = {
+            key: value for key, value in self._jewcals.items() if key >= gregorian
+        }
+
+        return CalendarState(
+            jewcal,
+            issur_melacha,
+            max(transition for transition in transitions if transition <= moment),
+            min(transition for transition in transitions if transition > moment),
+        )
+
+    def _jewcal(self, gregorian: date) -> JewCal:
+        """Get the calendar of a date, converted once.
+
+        Args:
+            gregorian: The Gregorian date.
+
+        Returns:
+            The same as ``JewCal(gregorian, location, diaspora=diaspora)`` for a date
+            that is not today.
+        """
+        jewcal = self._jewcals.get(gregorian)
+        if jewcal is None:
+            absdate = gregorian.toordinal()
+            year, month, day = absdate_to_jewish(absdate)
+            events = Events.get(
+                weekday_from_absdate(absdate),
+                month,
+                day,
+                diaspora=self._diaspora,
+            )
+            jewcal = self._jewcals[gregorian] = JewCal._from_parts(  # noqa: SLF001
+                JewishDate(year, month, day, gregorian, is_jewish_leap(year)),
+                events,
+                self._location,
+                diaspora=self._diaspora,
+            )
+
+        return jewcal
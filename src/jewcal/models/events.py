@@ -1,11 +1,22 @@
 """Events model."""
 
+from __future__ import annotations
+
 from dataclasses import InitVar, dataclass, field
+from typing import Final
+
+from jewcal.constants import SHABBOS, YOMTOV, YOMTOV_ISRAEL, Action, Event, EventKind
 
-from jewcal.constants import SHABBOS, YOMTOV, YOMTOV_ISRAEL, Action
+# the flags as integers, the operators of IntFlag create new flags and are slow
+_SHABBOS: Final = int(EventKind.SHABBOS)
+_EREV_SHABBOS: Final = int(EventKind.EREV_SHABBOS)
+_YOMTOV: Final = int(EventKind.YOMTOV)
+_EREV_YOMTOV: Final = int(EventKind.EREV_YOMTOV)
+_CANDLES: Final = int(EventKind.CANDLES)
+_ISSUR_MELACHA: Final = int(EventKind.ISSUR_MELACHA)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Events:
     """The events with an action."""
 
@@ -33,6 +44,14 @@ class Events:
     If Shabbos and Yom Tov has `Candles` and `Havdalah`, `Candles` has priority.
     """
 
+    kind: EventKind = field(
+        init=False,
+        default=EventKind(0),
+        repr=False,
+        compare=False,
+    )
+    """The kind of the events, the action and if it is Issur Melacha as flags."""
+
     def __post_init__(self, weekday: int, month: int, day: int, diaspora: bool) -> None:
         """Post init.
 
@@ -42,28 +61,62 @@ class Events:
             day: The day in the Jewish month.
             diaspora: `True` if outside of Israel, `False` if in Israel.
         """
-        self._set_shabbos(weekday)
-        self._set_yomtov(month, day, diaspora=diaspora)
+        holidays = YOMTOV if diaspora else YOMTOV_ISRAEL
+        shabbos, yomtov, action, kind = _combine(
+            SHABBOS.get(weekday),
+            holidays.get(month, {}).get(day),
+        )
 
-    def _set_shabbos(self, weekday: int) -> None:
-        if weekday in SHABBOS:
-            event = SHABBOS[weekday]
-            self.shabbos = event.title
-            self.action = event.action
+        # frozen, the fields are set once
+        object.__setattr__(self, 'shabbos', shabbos)
+        object.__setattr__(self, 'yomtov', yomtov)
+        object.__setattr__(self, 'action', action)
+        object.__setattr__(self, 'kind', kind)
+
+    @classmethod
+    def get(
+        cls: type[Events],
+        weekday: int,
+        month: int,
+        day: int,
+        *,
+        diaspora: bool,
+    ) -> Events:
+        """Get the shared events of a day.
+
+        The events are created once, the days without a Yom Tov share the events of
+        their weekday. The same events are the same object.
 
-    def _set_yomtov(self, month: int, day: int, *, diaspora: bool) -> None:
-        holidays = YOMTOV if diaspora else YOMTOV_ISRAEL
-        if month in holidays and day in holidays[month]:
-            event = holidays[month][day]
-            self.yomtov = event.title
-
-            # don't overwrite action `None` if Chol HaMoed is on Shabbos
-            if event.action:
-                if not self.action:
-                    self.action = event.action
-                elif self.action != event.action:
-                    # if Shabbos / Yom Tov has Candles / Havdalah, Candles has priority
-                    self.action = Action.CANDLES.value
+        Args:
+            weekday:  The weekday number in the range of 0-6, where 0=Sunday.
+            month: The month of the Jewish year.
+            day: The day in the Jewish month.
+            diaspora: `True` if outside of Israel, `False` if in Israel.
+
+        Returns:
+            The events, equal to ``Events(weekday, month, day, diaspora)``.
+        """
+        table = _YOMTOV_EVENTS if diaspora else _YOMTOV_EVENTS_ISRAEL
+        events = table.get((weekday, month, day))
+        return events if events is not None else _WEEKDAY_EVENTS[weekday]
+
+    @classmethod
+    def kind_of(
+        cls: type[Events],
+        shabbos: Event | None,
+        yomtov: Event | None,
+    ) -> EventKind:
+        """Get the kind of the events of a day by its Shabbos and Yom Tov event.
+
+        Args:
+            shabbos: The (Erev) Shabbos event, e.g. of
+                ``jewcal.utils.calculations.Keviah.events``.
+            yomtov: The (Erev) Yom Tov event.
+
+        Returns:
+            The kind, equal to the kind of the shared events of the day.
+        """
+        return _combine(shabbos, yomtov)[3]
 
     def __str__(self) -> str:
         """Get all the events as a string.
@@ -83,46 +136,91 @@ class Events:
         return self.shabbos is not None or self.yomtov is not None
 
     def _is_erev_shabbos(self) -> bool:
-        return self.shabbos is not None and 'Erev' in self.shabbos
+        return bool(int(self.kind) & _EREV_SHABBOS)
 
     def _is_shabbos(self) -> bool:
-        return self.shabbos is not None and not self._is_erev_shabbos()
+        return bool(int(self.kind) & _SHABBOS)
 
     def _is_erev_yomtov(self) -> bool:
-        return all(
-            [
-                self.yomtov is not None,
-                any(
-                    [
-                        self.yomtov and 'Erev' in self.yomtov,
-                        self.yomtov and 'Hoshana Rabba' in self.yomtov,
-                        self.yomtov and 'Pesach 6' in self.yomtov,
-                    ],
-                ),
-            ],
-        )
+        return bool(int(self.kind) & _EREV_YOMTOV)
 
     def _is_yomtov(self) -> bool:
-        return all(
-            [
-                self.yomtov is not None,
-                not self._is_erev_yomtov(),
-                self.yomtov and 'Chol HaMoed' not in self.yomtov,
-            ],
-        )
+        return bool(int(self.kind) & _YOMTOV)
 
     def _is_erev(self) -> bool:
-        is_erev_shabbos = self._is_erev_shabbos()
-        is_erev_yomtov = self._is_erev_yomtov()
-
-        return self.action == Action.CANDLES.value and any(
-            [
-                is_erev_shabbos and self.yomtov is None,
-                self.shabbos is None and is_erev_yomtov,
-                is_erev_shabbos and is_erev_yomtov,
-                is_erev_shabbos and self.yomtov and 'Chol HaMoed' in self.yomtov,
-            ],
-        )
+        # Candles without Issur Melacha
+        return int(self.kind) & (_CANDLES | _ISSUR_MELACHA) == _CANDLES
 
     def _is_issur_melacha(self) -> bool:
-        return self.action is not None and not self._is_erev()
+        return bool(int(self.kind) & _ISSUR_MELACHA)
+
+
+def _combine(
+    shabbos_event: Event | None,
+    yomtov_event: Event | None,
+) -> tuple[str | None, str | None, str | None, EventKind]:
+    """Combine the Shabbos and Yom Tov event of a day.
+
+    Args:
+        shabbos_event: The (Erev) Shabbos event.
+        yomtov_event: The (Erev) Yom Tov event.
+
+    Returns:
+        The Shabbos and Yom Tov definition, the action and the kind.
+    """
+    shabbos = yomtov = action = None
+    kind = EventKind(0)
+
+    if shabbos_event is not None:
+        shabbos = shabbos_event.title
+        action = shabbos_event.action
+        kind |= shabbos_event.kind
+
+    if yomtov_event is not None:
+        yomtov = yomtov_event.title
+        kind |= yomtov_event.kind
+
+        # don't overwrite action `None` if Chol HaMoed is on Shabbos
+        if yomtov_event.action:
+            if not action:
+                action = yomtov_event.action
+            elif action != yomtov_event.action:
+                # if Shabbos / Yom Tov has Candles / Havdalah, Candles has priority
+                action = Action.CANDLES.value
+
+    if action == Action.CANDLES.value:
+        kind |= EventKind.CANDLES
+    elif action == Action.HAVDALAH.value:
+        kind |= EventKind.HAVDALAH
+
+    erev_shabbos = EventKind.EREV_SHABBOS in kind
+    erev_yomtov = EventKind.EREV_YOMTOV in kind
+    is_erev = EventKind.CANDLES in kind and (
+        (erev_shabbos and (yomtov is None or erev_yomtov))
+        or (erev_shabbos and EventKind.CHOL_HAMOED in kind)
+        or (shabbos is None and erev_yomtov)
+    )
+    if action is not None and not is_erev:
+        kind |= EventKind.ISSUR_MELACHA
+
+    return shabbos, yomtov, action, kind
+
+
+def _yomtov_events(*, diaspora: bool) -> dict[tuple[int, int, int], Events]:
+    holidays = YOMTOV if diaspora else YOMTOV_ISRAEL
+    return {
+        (weekday, month, day): Events(weekday, month, day, diaspora)
+        for month, days in holidays.items()
+        for day in days
+        for weekday in range(7)
+    }
+
+
+# the events per weekday, month and day of the Yom Tov days
+_YOMTOV_EVENTS: Final = _yomtov_events(diaspora=True)
+_YOMTOV_EVENTS_ISRAEL: Final = _yomtov_events(diaspora=False)
+
+# the events of the other days only depend on the weekday, month 0 has no Yom Tov
+_WEEKDAY_EVENTS: Final = tuple(
+    Events(weekday, 0, 0, diaspora=True) for weekday in range(7)
+)
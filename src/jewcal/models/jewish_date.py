@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import date
 from enum import IntEnum, unique
 from typing import TYPE_CHECKING
 
+from jewcal.utils.calculations import (
+    days_in_jewish_month,
+    is_jewish_leap,
+    jewish_to_absdate,
+)
+
 if TYPE_CHECKING:
-    from datetime import date  # pragma: no cover
+    from collections.abc import Iterable  # pragma: no cover
 
 
 @unique
@@ -59,8 +66,30 @@ class Month(IntEnum):
             case _:
                 return Month(number)
 
+    def to_number(self, *, is_leap: bool) -> int:
+        """Get the month number, the inverse of :py:meth:`get`.
+
+        Regarding the months Adar, Adar 1 and 2:
+
+        - If the Jewish year is non-leap, Adar 1 and 2 return Adar.
+        - If the Jewish year is leap, Adar returns Adar 1.
+
+        Args:
+            is_leap: Is the Jewish year a leap year.
+
+        Returns:
+            The month number.
+        """
+        match self:
+            case Month.ADAR_1:
+                return Month.ADAR.value
+            case Month.ADAR_2:
+                return self.value if is_leap else Month.ADAR.value
+            case _:
+                return self.value
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JewishDate:
     """The Jewish date."""
 
@@ -79,6 +108,36 @@ class JewishDate:
     _is_leap_year: bool = field(repr=False)
     """Is it a Jewish leap year."""
 
+    @classmethod
+    def from_jewish(
+        cls: type[JewishDate],
+        year: int,
+        month: int,
+        day: int,
+    ) -> JewishDate:
+        """Create a Jewish date from the year, month and day.
+
+        Args:
+            year: The year in the Jewish calendar.
+            month: The month in the Jewish year, see :py:meth:`Month.to_number`.
+            day: The day in the Jewish month.
+
+        Returns:
+            The Jewish date.
+        """
+        number = _month_number(year, month, day)
+        gregorian = date.fromordinal(jewish_to_absdate(year, number, day))
+
+        return cls(year, number, day, gregorian, is_jewish_leap(year))
+
+    def to_gregorian(self) -> date:
+        """Get the date in the Gregorian calendar.
+
+        Returns:
+            The date in the Gregorian calendar.
+        """
+        return self.gregorian_date
+
     def __str__(self) -> str:
         """The Jewish date as a string.
 
@@ -90,3 +149,76 @@ class JewishDate:
             f' {Month.get(self.month, is_leap=self._is_leap_year)}'
             f' {self.year}'
         )
+
+
+def from_jewish(year: int, month: int, day: int) -> date:
+    """Convert a Jewish date to a Gregorian date.
+
+    The month is mapped with :py:meth:`Month.to_number`, e.g. Adar 2 falls in Adar
+    in a non-leap year. A month that is not a month, or a day that is not in the
+    month, raises a `ValueError`.
+
+    Args:
+        year: The year in the Jewish calendar.
+        month: The month in the Jewish year.
+        day: The day in the Jewish month.
+
+    Returns:
+        The date in the Gregorian calendar.
+    """
+    number = _month_number(year, month, day)
+
+    return date.fromordinal(jewish_to_absdate(year, number, day))
+
+
+def from_jewish_bulk(dates: Iterable[tuple[int, int, int]]) -> list[date]:
+    """Convert Jewish dates to Gregorian dates.
+
+    The months are mapped and checked the same as :py:func:`from_jewish`. The
+    conversion is vectorized if NumPy is installed, see :py:mod:`jewcal.batch`.
+
+    Args:
+        dates: The Jewish dates as tuples with the year, month and day.
+
+    Returns:
+        The dates in the Gregorian calendar.
+    """
+    # NumPy is imported with jewcal.batch, only when needed
+    from jewcal.batch import to_gregorian  # noqa: PLC0415  # pylint: disable=import-outside-toplevel
+
+    years, months, days = [], [], []
+    for year, month, day in dates:
+        years.append(year)
+        months.append(_month_number(year, month, day))
+        days.append(day)
+
+    return [
+        date.fromordinal(int(ordinal)) for ordinal in to_gregorian(years, months, days)
+    ]
+
+
+def _month_number(year: int, month: int, day: int) -> int:
+    """Get the month number of :py:meth:`Month.to_number` and check the day.
+
+    Args:
+        year: The year in the Jewish calendar.
+        month: The month in the Jewish year.
+        day: The day in the Jewish month.
+
+    Returns:
+        The month number.
+
+    Raises:
+        ValueError: If the month is not a month or the day is not in the month.
+    """
+    try:
+        number = Month(month).to_number(is_leap=is_jewish_leap(year))
+    except ValueError as error:
+        msg = f'month {month} is not a month of year {year}'
+        raise ValueError(msg) from error
+
+    if not 1 <= day <= days_in_jewish_month(year, number):
+        msg = f'day {day} is not in month {Month(month)!s} of year {year}'
+        raise ValueError(msg)
+
+    return number
@@ -1,18 +1,59 @@
 """Zmanim model."""
 
+from __future__ import annotations
+
+from abc import abstractmethod
 from dataclasses import InitVar, dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Final
+from typing import Final, NamedTuple, Protocol
 
-from jewcal.helpers.sun import Sun, SunEvent
+from jewcal.helpers.sun import SolarDay, SolarSpan, Sun, SunEvent
+from jewcal.utils.cache import LRUCache
 from jewcal.utils.datetime import date_today, datetime_now
 
 HALACHIC_HOURS: Final[int] = 12
 PLAG_HAMINCHA: Final[float] = 10.75
 TZEIS_HAKOCHAVIM: Final[float] = -8.5
+ALOS_HASHACHAR: Final[float] = -16.1
+MISHEYAKIR: Final[float] = -11.5
+MAGEN_AVRAHAM_MINUTES: Final[int] = 72
+
+SUN_EVENTS_CACHE: Final = LRUCache[
+    tuple[date, float, float],
+    tuple[datetime, datetime, datetime, SolarDay],
+](maxsize=1024)
+"""The sunrise, sunset and Tzeis Hakochavim of a date and coordinates.
+
+The position of the sun of the date is kept for the degree based zmanim. Resize it
+or set a time to live with :py:meth:`jewcal.utils.cache.LRUCache.configure`, disable
+it with a maximum size of 0.
+"""
+
 
+class SunEventsLookup(Protocol):  # pylint: disable=too-few-public-methods
+    """Precomputed sun events, e.g. :py:class:`jewcal.grid.ZmanimGrid`."""
 
-@dataclass
+    @abstractmethod
+    def sun_events(
+        self,
+        gregorian_date: date,
+        latitude: float,
+        longitude: float,
+    ) -> tuple[datetime, datetime, datetime] | None:
+        """Get the sun events of a date and coordinates.
+
+        Args:
+            gregorian_date: The date.
+            latitude: The latitude in decimal degrees.
+            longitude: The longitude in decimal degrees.
+
+        Returns:
+            The sunrise, sunset and Tzeis Hakochavim, `None` if they are not
+            precomputed.
+        """
+
+
+@dataclass(frozen=True, slots=True)
 class Location:
     """Location and Zmanim configuration."""
 
@@ -35,8 +76,53 @@ class Location:
     tzeis_minutes: int = field(default=72)
     """Tzeis at minutes after sunset."""
 
+    lookup: SunEventsLookup | None = field(default=None, repr=False, compare=False)
+    """The precomputed sun events to read, `None` to calculate them.
+
+    The sun events that are not precomputed are calculated with
+    ``jewcal.helpers.sun.Sun``.
+    """
+
+    @property
+    def mean_time_offset(self) -> timedelta:
+        """Get the offset of the local mean time to UTC, 4 minutes per degree.
+
+        Returns:
+            The offset, negative west of Greenwich.
+        """
+        return timedelta(hours=self.longitude / 15)
+
+
+class ZmanimTable(NamedTuple):
+    """The zmanim of consecutive dates as columns.
+
+    A column has a time in UTC per date, `None` if the sun does not reach the
+    elevation of the zman on the date.
+    """
+
+    dates: list[date]
+    """The Gregorian dates."""
+
+    sunrise: list[datetime | None]
+    """0.833 degrees above horizon."""
+
+    sunset: list[datetime | None]
+    """0.833 degrees below horizon"""
+
+    plag_hamincha: list[datetime | None]
+    """Sunrise plus 10.75 halachic hours."""
 
-@dataclass
+    hadlokas_haneiros: list[datetime | None]
+    """Hadlokas Haneiros at minutes before sunset."""
+
+    tzeis_hakochavim: list[datetime | None]
+    """Nightfall at 8.5 degrees below the horizon."""
+
+    tzeis_minutes: list[datetime | None]
+    """Nightfall at minutes after sunset."""
+
+
+@dataclass(slots=True)
 class Zmanim:
     """The zmanim of the day."""
 
@@ -67,6 +153,12 @@ class Zmanim:
     tzeis_minutes: datetime = field(init=False)
     """Nightfall at minutes after sunset."""
 
+    _coordinates: tuple[date, float, float] = field(
+        init=False,
+        repr=False,
+        compare=False,
+    )
+
     def __post_init__(
         self,
         gregorian_date: date,
@@ -87,6 +179,90 @@ class Zmanim:
             set_hadlokas_haneiros=set_hadlokas_haneiros,
         )
 
+    @property
+    def alos_hashachar(self) -> datetime | None:
+        """Get dawn at 16.1 degrees below the horizon.
+
+        Returns:
+            The time in UTC, `None` if the sun does not reach the elevation.
+        """
+        return _at_elevation(self._solar_day(), ALOS_HASHACHAR)
+
+    @property
+    def misheyakir(self) -> datetime | None:
+        """Get Misheyakir at 11.5 degrees below the horizon.
+
+        Returns:
+            The time in UTC, `None` if the sun does not reach the elevation.
+        """
+        return _at_elevation(self._solar_day(), MISHEYAKIR)
+
+    @property
+    def sof_zman_shema_gra(self) -> datetime:
+        """Get the latest Shema, sunrise plus 3 halachic hours (GRA).
+
+        Returns:
+            The time in UTC.
+        """
+        return self.sunrise + self._halachic_hour() * 3
+
+    @property
+    def sof_zman_shema_mga(self) -> datetime:
+        """Get the latest Shema, 3 halachic hours of 72 minutes (Magen Avraham).
+
+        The day of the Magen Avraham is from 72 minutes before sunrise to 72 minutes
+        after sunset.
+
+        Returns:
+            The time in UTC.
+        """
+        return self._magen_avraham(3)
+
+    @property
+    def sof_zman_tefila_gra(self) -> datetime:
+        """Get the latest Shacharis, sunrise plus 4 halachic hours (GRA).
+
+        Returns:
+            The time in UTC.
+        """
+        return self.sunrise + self._halachic_hour() * 4
+
+    @property
+    def sof_zman_tefila_mga(self) -> datetime:
+        """Get the latest Shacharis, 4 halachic hours of 72 minutes (Magen Avraham).
+
+        Returns:
+            The time in UTC.
+        """
+        return self._magen_avraham(4)
+
+    @property
+    def chatzos(self) -> datetime:
+        """Get midday, sunrise plus 6 halachic hours.
+
+        Returns:
+            The time in UTC.
+        """
+        return self.sunrise + self._halachic_hour() * 6
+
+    @property
+    def mincha_gedola(self) -> datetime:
+        """Get Mincha Gedola, sunrise plus 6.5 halachic hours.
+
+        Returns:
+            The time in UTC.
+        """
+        return self.sunrise + self._halachic_hour() * 6.5
+
+    @property
+    def mincha_ketana(self) -> datetime:
+        """Get Mincha Ketana, sunrise plus 9.5 halachic hours.
+
+        Returns:
+            The time in UTC.
+        """
+        return self.sunrise + self._halachic_hour() * 9.5
+
     def to_dict(self) -> dict[str, str | None]:
         """Get the zmanim as a dictionary.
 
@@ -106,6 +282,89 @@ class Zmanim:
             'tzeis_minutes': self.tzeis_minutes.isoformat(),
         }
 
+    @classmethod
+    def table(cls, location: Location, start: date, end: date) -> ZmanimTable:
+        """Get the zmanim of the dates from start up to end as columns.
+
+        The position of the sun is calculated once per date for all the zmanim, see
+        ``jewcal.helpers.sun.SolarSpan``. The times are within a tenth of a
+        second of :py:class:`Zmanim`, Hadlokas Haneiros is set for every date.
+
+        Args:
+            location: The location to calculate the Zmanim for.
+            start: The first Gregorian date.
+            end: The Gregorian date to stop before.
+
+        Returns:
+            The zmanim.
+        """
+        days = max((end - start).days, 0)
+        span = SolarSpan(start, days, location.latitude, location.longitude)
+
+        sunrises = span.sunrise()
+        sunsets = span.sunset()
+        neiros = timedelta(minutes=location.hadlokas_haneiros_minutes)
+        tzeis = timedelta(minutes=location.tzeis_minutes)
+
+        plag: list[datetime | None] = []
+        for sunrise, sunset in zip(sunrises, sunsets, strict=True):
+            if sunrise and sunset:
+                halachic_hour = (sunset - sunrise) / HALACHIC_HOURS
+                plag.append(sunrise + halachic_hour * PLAG_HAMINCHA)
+            else:
+                plag.append(None)
+
+        return ZmanimTable(
+            [start + timedelta(days=day) for day in range(days)],
+            sunrises,
+            sunsets,
+            plag,
+            [sunset - neiros if sunset else None for sunset in sunsets],
+            span.at_elevation(TZEIS_HAKOCHAVIM, SunEvent.SET),
+            [sunset + tzeis if sunset else None for sunset in sunsets],
+        )
+
+    @classmethod
+    def evening(
+        cls,
+        location: Location,
+        gregorian_date: date,
+    ) -> tuple[datetime, datetime]:
+        """Get the sunset and nightfall of the evening of a date.
+
+        The zmanim of a date are the sun events on the date in UTC, west of about 60
+        degrees west the sunset on the date in UTC is of the evening before. The
+        sunset of the evening is on the date in the local mean time, see
+        :py:attr:`jewcal.Location.mean_time_offset`, nightfall is the first nightfall
+        after it.
+
+        Args:
+            location: The location to calculate the Zmanim for, nightfall is set by
+                :py:attr:`jewcal.Location.use_tzeis_hakochavim`.
+            gregorian_date: The Gregorian date.
+
+        Returns:
+            The sunset and nightfall in UTC.
+        """
+        zmanim = cls(gregorian_date, location)
+        local_date = (zmanim.sunset + location.mean_time_offset).date()
+        utc_date = gregorian_date + (gregorian_date - local_date)
+        if utc_date != gregorian_date:
+            zmanim = cls(utc_date, location)
+
+        if not location.use_tzeis_hakochavim:
+            return zmanim.sunset, zmanim.tzeis_minutes
+
+        # Tzeis Hakochavim on the date in UTC can be of another evening
+        day = timedelta(days=1)
+        nightfall = zmanim.tzeis_hakochavim
+        if nightfall < zmanim.sunset:
+            nightfall = cls(utc_date + day, location).tzeis_hakochavim
+        elif nightfall - zmanim.sunset > day / 2:
+            nightfall = cls(utc_date - day, location).tzeis_hakochavim
+
+        return zmanim.sunset, nightfall
+
     def set_zmanim(
         self,
         gregorian_date: date,
@@ -123,10 +382,14 @@ class Zmanim:
         """
         lat, lon = location.latitude, location.longitude
 
-        sun = Sun(gregorian_date, lat, lon)
-        sunrise, sunset = sun.sunrise, sun.sunset
+        self._coordinates = (gregorian_date, lat, lon)
 
-        tzeis_hakochavim = sun.deg_below_horizon(TZEIS_HAKOCHAVIM, SunEvent.SET)
+        events = None
+        if location.lookup is not None:
+            events = location.lookup.sun_events(gregorian_date, lat, lon)
+        if events is None:
+            events = self._sun_events()[:3]
+        sunrise, sunset, tzeis_hakochavim = events
         tzeis_minutes = sunset + timedelta(minutes=location.tzeis_minutes)
 
         halachic_hour = (sunset - sunrise) / HALACHIC_HOURS
@@ -143,6 +406,38 @@ class Zmanim:
         self.tzeis_hakochavim = tzeis_hakochavim
         self.tzeis_minutes = tzeis_minutes
 
+    def _halachic_hour(self) -> timedelta:
+        return (self.sunset - self.sunrise) / HALACHIC_HOURS
+
+    def _magen_avraham(self, hours: float) -> datetime:
+        """Get the time of halachic hours of the day of the Magen Avraham.
+
+        Args:
+            hours: The halachic hours since the start of the day.
+
+        Returns:
+            The time in UTC.
+        """
+        minutes = timedelta(minutes=MAGEN_AVRAHAM_MINUTES)
+        alos = self.sunrise - minutes
+        halachic_hour = (self.sunset + minutes - alos) / HALACHIC_HOURS
+
+        return alos + halachic_hour * hours
+
+    def _sun_events(self) -> tuple[datetime, datetime, datetime, SolarDay]:
+        """Get the sun events of the date and coordinates, calculated once.
+
+        Returns:
+            The sunrise, sunset, Tzeis Hakochavim and the position of the sun.
+        """
+        return SUN_EVENTS_CACHE.get_or_set(
+            self._coordinates,
+            lambda: _sun_events(*self._coordinates),
+        )
+
+    def _solar_day(self) -> SolarDay:
+        return self._sun_events()[3]
+
     def is_now_after_nightfall(self, *, use_tzeis_hakochavim: bool) -> bool:
         """Is now after nightfall.
 
@@ -162,3 +457,32 @@ class Zmanim:
         return bool(
             nightfall_time.date() == date_today() and datetime_now() > nightfall_time,
         )
+
+
+def _sun_events(
+    gregorian_date: date,
+    lat: float,
+    lon: float,
+) -> tuple[datetime, datetime, datetime, SolarDay]:
+    """Get the sun events of the zmanim.
+
+    Args:
+        gregorian_date: The date of the zmanim.
+        lat: The latitude in decimal degrees.
+        lon: The longitude in decimal degrees.
+
+    Returns:
+        The sunrise, sunset, Tzeis Hakochavim and the position of the sun for the
+        degree based zmanim.
+    """
+    sun = Sun(gregorian_date, lat, lon)
+    tzeis_hakochavim = sun.deg_below_horizon(TZEIS_HAKOCHAVIM, SunEvent.SET)
+
+    return sun.sunrise, sun.sunset, tzeis_hakochavim, sun.solar_day
+
+
+def _at_elevation(solar_day: SolarDay, elevation: float) -> datetime | None:
+    try:
+        return solar_day.at_elevation(elevation, SunEvent.RISE)
+    except ValueError:
+        return None
@@ -0,0 +1,254 @@
+"""The periods of Issur Melacha, from candle lighting to nightfall.
+
+Consecutive days of Issur Melacha are merged in one period, e.g. Shabbos followed by
+Yom Tov. The zmanim are calculated only for the days a period starts and ends.
+
+>>> from datetime import date
+
+>>> from jewcal.models.zmanim import Location
+>>> from jewcal.periods import periods
+
+>>> antwerp = Location(latitude=51.22047, longitude=4.40026)
+>>> for period in periods(date(2024, 6, 1), date(2024, 6, 15), antwerp):
+...     print(period.first_date, period.last_date, period.start, period.end)
+2024-06-01 2024-06-01 2024-05-31 19:29:48.504226+00:00 2024-06-01 20:59:43.842312+00:00
+2024-06-08 2024-06-08 2024-06-07 19:36:29.998715+00:00 2024-06-08 21:08:17.614336+00:00
+2024-06-12 2024-06-13 2024-06-11 19:39:26.745983+00:00 2024-06-13 21:12:40.093391+00:00
+
+The periods of a span are indexed to look up many moments, e.g. of a log.
+NumPy is optional, install it with the extra ``pip install jewcal[numpy]``.
+
+>>> from datetime import datetime, timezone
+
+>>> from jewcal.periods import PeriodIndex
+
+>>> index = PeriodIndex(date(2024, 6, 1), date(2024, 6, 15), antwerp)
+>>> index.is_issur_melacha(datetime(2024, 6, 1, 12, tzinfo=timezone.utc))
+True
+>>> index.is_issur_melacha(datetime(2024, 6, 2, 12, tzinfo=timezone.utc))
+False
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from typing import TYPE_CHECKING, Any, Final, NamedTuple
+
+from .batch import HAS_NUMPY
+from .constants import EventKind
+from .models.zmanim import Zmanim
+from .search import events_between
+
+if HAS_NUMPY:
+    import numpy as np
+
+if TYPE_CHECKING:
+    # pylint: disable=possibly-used-before-assignment
+    from collections.abc import Iterator, Sequence  # pragma: no cover
+
+    import numpy.typing as npt  # pragma: no cover
+
+    from .models.zmanim import Location  # pragma: no cover
+
+    Moments = npt.NDArray[Any] | Sequence[datetime | float]  # pragma: no cover
+    BoolArray = npt.NDArray[np.bool_] | list[bool]  # pragma: no cover
+
+# Shabbos after two days of Yom Tov
+MAX_DAYS: Final = 3
+
+
+class Period(NamedTuple):
+    """Consecutive days of Issur Melacha."""
+
+    start: datetime
+    """Hadlokas Haneiros on the evening before the first day, in UTC."""
+
+    end: datetime
+    """Nightfall on the evening of the last day, in UTC."""
+
+    first_date: date
+    """The first Gregorian date of Issur Melacha."""
+
+    last_date: date
+    """The last Gregorian date of Issur Melacha."""
+
+
+def periods(
+    start: date,
+    end: date,
+    location: Location,
+    *,
+    diaspora: bool = True,
+) -> Iterator[Period]:
+    """Iterate over the periods of Issur Melacha with days from start up to end.
+
+    The end date is not included. A period with days before the start or after the
+    end is not cut, it starts and ends as it would in a longer span.
+
+    Args:
+        start: The first Gregorian date.
+        end: The Gregorian date to stop before.
+        location: The location to calculate the Zmanim for, nightfall is set by
+            :py:attr:`jewcal.Location.use_tzeis_hakochavim`.
+        diaspora: `True` if outside of Israel, `False` if in Israel.
+
+    Yields:
+        The periods.
+    """
+    # search around the span to get the first and last day of every period
+    search_start = max(start.toordinal() - MAX_DAYS, date.min.toordinal())
+    search_end = min(end.toordinal() + MAX_DAYS, date.max.toordinal())
+
+    first_date = last_date = None
+    for jewcal in events_between(
+        date.fromordinal(search_start),
+        date.fromordinal(search_end),
+        kind=EventKind.ISSUR_MELACHA,
+        diaspora=diaspora,
+    ):
+        gregorian = jewcal.jewish_date.gregorian_date
+        if last_date and gregorian - last_date == timedelta(days=1):
+            last_date = gregorian
+            continue
+
+        if first_date and last_date and _overlaps(first_date, last_date, start, end):
+            yield _period(first_date, last_date, location)
+
+        first_date = last_date = gregorian
+
+    if first_date and last_date and _overlaps(first_date, last_date, start, end):
+        yield _period(first_date, last_date, location)
+
+
+class PeriodIndex:
+    """The periods of Issur Melacha of a span as sorted timestamps.
+
+    A moment is looked up with a binary search in the starts of the periods. A
+    moment outside of the periods of the span, also before or after the span, is not
+    Issur Melacha.
+    """
+
+    __slots__ = ('_ends', '_periods', '_starts')
+
+    def __init__(
+        self,
+        start: date,
+        end: date,
+        location: Location,
+        *,
+        diaspora: bool = True,
+    ) -> None:
+        """Create the index of the periods with days from start up to end.
+
+        Args:
+            start: The first Gregorian date.
+            end: The Gregorian date to stop before.
+            location: The location to calculate the Zmanim for.
+            diaspora: `True` if outside of Israel, `False` if in Israel.
+        """
+        self._periods = tuple(periods(start, end, location, diaspora=diaspora))
+        self._starts = [period.start.timestamp() for period in self._periods]
+        self._ends = [period.end.timestamp() for period in self._periods]
+
+    @property
+    def periods(self) -> tuple[Period, ...]:
+        """Get the periods.
+
+        Returns:
+            The periods, sorted by start.
+        """
+        return self._periods
+
+    def period_at(self, moment: datetime | float) -> Period | None:
+        """Get the period of a moment.
+
+        Args:
+            moment: The moment, a timezone aware datetime or a POSIX timestamp.
+
+        Returns:
+            The period, `None` if the moment is not in a period.
+        """
+        timestamp = moment.timestamp() if isinstance(moment, datetime) else moment
+
+        index = bisect_right(self._starts, timestamp) - 1
+        if index >= 0 and timestamp < self._ends[index]:
+            return self._periods[index]
+
+        return None
+
+    def is_issur_melacha(self, moment: datetime | float) -> bool:
+        """Is it Issur Melacha at a moment.
+
+        A period includes its start and excludes its end.
+
+        Args:
+            moment: The moment, a timezone aware datetime or a POSIX timestamp.
+
+        Returns:
+            `True` if it is Issur Melacha, `False` otherwise.
+        """
+        return self.period_at(moment) is not None
+
+    def is_issur_melacha_bulk(self, moments: Moments) -> BoolArray:
+        """Is it Issur Melacha at many moments.
+
+        With NumPy the moments are looked up at once, an array of POSIX timestamps or
+        of `datetime64` (in UTC) is not converted.
+
+        Args:
+            moments: The moments, timezone aware datetimes or POSIX timestamps.
+
+        Returns:
+            `True` for the moments in Issur Melacha, `False` for the others.
+        """
+        if not HAS_NUMPY:
+            return [self.is_issur_melacha(moment) for moment in moments]
+
+        timestamps = np.asarray(moments)
+        if timestamps.dtype.kind == 'M':
+            microseconds = timestamps.astype('datetime64[us]').astype(np.int64)
+            timestamps = microseconds / 1_000_000
+        elif timestamps.dtype.kind == 'O':
+            timestamps = np.array(
+                [
+                    moment.timestamp() if isinstance(moment, datetime) else moment
+                    for moment in timestamps.ravel()
+                ],
+                dtype=np.float64,
+            ).reshape(timestamps.shape)
+
+        starts = np.asarray(self._starts, dtype=np.float64)
+        ends = np.asarray(self._ends, dtype=np.float64)
+        if not starts.size:
+            return np.zeros(timestamps.shape, dtype=np.bool_)
+
+        index = np.searchsorted(starts, timestamps, side='right') - 1
+        inside: npt.NDArray[np.bool_] = (index >= 0) & (
+            timestamps < ends[np.maximum(index, 0)]
+        )
+        return inside
+
+
+def _overlaps(first_date: date, last_date: date, start: date, end: date) -> bool:
+    return first_date < end and last_date >= start
+
+
+def _period(first_date: date, last_date: date, location: Location) -> Period:
+    """Get the period of consecutive days of Issur Melacha.
+
+    The zmanim are of the local evenings, see :py:meth:`jewcal.Zmanim.evening`.
+
+    Args:
+        first_date: The first Gregorian date.
+        last_date: The last Gregorian date.
+        location: The location to calculate the Zmanim for.
+
+    Returns:
+        The period from candle lighting to nightfall.
+    """
+    sunset, _ = Zmanim.evening(location, first_date - timedelta(days=1))
+    _, nightfall = Zmanim.evening(location, last_date)
+    hadlokas_haneiros = sunset - timedelta(minutes=location.hadlokas_haneiros_minutes)
+
+    return Period(hadlokas_haneiros, nightfall, first_date, last_date)
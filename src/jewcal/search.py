@@ -0,0 +1,242 @@
+"""Search the days with events.
+
+The days of a year with an event of a kind are indexed once per year type (keviah),
+so a search is a binary search in the days of a year instead of a scan.
+
+>>> from datetime import date
+
+>>> from jewcal.constants import EventKind
+>>> from jewcal.search import next_event, previous_event
+
+>>> print(next_event(date(2024, 5, 31), kind=EventKind.YOMTOV))
+6 Sivan 5784: Shavuos 1
+>>> print(previous_event(date(2024, 5, 31), kind=EventKind.CANDLES, diaspora=False))
+16 Iyar 5784: Erev Shabbos
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date
+from functools import cache
+from typing import TYPE_CHECKING, Final
+
+from .constants import EventKind
+from .core import JewCal
+from .models.events import Events
+from .models.jewish_date import JewishDate
+from .utils.calculations import absdate_to_jewish, jewish_year, keviah, year_type
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator  # pragma: no cover
+
+    from .models.zmanim import Location  # pragma: no cover
+
+# pylint: disable=protected-access
+
+# every day with Shabbos or Yom Tov has one of these
+ANY_EVENT: Final = (
+    EventKind.SHABBOS
+    | EventKind.EREV_SHABBOS
+    | EventKind.YOMTOV
+    | EventKind.EREV_YOMTOV
+    | EventKind.CHOL_HAMOED
+)
+
+MIN_ABSDATE: Final = date.min.toordinal()
+MAX_ABSDATE: Final = date.max.toordinal()
+FIRST_YEAR: Final = absdate_to_jewish(MIN_ABSDATE)[0]
+LAST_YEAR: Final = absdate_to_jewish(MAX_ABSDATE)[0]
+
+
+def next_event(
+    gregorian_date: date,
+    *,
+    kind: EventKind = ANY_EVENT,
+    diaspora: bool = True,
+    location: Location | None = None,
+) -> JewCal | None:
+    """Get the first day after the date with an event of the kind.
+
+    Args:
+        gregorian_date: The Gregorian date to search after.
+        kind: The kind of the event, a day matches if it has one of the flags.
+        diaspora: `True` if outside of Israel, `False` if in Israel.
+        location: The location to calculate the Zmanim for.
+
+    Returns:
+        The day as ``JewCal(gregorian_date, diaspora=diaspora)`` with the Zmanim of
+        the location, also after nightfall, `None` if there is no day before
+        ``date.max``.
+    """
+    _check_kind(kind)
+
+    absdate = gregorian_date.toordinal()
+    year = absdate_to_jewish(absdate)[0]
+    day_of_year = absdate - jewish_year(year).first_day
+
+    while year <= LAST_YEAR:
+        days = _event_days(year_type(year), kind, diaspora=diaspora)
+        index = bisect_right(days, day_of_year)
+        if index < len(days):
+            return _jewcal(year, days[index], location, diaspora=diaspora)
+
+        year += 1
+        day_of_year = -1
+
+    return None
+
+
+def previous_event(
+    gregorian_date: date,
+    *,
+    kind: EventKind = ANY_EVENT,
+    diaspora: bool = True,
+    location: Location | None = None,
+) -> JewCal | None:
+    """Get the last day before the date with an event of the kind.
+
+    Args:
+        gregorian_date: The Gregorian date to search before.
+        kind: The kind of the event, a day matches if it has one of the flags.
+        diaspora: `True` if outside of Israel, `False` if in Israel.
+        location: The location to calculate the Zmanim for.
+
+    Returns:
+        The day as ``JewCal(gregorian_date, diaspora=diaspora)`` with the Zmanim of
+        the location, also after nightfall, `None` if there is no day after
+        ``date.min``.
+    """
+    _check_kind(kind)
+
+    absdate = gregorian_date.toordinal()
+    year = absdate_to_jewish(absdate)[0]
+    day_of_year = absdate - jewish_year(year).first_day
+
+    while year >= FIRST_YEAR:
+        days = _event_days(year_type(year), kind, diaspora=diaspora)
+        index = bisect_left(days, day_of_year)
+        if index > 0:
+            return _jewcal(year, days[index - 1], location, diaspora=diaspora)
+
+        year -= 1
+        day_of_year = jewish_year(year).days
+
+    return None
+
+
+def events_between(
+    start: date,
+    end: date,
+    *,
+    kind: EventKind = ANY_EVENT,
+    diaspora: bool = True,
+    location: Location | None = None,
+) -> Iterator[JewCal]:
+    """Iterate over the days with an event of the kind between start and end.
+
+    The end date is not included.
+
+    Args:
+        start: The first Gregorian date.
+        end: The Gregorian date to stop before.
+        kind: The kind of the event, a day matches if it has one of the flags.
+        diaspora: `True` if outside of Israel, `False` if in Israel.
+        location: The location to calculate the Zmanim for.
+
+    Yields:
+        The days as ``JewCal(gregorian_date, diaspora=diaspora)`` with the Zmanim of
+        the location, also after nightfall.
+    """
+    _check_kind(kind)
+
+    absdate = start.toordinal()
+    end_absdate = end.toordinal()
+    year = absdate_to_jewish(absdate)[0]
+
+    while absdate < end_absdate:
+        structure = jewish_year(year)
+        days = _event_days(year_type(year), kind, diaspora=diaspora)
+
+        first = bisect_left(days, absdate - structure.first_day)
+        last = bisect_left(days, end_absdate - structure.first_day)
+        for day_of_year in days[first:last]:
+            jewcal = _jewcal(year, day_of_year, location, diaspora=diaspora)
+            if jewcal is not None:
+                yield jewcal
+
+        year += 1
+        absdate = structure.first_day + structure.days
+
+
+@cache
+def _event_days(code: int, kind: EventKind, *, diaspora: bool) -> tuple[int, ...]:
+    """Get the days of a year type with an event of the kind.
+
+    Args:
+        code: The year type code.
+        kind: The kind of the event.
+        diaspora: `True` if outside of Israel, `False` if in Israel.
+
+    Returns:
+        The sorted days of the year, 0 is Rosh Hashana.
+    """
+    template = keviah(code)
+    events = template.events if diaspora else template.events_israel
+
+    return tuple(
+        day_of_year
+        for day_of_year, (shabbos, yomtov) in enumerate(events)
+        if Events.kind_of(shabbos, yomtov) & kind
+    )
+
+
+def _jewcal(
+    year: int,
+    day_of_year: int,
+    location: Location | None,
+    *,
+    diaspora: bool,
+) -> JewCal | None:
+    """Get the day of a year, if it is in the range of the Gregorian calendar.
+
+    The day is created from the template of the year type, so after nightfall of
+    today it is not the next Jewish date.
+
+    Args:
+        year: The Jewish year.
+        day_of_year: The day of the year, 0 is Rosh Hashana.
+        location: The location to calculate the Zmanim for.
+        diaspora: `True` if outside of Israel, `False` if in Israel.
+
+    Returns:
+        The day, `None` if it is not in the range of :py:class:`datetime.date`.
+    """
+    absdate = jewish_year(year).first_day + day_of_year
+    if not MIN_ABSDATE <= absdate <= MAX_ABSDATE:
+        return None
+
+    template = keviah(year_type(year))
+    month, day = template.dates[day_of_year]
+    events = Events.get(template.weekdays[day_of_year], month, day, diaspora=diaspora)
+
+    return JewCal._from_parts(  # noqa: SLF001
+        JewishDate(year, month, day, date.fromordinal(absdate), template.is_leap),
+        events,
+        location,
+        diaspora=diaspora,
+    )
+
+
+def _check_kind(kind: EventKind) -> None:
+    """Check the kind of the event.
+
+    Args:
+        kind: The kind of the event.
+
+    Raises:
+        ValueError: If the kind has no flags.
+    """
+    if not kind:
+        msg = 'kind must have at least one flag'
+        raise ValueError(msg)
@@ -0,0 +1,180 @@
+"""A thread-safe least recently used (LRU) cache with an optional time to live.
+
+>>> from jewcal.utils.cache import LRUCache
+
+>>> cache = LRUCache[str, int](maxsize=2)
+>>> cache.get_or_set('a', lambda: 1)
+1
+>>> cache.get_or_set('a', lambda: 2)
+1
+>>> cache.info()
+CacheInfo(hits=1, misses=1, maxsize=2, currsize=1)
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from enum import Enum
+from threading import Lock
+from time import monotonic
+from typing import TYPE_CHECKING, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable  # pragma: no cover
+
+K = TypeVar('K', bound='Hashable')
+V = TypeVar('V')
+
+
+class _Keep(Enum):
+    """The default of a setting that is not changed."""
+
+    TTL = 'ttl'
+
+
+class CacheInfo(NamedTuple):
+    """The statistics of a cache, as ``functools.lru_cache``."""
+
+    hits: int
+    """The number of values found in the cache."""
+
+    misses: int
+    """The number of values calculated."""
+
+    maxsize: int
+    """The maximum number of values."""
+
+    currsize: int
+    """The number of values in the cache."""
+
+
+class LRUCache(Generic[K, V]):
+    """A cache of the most recently used values.
+
+    The values are calculated outside of the lock, two threads missing the same key
+    at once both calculate the value. An exception is not cached.
+    """
+
+    __slots__ = ('_clock', '_hits', '_lock', '_maxsize', '_misses', '_ttl', '_values')
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        ttl: float | None = None,
+        *,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        """Create the cache.
+
+        Args:
+            maxsize: The maximum number of values, 0 disables the cache.
+            ttl: The seconds a value is kept, `None` to keep it until it is the least
+                recently used.
+            clock: The clock for the time to live, in seconds.
+        """
+        self._values: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+        self._clock = clock
+        self._hits = self._misses = 0
+        self._maxsize = 0
+        self._ttl: float | None = None
+        self.configure(maxsize, ttl)
+
+    @property
+    def maxsize(self) -> int:
+        """Get the maximum number of values.
+
+        Returns:
+            The maximum number of values.
+        """
+        return self._maxsize
+
+    @property
+    def ttl(self) -> float | None:
+        """Get the seconds a value is kept.
+
+        Returns:
+            The seconds, `None` if a value is kept until it is the least recently
+            used.
+        """
+        return self._ttl
+
+    def configure(self, maxsize: int, ttl: float | _Keep | None = _Keep.TTL) -> None:
+        """Change the maximum number of values and the time to live.
+
+        The least recently used values above the maximum are removed.
+
+        Args:
+            maxsize: The maximum number of values, 0 disables the cache.
+            ttl: The seconds a value is kept, `None` to keep it until it is the least
+                recently used. The time to live is not changed if it is not passed.
+
+        Raises:
+            ValueError: If the maximum number of values or the time to live is
+                negative.
+        """
+        if ttl is _Keep.TTL:
+            ttl = self._ttl
+
+        if maxsize < 0 or (ttl is not None and ttl < 0):
+            msg = 'maxsize and ttl must not be negative'
+            raise ValueError(msg)
+
+        with self._lock:
+            self._maxsize = maxsize
+            self._ttl = ttl
+            while len(self._values) > maxsize:
+                self._values.popitem(last=False)
+
+    def get_or_set(self, key: K, function: Callable[[], V]) -> V:
+        """Get the value of a key, calculate and cache it if it is missing.
+
+        Args:
+            key: The key.
+            function: The function to calculate the value.
+
+        Returns:
+            The value.
+        """
+        with self._lock:
+            if key in self._values:
+                created, value = self._values[key]
+                if self._ttl is None or self._clock() - created < self._ttl:
+                    self._values.move_to_end(key)
+                    self._hits += 1
+                    return value
+
+                del self._values[key]
+
+            self._misses += 1
+
+        value = function()
+
+        with self._lock:
+            if self._maxsize:
+                self._values[key] = (self._clock(), value)
+                self._values.move_to_end(key)
+                if len(self._values) > self._maxsize:
+                    self._values.popitem(last=False)
+
+        return value
+
+    def info(self) -> CacheInfo:
+        """Get the statistics of the cache.
+
+        Returns:
+            The hits, misses, maximum and current number of values.
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._maxsize,
+                len(self._values),
+            )
+
+    def clear(self) -> None:
+        """Remove all values and reset the statistics."""
+        with self._lock:
+            self._values.clear()
+            self._hits = self._misses = 0
@@ -9,8 +9,15 @@ Source code Copyright © by Ulrich and David Greve (2005)
 https://www.david-greve.de/luach-code/jewish-python.html
 """
 
+import sys
 from calendar import isleap, monthrange
 from datetime import date
+from functools import cache, lru_cache
+from mmap import ACCESS_READ, mmap
+from pathlib import Path
+from typing import NamedTuple
+
+from jewcal.constants import SHABBOS, YOMTOV, YOMTOV_ISRAEL, Event
 
 TISHREI = 7
 
@@ -21,6 +28,92 @@ JEWISH_EPOCH = 1373429
 # Moon's 19 year cycle where the Moon returns to the same place
 METONIC_CYCLE = 19
 
+# Mean length of a Jewish year in days: 235 months of 29d 12h 793p in 19 years
+MEAN_YEAR_NUMERATOR = 35975351
+MEAN_YEAR_DENOMINATOR = 98496
+
+# Number of Jewish years kept in the cache of :py:func:`jewish_year`
+JEWISH_YEAR_CACHE_SIZE = 1024
+
+# Precomputed Rosh Hashana of the Jewish years 1 to 10000, see `utils.tables`
+ROSH_HASHANA_TABLE = Path(__file__).with_name('rosh_hashana.bin')
+ROSH_HASHANA_TABLE_YEARS = 10000
+
+
+class JewishYear(NamedTuple):
+    """The structure of a Jewish year."""
+
+    year: int
+    """The Jewish year."""
+
+    first_day: int
+    """The absolute date number of Rosh Hashana."""
+
+    days: int
+    """The number of days in the year."""
+
+    is_leap: bool
+    """Is it a leap year."""
+
+    months: tuple[int, ...]
+    """The month numbers in the order of the year, starting from Tishrei."""
+
+    month_days: tuple[int, ...]
+    """The number of days in a month, indexed by the month number."""
+
+    month_offsets: tuple[int, ...]
+    """The days from Rosh Hashana to the first of a month, indexed by the month
+    number."""
+
+
+class Keviah(NamedTuple):
+    """The template of a Jewish year type (keviah)."""
+
+    code: int
+    """The year type code, see :py:func:`encode_year_type`."""
+
+    is_leap: bool
+    """Is it a leap year."""
+
+    days: int
+    """The number of days in the year."""
+
+    weekday: int
+    """The weekday of Rosh Hashana in the range of 0-6, where 0=Sunday."""
+
+    months: tuple[int, ...]
+    """The month numbers in the order of the year, starting from Tishrei."""
+
+    month_days: tuple[int, ...]
+    """The number of days in a month, indexed by the month number."""
+
+    month_offsets: tuple[int, ...]
+    """The days from Rosh Hashana to the first of a month, indexed by the month
+    number."""
+
+    dates: tuple[tuple[int, int], ...]
+    """The month and day, indexed by the day of the year (0 is Rosh Hashana)."""
+
+    weekdays: tuple[int, ...]
+    """The weekday, indexed by the day of the year."""
+
+    events: tuple[tuple[Event | None, Event | None], ...]
+    """The Shabbos and Yom Tov event in the Diaspora, indexed by the day of the
+    year."""
+
+    events_israel: tuple[tuple[Event | None, Event | None], ...]
+    """The Shabbos and Yom Tov event in Israel, indexed by the day of the year."""
+
+
+class _RoshHashanaTable(NamedTuple):
+    """The precomputed Rosh Hashana table, memory-mapped from package data."""
+
+    first_days: memoryview
+    """The absolute date number of Rosh Hashana, indexed by the year minus 1."""
+
+    year_types: memoryview
+    """The year type code, indexed by the year minus 1."""
+
 
 def is_gregorian_leap(year: int) -> bool:
     """Is the Gregorian year a leap year.
@@ -80,7 +173,7 @@ def days_in_jewish_year(year: int) -> int:
     Returns:
         The number of days.
     """
-    return _first_day_of_jewish_year(year + 1) - _first_day_of_jewish_year(year)
+    return jewish_year(year).days
 
 
 def days_in_jewish_month(year: int, month: int) -> int:
@@ -93,20 +186,7 @@ def days_in_jewish_month(year: int, month: int) -> int:
     Returns:
         The number of days.
     """
-    match month:
-        case 2 | 4 | 6 | 10 | 13:
-            return 29
-        case 12:
-            if not is_jewish_leap(year):
-                return 29
-        case 8:
-            if not _is_long_cheshvan(year):
-                return 29
-        case 9:
-            if _is_short_kislev(year):
-                return 29
-
-    return 30
+    return jewish_year(year).month_days[month]
 
 
 def months_in_jewish_year(year: int) -> int:
@@ -149,33 +229,9 @@ def jewish_to_absdate(year: int, month: int, day: int) -> int:
     Returns:
         The absolute date number.
     """
-    # Days so far this month.
-    value = day
-    return_value = value
-
-    # If before Tishrei
-    if month < TISHREI:
-        # add days in prior months this year before and after Nisan.
-        for i in range(TISHREI, months_in_jewish_year(year) + 1):
-            value = days_in_jewish_month(year, i)
-            return_value += value
-        for i in range(1, month):
-            value = days_in_jewish_month(year, i)
-            return_value += value
-    else:
-        for i in range(TISHREI, month):
-            value = days_in_jewish_month(year, i)
-            return_value += value
-
-    # Days in prior years.
-    value = _first_day_of_jewish_year(year)
-    return_value += value
-
-    # Days elapsed before absolute date 1.
-    value = JEWISH_EPOCH
-    return_value -= value
+    structure = jewish_year(year)
 
-    return return_value
+    return structure.first_day + structure.month_offsets[month] + day - 1
 
 
 def absdate_to_gregorian(absdate: int) -> tuple[int, int, int]:
@@ -195,39 +251,31 @@ def absdate_to_gregorian(absdate: int) -> tuple[int, int, int]:
 def absdate_to_jewish(absdate: int) -> tuple[int, int, int]:
     """Convert the absolute date number to a Jewish date.
 
+    The year is estimated from the mean length of the molad year. The estimate is
+    either the correct year or the year before, so at most one correction is needed.
+    The month and day are looked up by the day of the year in the year type template.
+
     Args:
         absdate: The absolute date number.
 
     Returns:
         A tuple with the Jewish year, month and day.
     """
-    approx = (absdate + JEWISH_EPOCH) // 366
-
-    year_temp = approx
-    while 1:
-        absdate_temp = jewish_to_absdate(year_temp + 1, 7, 1)
-        if absdate < absdate_temp:
-            break
-        year_temp += 1
-    year = year_temp
-
-    absdate_temp = jewish_to_absdate(year, 1, 1)
-    start = 7 if absdate < absdate_temp else 1
-
-    month_temp = start
-    while 1:
-        absdate_temp = jewish_to_absdate(
-            year,
-            month_temp,
-            days_in_jewish_month(year, month_temp),
-        )
-        if absdate <= absdate_temp:
-            break
-        month_temp += 1
-    month = month_temp
-
-    absdate_temp = jewish_to_absdate(year, month, 1)
-    day = absdate - absdate_temp + 1
+    # Years elapsed half a mean year ago: the year is this or the next one.
+    elapsed = absdate + JEWISH_EPOCH - 1
+    year = (
+        (2 * elapsed * MEAN_YEAR_DENOMINATOR - MEAN_YEAR_NUMERATOR)
+        // (2 * MEAN_YEAR_NUMERATOR)
+    ) + 1
+
+    first_day, code = _rosh_hashana(year)
+    template = keviah(code)
+    if absdate >= first_day + template.days:
+        year += 1
+        first_day, code = _rosh_hashana(year)
+        template = keviah(code)
+
+    month, day = template.dates[absdate - first_day]
 
     return (year, month, day)
 
@@ -331,7 +379,7 @@ def _is_long_cheshvan(year: int) -> bool:
     Returns:
          True for long, False otherwise.
     """
-    return bool((days_in_jewish_year(year) % 10) == 5)  # noqa: PLR2004
+    return bool((jewish_year(year).days % 10) == 5)  # noqa: PLR2004
 
 
 def _is_short_kislev(year: int) -> bool:
@@ -346,4 +394,208 @@ def _is_short_kislev(year: int) -> bool:
     Returns:
          True for short, False otherwise.
     """
-    return bool((days_in_jewish_year(year) % 10) == 3)  # noqa: PLR2004
+    return bool((jewish_year(year).days % 10) == 3)  # noqa: PLR2004
+
+
+@lru_cache(maxsize=JEWISH_YEAR_CACHE_SIZE)
+def jewish_year(year: int) -> JewishYear:
+    """Get the structure of a Jewish year.
+
+    Rosh Hashana is read from the precomputed table, or calculated for the years
+    outside of the table. The structure is calculated once per year and kept in a
+    bounded cache of :py:data:`JEWISH_YEAR_CACHE_SIZE` years.
+
+    Args:
+        year: The Jewish year.
+
+    Returns:
+        The structure of the Jewish year.
+    """
+    first_day, code = _rosh_hashana(year)
+    template = keviah(code)
+
+    return JewishYear(
+        year,
+        first_day,
+        template.days,
+        template.is_leap,
+        template.months,
+        template.month_days,
+        template.month_offsets,
+    )
+
+
+def year_type(year: int) -> int:
+    """Get the type (keviah) of a Jewish year.
+
+    A year has one of 14 types, defined by its leap status, its number of days and
+    the weekday of Rosh Hashana.
+
+    Args:
+        year: The Jewish year.
+
+    Returns:
+        The year type code, see :py:func:`encode_year_type`.
+    """
+    return _rosh_hashana(year)[1]
+
+
+@cache
+def keviah(code: int) -> Keviah:
+    """Get the template of a year type (keviah).
+
+    The template is built once per year type, the data of a year is the template
+    offset by the absolute date number of Rosh Hashana.
+
+    Args:
+        code: The year type code, see :py:func:`year_type`.
+
+    Returns:
+        The template of the year type.
+    """
+    is_leap, days, weekday = decode_year_type(code)
+
+    cheshvan = 30 if days % 10 == 5 else 29  # noqa: PLR2004
+    kislev = 29 if days % 10 == 3 else 30  # noqa: PLR2004
+    adar = 30 if is_leap else 29
+
+    # indexed by the month number, Adar 2 has 29 days also in a non-leap year
+    month_days = (0, 30, 29, 30, 29, 30, 29, 30, cheshvan, kislev, 29, 30, adar, 29)
+    months: tuple[int, ...] = (7, 8, 9, 10, 11, 12)
+    months += (13, 1, 2, 3, 4, 5, 6) if is_leap else (1, 2, 3, 4, 5, 6)
+
+    month_offsets = [0] * len(month_days)
+    offset = 0
+    for month in months:
+        month_offsets[month] = offset
+        offset += month_days[month]
+
+    # Adar 2 in a non-leap year starts where Nisan starts
+    if not is_leap:
+        month_offsets[13] = month_offsets[1]
+
+    dates = tuple(
+        (month, day) for month in months for day in range(1, month_days[month] + 1)
+    )
+    weekdays = tuple((weekday + day_of_year) % 7 for day_of_year in range(days))
+
+    return Keviah(
+        code,
+        is_leap,
+        days,
+        weekday,
+        months,
+        month_days,
+        tuple(month_offsets),
+        dates,
+        weekdays,
+        _keviah_events(dates, weekdays, YOMTOV),
+        _keviah_events(dates, weekdays, YOMTOV_ISRAEL),
+    )
+
+
+def encode_year_type(*, is_leap: bool, days: int, weekday: int) -> int:
+    """Encode the type of a Jewish year in one byte.
+
+    Args:
+        is_leap: Is it a leap year.
+        days: The number of days in the year.
+        weekday: The weekday of Rosh Hashana in the range of 0-6, where 0=Sunday.
+
+    Returns:
+        The year type code.
+    """
+    return (is_leap << 5) | ((days % 10 - 3) << 3) | weekday
+
+
+def decode_year_type(code: int) -> tuple[bool, int, int]:
+    """Decode the type of a Jewish year.
+
+    Args:
+        code: The year type code, see :py:func:`encode_year_type`.
+
+    Returns:
+        A tuple with the leap year flag, the number of days and the weekday of
+        Rosh Hashana.
+    """
+    is_leap = bool(code >> 5)
+    days = (383 if is_leap else 353) + ((code >> 3) & 3)
+
+    return (is_leap, days, code & 7)
+
+
+def _load_rosh_hashana_table() -> _RoshHashanaTable | None:
+    """Memory-map the precomputed Rosh Hashana table.
+
+    The pages of the file are shared by all processes using the table.
+
+    Returns:
+        The table, `None` if it is not available on this platform.
+    """
+    size = ROSH_HASHANA_TABLE_YEARS * 5
+    if sys.byteorder != 'little':  # pragma: no cover
+        return None
+
+    try:
+        with ROSH_HASHANA_TABLE.open('rb') as file:
+            buffer = mmap(file.fileno(), 0, access=ACCESS_READ)
+    except (OSError, ValueError):  # pragma: no cover
+        return None
+
+    if len(buffer) != size:  # pragma: no cover
+        buffer.close()
+        return None
+
+    view = memoryview(buffer)
+    first_days = ROSH_HASHANA_TABLE_YEARS * 4
+
+    return _RoshHashanaTable(view[:first_days].cast('i'), view[first_days:])
+
+
+_ROSH_HASHANA = _load_rosh_hashana_table()
+
+
+def _rosh_hashana(year: int) -> tuple[int, int]:
+    """Get Rosh Hashana and the year type of a Jewish year.
+
+    Read from the precomputed table, or calculated for the years outside of it.
+
+    Args:
+        year: The Jewish year.
+
+    Returns:
+        A tuple with the absolute date number of Rosh Hashana and the year type code.
+    """
+    if _ROSH_HASHANA is not None and 1 <= year <= ROSH_HASHANA_TABLE_YEARS:
+        return (_ROSH_HASHANA.first_days[year - 1], _ROSH_HASHANA.year_types[year - 1])
+
+    elapsed = _first_day_of_jewish_year(year)
+    first_day = elapsed - JEWISH_EPOCH + 1
+    code = encode_year_type(
+        is_leap=is_jewish_leap(year),
+        days=_first_day_of_jewish_year(year + 1) - elapsed,
+        weekday=weekday_from_absdate(first_day),
+    )
+
+    return (first_day, code)
+
+
+def _keviah_events(
+    dates: tuple[tuple[int, int], ...],
+    weekdays: tuple[int, ...],
+    holidays: dict[int, dict[int, Event]],
+) -> tuple[tuple[Event | None, Event | None], ...]:
+    """Get the Shabbos and Yom Tov events of every day of a year type.
+
+    Args:
+        dates: The month and day of every day of the year.
+        weekdays: The weekday of every day of the year.
+        holidays: The Yom Tov events, Diaspora or Israel.
+
+    Returns:
+        The Shabbos and Yom Tov event of every day of the year.
+    """
+    return tuple(
+        (SHABBOS.get(weekday), holidays.get(month, {}).get(day))
+        for (month, day), weekday in zip(dates, weekdays, strict=True)
+    )
@@ -0,0 +1,66 @@
+"""Generate the precomputed tables shipped as package data.
+
+Run after changing the calendar calculations:
+    `python -m jewcal.utils.tables`
+"""
+
+import sys
+from array import array
+from pathlib import Path
+
+from jewcal.utils.calculations import (
+    JEWISH_EPOCH,
+    ROSH_HASHANA_TABLE,
+    ROSH_HASHANA_TABLE_YEARS,
+    _first_day_of_jewish_year,
+    encode_year_type,
+    is_jewish_leap,
+    weekday_from_absdate,
+)
+
+
+def rosh_hashana_table() -> bytes:
+    """Calculate the Rosh Hashana table.
+
+    The table has the absolute date numbers of Rosh Hashana as little-endian 32-bit
+    integers, followed by the year type codes as bytes, for the Jewish years 1 to
+    :py:data:`ROSH_HASHANA_TABLE_YEARS`.
+
+    Returns:
+        The table.
+    """
+    elapsed = [
+        _first_day_of_jewish_year(year)
+        for year in range(1, ROSH_HASHANA_TABLE_YEARS + 2)
+    ]
+
+    first_days = array('i')
+    year_types = array('B')
+    for year in range(1, ROSH_HASHANA_TABLE_YEARS + 1):
+        first_day = elapsed[year - 1] - JEWISH_EPOCH + 1
+        first_days.append(first_day)
+        year_types.append(
+            encode_year_type(
+                is_leap=is_jewish_leap(year),
+                days=elapsed[year] - elapsed[year - 1],
+                weekday=weekday_from_absdate(first_day),
+            ),
+        )
+
+    if sys.byteorder != 'little':  # pragma: no cover
+        first_days.byteswap()
+
+    return first_days.tobytes() + year_types.tobytes()
+
+
+def write_rosh_hashana_table(path: Path = ROSH_HASHANA_TABLE) -> None:
+    """Write the Rosh Hashana table.
+
+    Args:
+        path: The file to write to.
+    """
+    path.write_bytes(rosh_hashana_table())
+
+
+if __name__ == '__main__':  # pragma: no cover
+    write_rosh_hashana_table()
@@ -0,0 +1,245 @@
+"""Differential verification of a calendar engine against the reference algorithm.
+
+Every day in a span of Gregorian years is converted with the reference algorithm in
+:py:mod:`jewcal.utils.reference` and with the engine under test, and the Jewish
+dates and the events are compared. The work is split in chunks over a process pool.
+
+An engine is a module with the functions `absdate_to_jewish` and
+`jewish_to_absdate`, see :py:mod:`jewcal.utils.calculations`. It can have an
+`events(absdate, *, diaspora)` function returning an object with the attributes
+`shabbos`, `yomtov` and `action`. Without it, the events of the converted date are
+looked up with :py:meth:`Events.get`.
+
+This script can be invoked from the command line:
+    `python -m jewcal.verify --start-year 1 --end-year 9999`
+"""
+
+from __future__ import annotations
+
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import date
+from importlib import import_module
+from os import cpu_count
+from typing import TYPE_CHECKING, NamedTuple
+
+from .models.events import Events
+from .utils import reference
+from .utils.calculations import weekday_from_absdate
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence  # pragma: no cover
+    from types import ModuleType  # pragma: no cover
+
+DEFAULT_ENGINE = 'jewcal.utils.calculations'
+
+# Chunks per worker, to balance the load when chunks take a different time
+CHUNKS_PER_WORKER = 8
+
+
+class Mismatch(NamedTuple):
+    """A difference between the reference and the engine."""
+
+    absdate: int
+    """The absolute date number."""
+
+    check: str
+    """The name of the check."""
+
+    expected: object
+    """The result of the reference."""
+
+    actual: object
+    """The result of the engine."""
+
+    def __str__(self) -> str:
+        """Get the mismatch as a readable string.
+
+        Returns:
+            The mismatch.
+        """
+        return (
+            f'{date.fromordinal(self.absdate)} ({self.absdate}) {self.check}:'
+            f' expected {self.expected!r}, got {self.actual!r}'
+        )
+
+
+class Verification(NamedTuple):
+    """The result of a verification."""
+
+    checked: int
+    """The number of days checked."""
+
+    mismatches: list[Mismatch]
+    """The first mismatches, sorted by date."""
+
+
+def verify_chunk(engine: str, start: int, end: int, limit: int) -> Verification:
+    """Verify the engine for a chunk of days.
+
+    Args:
+        engine: The module name of the engine.
+        start: The first absolute date number.
+        end: The last absolute date number (inclusive).
+        limit: The maximum number of mismatches to report.
+
+    Returns:
+        The result of the verification.
+    """
+    module = import_module(engine)
+    events = getattr(module, 'events', None)
+
+    mismatches: list[Mismatch] = []
+    checked = 0
+    for absdate in range(start, end + 1):
+        if len(mismatches) >= limit:
+            break
+
+        mismatches.extend(_verify_day(module, events, absdate))
+        checked += 1
+
+    return Verification(checked, mismatches[:limit])
+
+
+def verify(
+    engine: str = DEFAULT_ENGINE,
+    start_year: int = 1,
+    end_year: int = 9999,
+    workers: int | None = None,
+    limit: int = 10,
+) -> Verification:
+    """Verify the engine for every day in a span of Gregorian years.
+
+    Args:
+        engine: The module name of the engine.
+        start_year: The first Gregorian year.
+        end_year: The last Gregorian year (inclusive).
+        workers: The number of processes, default is the number of CPUs. With 1 the
+            chunks are verified in this process.
+        limit: The maximum number of mismatches to report.
+
+    Returns:
+        The result of the verification.
+    """
+    workers = workers or cpu_count() or 1
+    start = date(start_year, 1, 1).toordinal()
+    end = date(end_year, 12, 31).toordinal()
+
+    size = max(1, -(-(end - start + 1) // (workers * CHUNKS_PER_WORKER)))
+    chunks = [
+        (engine, first, min(first + size - 1, end), limit)
+        for first in range(start, end + 1, size)
+    ]
+
+    if workers == 1:
+        results = [verify_chunk(*chunk) for chunk in chunks]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(verify_chunk, *chunk) for chunk in chunks]
+            results = [future.result() for future in as_completed(futures)]
+
+    mismatches = sorted(
+        (mismatch for result in results for mismatch in result.mismatches),
+        key=lambda mismatch: mismatch.absdate,
+    )
+
+    return Verification(sum(result.checked for result in results), mismatches[:limit])
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Verify an engine and print the first mismatches.
+
+    Args:
+        argv: The command line arguments, default is `sys.argv`.
+
+    Returns:
+        The exit code, 1 if there are mismatches.
+    """
+    parser = ArgumentParser(prog='python -m jewcal.verify', description=__doc__)
+    parser.add_argument('--engine', default=DEFAULT_ENGINE, help='the module name')
+    parser.add_argument('--start-year', type=int, default=1)
+    parser.add_argument('--end-year', type=int, default=9999)
+    parser.add_argument('--workers', type=int, help='default is the number of CPUs')
+    parser.add_argument('--limit', type=int, default=10, help='mismatches to report')
+    args = parser.parse_args(argv)
+
+    result = verify(
+        args.engine,
+        args.start_year,
+        args.end_year,
+        args.workers,
+        args.limit,
+    )
+
+    for mismatch in result.mismatches:
+        sys.stdout.write(f'{mismatch}\n')
+    sys.stdout.write(
+        f'{result.checked} days checked, {len(result.mismatches)} mismatches shown\n',
+    )
+
+    return 1 if result.mismatches else 0
+
+
+def _verify_day(
+    module: ModuleType,
+    events: Callable[..., object] | None,
+    absdate: int,
+) -> list[Mismatch]:
+    """Verify the engine for a day.
+
+    Args:
+        module: The engine.
+        events: The events function of the engine, `None` to look up the events.
+        absdate: The absolute date number.
+
+    Returns:
+        The mismatches of the day.
+    """
+    mismatches: list[Mismatch] = []
+
+    expected = reference.absdate_to_jewish(absdate)
+    actual = module.absdate_to_jewish(absdate)
+    if actual != expected:
+        mismatches.append(Mismatch(absdate, 'absdate_to_jewish', expected, actual))
+
+    inverse = module.jewish_to_absdate(*expected)
+    if inverse != absdate:
+        mismatches.append(Mismatch(absdate, 'jewish_to_absdate', absdate, inverse))
+
+    weekday = weekday_from_absdate(absdate)
+    for diaspora in (True, False):
+        expected_events = reference.events(
+            weekday,
+            expected[1],
+            expected[2],
+            diaspora=diaspora,
+        )
+        actual_events = _event_fields(
+            events(absdate, diaspora=diaspora)
+            if events
+            else Events.get(weekday, actual[1], actual[2], diaspora=diaspora),
+        )
+        if actual_events != expected_events:
+            mismatches.append(
+                Mismatch(
+                    absdate,
+                    'events' if diaspora else 'events_israel',
+                    expected_events,
+                    actual_events,
+                ),
+            )
+
+    return mismatches
+
+
+def _event_fields(events: object) -> tuple[object, object, object]:
+    return (
+        getattr(events, 'shabbos', None),
+        getattr(events, 'yomtov', None),
+        getattr(events, 'action', None),
+    )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
@@ -0,0 +1,326 @@
+"""Calculate the zmanim of many locations over a process pool.
+
+The locations and dates are split in work units, a unit calculates the zmanim of
+its locations with :py:meth:`jewcal.Zmanim.table`. The number of units is set by the
+number of workers: many locations are grouped, few locations are split in chunks of
+dates. The rows are yielded as the units finish, a unit is submitted when another
+finished, so the rows are not collected in memory.
+
+>>> from datetime import date
+
+>>> from jewcal.models.zmanim import Location
+>>> from jewcal.zmanim_batch import NamedLocation, zmanim_batch
+
+>>> antwerp = NamedLocation('Antwerp', Location(51.22047, 4.40026))
+>>> rows = zmanim_batch([antwerp], date(2024, 5, 31), date(2024, 6, 1), workers=1)
+>>> row = next(rows)
+>>> print(row['name'], row['date'], row['sunset'])
+Antwerp 2024-05-31 2024-05-31T19:47:48.502941+00:00
+
+This script can be invoked from the command line:
+    `jewcal zmanim-batch locations.csv --from 2024-01-01 --to 2025-01-01`
+"""
+
+from __future__ import annotations
+
+import csv
+import json
+import sys
+from argparse import ArgumentParser
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import date, timedelta
+from os import cpu_count
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple, TextIO
+
+from .models.zmanim import Location, Zmanim, ZmanimTable
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence  # pragma: no cover
+    from concurrent.futures import Future  # pragma: no cover
+
+    Row = dict[str, str | None]  # pragma: no cover
+
+# Units per worker, to balance the load when units take a different time
+CHUNKS_PER_WORKER = 8
+
+# Units submitted per worker before the rows of a finished unit are yielded
+PENDING_PER_WORKER = 2
+
+# The maximum rows of a unit, to bound the rows in memory
+MAX_ROWS_PER_UNIT = 4096
+
+FIELDS = ('name', 'date', *ZmanimTable._fields[1:])
+
+FORMATS = ('csv', 'jsonl')
+
+
+class NamedLocation(NamedTuple):
+    """A location with a name for the rows."""
+
+    name: str
+    """The name of the location, e.g. the community."""
+
+    location: Location
+    """The location to calculate the Zmanim for."""
+
+
+class WorkUnit(NamedTuple):
+    """Locations and dates calculated in one process."""
+
+    locations: tuple[NamedLocation, ...]
+    """The locations."""
+
+    start: date
+    """The first Gregorian date."""
+
+    end: date
+    """The Gregorian date to stop before."""
+
+
+def read_locations(lines: Iterable[str]) -> list[NamedLocation]:
+    """Read the locations of a CSV file.
+
+    The header has the columns `latitude` and `longitude`, and optionally `name`,
+    `use_tzeis_hakochavim`, `hadlokas_haneiros_minutes` and `tzeis_minutes`. A
+    location without a name is named by its line number.
+
+    Args:
+        lines: The lines of the file.
+
+    Returns:
+        The locations.
+
+    Raises:
+        ValueError: If a line is not a valid location.
+    """
+    locations: list[NamedLocation] = []
+    reader = csv.DictReader(lines)
+    for row in reader:
+        try:
+            location = Location(
+                float(row['latitude']),
+                float(row['longitude']),
+                use_tzeis_hakochavim=_boolean(row.get('use_tzeis_hakochavim') or '1'),
+                hadlokas_haneiros_minutes=int(
+                    row.get('hadlokas_haneiros_minutes') or '18',
+                ),
+                tzeis_minutes=int(row.get('tzeis_minutes') or '72'),
+            )
+        except (KeyError, TypeError, ValueError) as error:
+            msg = f'line {reader.line_num}: invalid location {row}'
+            raise ValueError(msg) from error
+
+        locations.append(
+            NamedLocation(row.get('name') or str(reader.line_num), location),
+        )
+
+    return locations
+
+
+def work_units(
+    locations: Sequence[NamedLocation],
+    start: date,
+    end: date,
+    workers: int,
+) -> list[WorkUnit]:
+    """Split the locations and dates in work units for the workers.
+
+    Args:
+        locations: The locations.
+        start: The first Gregorian date.
+        end: The Gregorian date to stop before.
+        workers: The number of processes.
+
+    Returns:
+        The units, every location and date is in one unit.
+    """
+    days = (end - start).days
+    if not locations or days <= 0:
+        return []
+
+    count = max(
+        workers * CHUNKS_PER_WORKER,
+        -(-len(locations) * days // MAX_ROWS_PER_UNIT),
+    )
+
+    if count <= len(locations):
+        size = -(-len(locations) // count)
+        return [
+            WorkUnit(tuple(locations[first : first + size]), start, end)
+            for first in range(0, len(locations), size)
+        ]
+
+    size = max(1, -(-days * len(locations) // count))
+    return [
+        WorkUnit(
+            (location,),
+            start + timedelta(days=first),
+            start + timedelta(days=min(first + size, days)),
+        )
+        for location in locations
+        for first in range(0, days, size)
+    ]
+
+
+def calculate(unit: WorkUnit) -> list[Row]:
+    """Calculate the zmanim of a work unit.
+
+    Args:
+        unit: The work unit.
+
+    Returns:
+        The rows, a row per location and date with the times in ISO format, `None`
+        if the sun does not reach the elevation of the zman.
+    """
+    rows: list[Row] = []
+    for name, location in unit.locations:
+        table = Zmanim.table(location, unit.start, unit.end)
+        for day, gregorian_date in enumerate(table.dates):
+            row: Row = {'name': name, 'date': gregorian_date.isoformat()}
+            for field, times in zip(FIELDS[2:], table[1:], strict=True):
+                time = times[day]
+                row[field] = time.isoformat() if time else None
+            rows.append(row)
+
+    return rows
+
+
+def zmanim_batch(
+    locations: Sequence[NamedLocation],
+    start: date,
+    end: date,
+    workers: int | None = None,
+) -> Iterator[Row]:
+    """Calculate the zmanim of the locations for the dates from start up to end.
+
+    Args:
+        locations: The locations.
+        start: The first Gregorian date.
+        end: The Gregorian date to stop before.
+        workers: The number of processes, default is the number of CPUs. With 1 the
+            units are calculated in this process.
+
+    Yields:
+        The rows of :py:func:`calculate`, in the order the units finish.
+    """
+    workers = workers or cpu_count() or 1
+    units = work_units(locations, start, end, workers)
+
+    if workers == 1:
+        for unit in units:
+            yield from calculate(unit)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending: set[Future[list[Row]]] = set()
+        for unit in units:
+            if len(pending) >= workers * PENDING_PER_WORKER:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from future.result()
+            pending.add(executor.submit(calculate, unit))
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield from future.result()
+
+
+def write(rows: Iterable[Row], output: TextIO, output_format: str = 'csv') -> int:
+    """Write the rows as they are calculated.
+
+    Args:
+        rows: The rows.
+        output: The text file.
+        output_format: `csv` with a header, or `jsonl` for a JSON object per line.
+
+    Returns:
+        The number of rows.
+
+    Raises:
+        ValueError: If the format is unknown.
+    """
+    if output_format not in FORMATS:
+        msg = f'unknown format {output_format!r}, use one of {FORMATS}'
+        raise ValueError(msg)
+
+    count = 0
+    if output_format == 'csv':
+        writer = csv.DictWriter(output, FIELDS, lineterminator='\n')
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+    else:
+        for row in rows:
+            output.write(f'{json.dumps(row)}\n')
+            count += 1
+
+    return count
+
+
+def add_date_range(parser: ArgumentParser, example: str) -> None:
+    """Add the arguments `--from` and `--to` of the span of dates.
+
+    The dates are parsed to `start` and `end`.
+
+    Args:
+        parser: The parser of the command line arguments.
+        example: An example of the first date for the help.
+    """
+    parser.add_argument(
+        '--from',
+        dest='start',
+        type=date.fromisoformat,
+        required=True,
+        help=f'the first date, e.g. {example}',
+    )
+    parser.add_argument(
+        '--to',
+        dest='end',
+        type=date.fromisoformat,
+        required=True,
+        help='the date to stop before',
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Calculate the zmanim of the locations of a CSV file.
+
+    Args:
+        argv: The command line arguments, default is `sys.argv`.
+
+    Returns:
+        The exit code.
+    """
+    parser = ArgumentParser(prog='jewcal zmanim-batch', description=__doc__)
+    parser.add_argument('locations', help='the CSV file of the locations, - for stdin')
+    add_date_range(parser, '2024-01-01')
+    parser.add_argument('--format', choices=FORMATS, default='csv')
+    parser.add_argument('--workers', type=int, help='default is the number of CPUs')
+    parser.add_argument('--output', help='the file, default is stdout')
+    args = parser.parse_args(argv)
+
+    if args.locations == '-':
+        locations = read_locations(sys.stdin)
+    else:
+        with Path(args.locations).open(newline='', encoding='utf-8') as file:
+            locations = read_locations(file)
+
+    rows = zmanim_batch(locations, args.start, args.end, args.workers)
+    if args.output:
+        with Path(args.output).open('w', newline='', encoding='utf-8') as output:
+            write(rows, output, args.format)
+    else:
+        write(rows, sys.stdout, args.format)
+
+    return 0
+
+
+def _boolean(value: str) -> bool:
+    return value.strip().lower() in {'1', 'true', 'yes'}
+
+
+if __name__ == '__main__':  # pragma: no cover
+    sys.exit(main())
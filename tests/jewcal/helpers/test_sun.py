@@ -1,9 +1,18 @@
 """Unit tests for jewcal.helpers.sun."""
 
-from datetime import date, datetime, timezone
+from collections import Counter
+from datetime import date, datetime, timedelta, timezone
+from typing import Any
 from unittest import TestCase
+from unittest.mock import patch
 
-from src.jewcal.helpers.sun import Sun, SunEvent
+import astral.sun
+from astral import Observer, SunDirection
+
+import src.jewcal.helpers.sun
+from src.jewcal.helpers.sun import SolarDay, SolarSpan, Sun, SunEvent
+
+TRIGONOMETRY = ('sin', 'cos', 'tan', 'asin', 'acos')
 
 
 class SunTestCase(TestCase):
@@ -41,3 +50,145 @@ class SunTestCase(TestCase):
             expected_tzeis_hakochavim,
             sun.deg_below_horizon(8.5, SunEvent.SET),
         )
+
+    def test_deg_below_horizon_never(self) -> None:
+        """The sun does not reach the elevation in the summer near the pole."""
+        sun = Sun(date(2024, 6, 21), 59.9139, 10.7522)  # Oslo
+
+        with self.assertRaises(ValueError):
+            sun.deg_below_horizon(-8.5, SunEvent.SET)
+
+
+class SolarDayTestCase(TestCase):
+    """Unit tests for SolarDay."""
+
+    def test_equals_astral(self) -> None:
+        """The times are equal to the times of `Astral`."""
+        locations = ((51.22047, 4.40026), (31.7683, 35.2137), (-33.8688, 151.2093))
+        for days in range(0, 3650, 37):
+            date_ = date(2020, 1, 1) + timedelta(days=days)
+            for lat, lon in locations:
+                observer = Observer(lat, lon)
+                solar_day = SolarDay(date_, lat, lon)
+                with self.subTest(date=date_, lat=lat, lon=lon):
+                    self.assertEqual(
+                        solar_day.sunrise(),
+                        astral.sun.sunrise(observer, date_),
+                    )
+                    self.assertEqual(
+                        solar_day.sunset(),
+                        astral.sun.sunset(observer, date_),
+                    )
+                    self.assertEqual(
+                        solar_day.at_elevation(-8.5, SunEvent.SET),
+                        astral.sun.time_at_elevation(
+                            observer,
+                            -8.5,
+                            date_,
+                            SunDirection.SETTING,
+                        ),
+                    )
+
+    def test_polar_night(self) -> None:
+        """There is no sunrise in the winter near the pole."""
+        solar_day = SolarDay(date(2024, 12, 21), 78.2232, 15.6267)  # Longyearbyen
+
+        with self.assertRaises(ValueError):
+            solar_day.sunrise()
+        with self.assertRaises(ValueError):
+            solar_day.sunset()
+
+    def test_trigonometry(self) -> None:
+        """The sun events of `Zmanim` need 3 times fewer trigonometric evaluations.
+
+        `Astral` calculates all the sun events of the day, and repeats the position
+        of the sun for every event.
+        """
+        lat, lon = 51.22047, 4.40026
+        date_ = date(2024, 6, 1)
+        observer = Observer(lat, lon)
+
+        with _CountTrigonometry(astral.sun) as counter:
+            astral.sun.sun(observer, date_)
+            astral.sun.time_at_elevation(observer, -8.5, date_, SunDirection.SETTING)
+        astral_count = counter.total()
+
+        with _CountTrigonometry(src.jewcal.helpers.sun) as counter:
+            sun = Sun(date_, lat, lon)
+            sun.deg_below_horizon(-8.5, SunEvent.SET)
+        count = counter.total()
+
+        self.assertGreaterEqual(astral_count, 3 * count)
+
+
+class SolarSpanTestCase(TestCase):
+    """Unit tests for SolarSpan."""
+
+    def test_equals_solar_day(self) -> None:
+        """The times are within a tenth of a second of `SolarDay`."""
+        start = date(2024, 1, 1)
+        locations = (
+            (51.22047, 4.40026),  # Antwerp
+            (-33.8688, 151.2093),  # Sydney
+            (21.3069, -157.8583),  # Honolulu
+            (64.1466, -21.9426),  # Reykjavik
+            (78.2232, 15.6267),  # Longyearbyen
+        )
+        for lat, lon in locations:
+            span = SolarSpan(start, 366, lat, lon)
+            columns = {
+                'sunrise': span.sunrise(),
+                'sunset': span.sunset(),
+                'at_elevation': span.at_elevation(-8.5, SunEvent.SET),
+            }
+            for name, times in columns.items():
+                self.assertEqual(len(times), 366)
+                for day, time in enumerate(times):
+                    solar_day = SolarDay(start + timedelta(days=day), lat, lon)
+                    with self.subTest(lat=lat, name=name, day=day):
+                        try:
+                            if name == 'at_elevation':
+                                expected = solar_day.at_elevation(-8.5, SunEvent.SET)
+                            else:
+                                expected = getattr(solar_day, name)()
+                        except ValueError:
+                            self.assertIsNone(time)
+                            continue
+
+                        self.assertIsNotNone(time)
+                        assert time is not None  # noqa: S101
+                        self.assertLessEqual(
+                            abs(time - expected),
+                            timedelta(seconds=0.1),
+                        )
+
+    def test_empty(self) -> None:
+        """A span of no dates has no times."""
+        self.assertEqual(SolarSpan(date(2024, 1, 1), 0, 51.22, 4.4).sunrise(), [])
+
+
+class _CountTrigonometry:
+    """Count the calls of the trigonometric functions of a module."""
+
+    def __init__(self, module: Any) -> None:  # noqa: ANN401
+        self.counter: Counter[str] = Counter()
+        self.patches = [
+            patch.object(module, name, self._counted(name, getattr(module, name)))
+            for name in TRIGONOMETRY
+        ]
+
+    def _counted(self, name: str, function: Any) -> Any:  # noqa: ANN401
+        def counted(x: float) -> float:
+            self.counter[name] += 1
+            return float(function(x))
+
+        return counted
+
+    def __enter__(self) -> Counter[str]:
+        for trig_patch in self.patches:
+            trig_patch.start()
+        return self.counter
+
+    def __exit__(self, *args: object) -> None:
+        for trig_patch in self.patches:
+            trig_patch.stop()
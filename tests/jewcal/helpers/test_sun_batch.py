@@ -0,0 +1,260 @@
+"""Unit tests for jewcal.helpers.sun_batch."""
+
+from collections.abc import Sequence
+from datetime import date, datetime, timedelta
+from doctest import DocTestSuite
+from typing import Any, no_type_check
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from src.jewcal.helpers import sun_batch
+from src.jewcal.helpers.sun import SolarDay, Sun, SunEvent
+from src.jewcal.models.zmanim import TZEIS_HAKOCHAVIM, Location, Zmanim
+
+TOLERANCE = timedelta(milliseconds=1)
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.helpers.sun_batch.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.helpers.sun_batch'))
+    return tests
+
+
+class SunBatchTestCase(TestCase):
+    """Unit tests for sun_batch."""
+
+    def setUp(self) -> None:
+        """Initialize."""
+        start = date(2024, 1, 1).toordinal()
+        self.ordinals = np.arange(start, start + 366, 11)
+        self.locations = [
+            Location(latitude=51.22047, longitude=4.40026),  # Antwerp
+            Location(latitude=31.7683, longitude=35.2137),  # Jerusalem
+            Location(latitude=-33.8688, longitude=151.2093),  # Sydney
+            Location(latitude=40.7128, longitude=-74.0060),  # New York
+            Location(latitude=64.1466, longitude=-21.9426),  # Reykjavik
+            Location(latitude=-54.8019, longitude=-68.3030),  # Ushuaia
+            Location(latitude=21.3069, longitude=-157.8583),  # Honolulu
+            Location(latitude=69.6492, longitude=18.9553),  # Tromso
+        ]
+        self.latitudes = [location.latitude for location in self.locations]
+        self.longitudes = [location.longitude for location in self.locations]
+
+    def assert_times_almost_equal(
+        self,
+        times: Sequence[Any],
+        expected: dict[tuple[int, int], datetime | None],
+    ) -> None:
+        """Assert the times are within the tolerance of the expected times.
+
+        Args:
+            times: The times of the batch.
+            expected: The expected times by row and column.
+        """
+        for (day, location), expected_time in expected.items():
+            with self.subTest(day=day, location=location):
+                time = sun_batch.to_datetime(times[day][location])
+                if expected_time is None:
+                    self.assertIsNone(time)
+                else:
+                    self.assertIsNotNone(time)
+                    assert time is not None  # noqa: S101
+                    self.assertLessEqual(abs(time - expected_time), TOLERANCE)
+
+    def _expected(
+        self,
+        event: str,
+        elevation: float | None = None,
+    ) -> dict[tuple[int, int], datetime | None]:
+        """Get the expected times of `Sun`.
+
+        Args:
+            event: The attribute of `Sun`, `None` if the sun does not reach it.
+            elevation: The elevation for `SolarDay.at_elevation`.
+
+        Returns:
+            The expected times by row and column.
+        """
+        expected: dict[tuple[int, int], datetime | None] = {}
+        for day, ordinal in enumerate(self.ordinals):
+            for column, (lat, lon) in enumerate(
+                zip(self.latitudes, self.longitudes, strict=True),
+            ):
+                expected[day, column] = _sun_event(
+                    date.fromordinal(int(ordinal)),
+                    lat,
+                    lon,
+                    event,
+                    elevation,
+                )
+
+        return expected
+
+    def test_sunrise_sunset(self) -> None:
+        """Sunrise and sunset are within a millisecond of `Sun`."""
+        self.assert_times_almost_equal(
+            sun_batch.sunrise(self.ordinals, self.latitudes, self.longitudes),
+            self._expected('sunrise'),
+        )
+        self.assert_times_almost_equal(
+            sun_batch.sunset(self.ordinals, self.latitudes, self.longitudes),
+            self._expected('sunset'),
+        )
+
+    def test_at_elevation(self) -> None:
+        """Tzeis Hakochavim is within a millisecond of `Sun`."""
+        times = sun_batch.at_elevation(
+            self.ordinals,
+            self.latitudes,
+            self.longitudes,
+            TZEIS_HAKOCHAVIM,
+            sun_batch.SunEvent.SET,
+        )
+        self.assert_times_almost_equal(
+            times,
+            self._expected('tzeis_hakochavim', TZEIS_HAKOCHAVIM),
+        )
+
+    def test_zmanim(self) -> None:
+        """The zmanim are within a millisecond of `Zmanim`."""
+        batch = sun_batch.zmanim(self.ordinals, self.locations)
+
+        for day, ordinal in enumerate(self.ordinals):
+            for column, location in enumerate(self.locations):
+                try:
+                    expected = Zmanim(
+                        date.fromordinal(int(ordinal)),
+                        location,
+                        set_hadlokas_haneiros=True,
+                    ).to_dict()
+                except ValueError:
+                    continue
+
+                zmanim = batch.to_dict(day, column)
+                self.assertEqual(zmanim.keys(), expected.keys())
+                for name, time in zmanim.items():
+                    with self.subTest(ordinal=ordinal, column=column, name=name):
+                        self.assertIsNotNone(time)
+                        self.assertLessEqual(
+                            abs(
+                                datetime.fromisoformat(str(time))
+                                - datetime.fromisoformat(str(expected[name])),
+                            ),
+                            TOLERANCE,
+                        )
+
+    def test_polar(self) -> None:
+        """The sun does not rise or set in the winter and summer near the pole."""
+        ordinals = [date(2024, 12, 21).toordinal(), date(2024, 6, 21).toordinal()]
+        latitudes, longitudes = [78.2232], [15.6267]  # Longyearbyen
+
+        rise = sun_batch.sunrise(ordinals, latitudes, longitudes)
+        self.assertTrue(np.isnat(rise).all())
+
+        batch = sun_batch.zmanim(ordinals, [Location(78.2232, 15.6267)])
+        self.assertEqual(set(batch.to_dict(0, 0).values()), {None})
+
+    def test_grid(self) -> None:
+        """The times have a row per date and a column per location."""
+        batch = sun_batch.zmanim(self.ordinals, self.locations)
+        for times in batch:
+            self.assertEqual(
+                np.shape(times),
+                (len(self.ordinals), len(self.locations)),
+            )
+
+    def test_without_numpy(self) -> None:
+        """Without NumPy the sun events are calculated one by one."""
+        self.ordinals = self.ordinals[:6]
+
+        with patch.object(sun_batch, 'HAS_NUMPY', new=False):
+            rise = sun_batch.sunrise(self.ordinals, self.latitudes, self.longitudes)
+            self.assertIsInstance(rise, list)
+            self.assert_times_almost_equal(rise, self._expected('sunrise'))
+
+            self.assert_times_almost_equal(
+                sun_batch.sunset(self.ordinals, self.latitudes, self.longitudes),
+                self._expected('sunset'),
+            )
+            self.assert_times_almost_equal(
+                sun_batch.at_elevation(
+                    self.ordinals,
+                    self.latitudes,
+                    self.longitudes,
+                    TZEIS_HAKOCHAVIM,
+                    sun_batch.SunEvent.SET,
+                ),
+                self._expected('tzeis_hakochavim', TZEIS_HAKOCHAVIM),
+            )
+
+            batch = sun_batch.zmanim(self.ordinals, self.locations)
+            self.assertIsInstance(batch.sunrise, list)
+            self.assertEqual(
+                batch.to_dict(0, 0),
+                Zmanim(
+                    date.fromordinal(int(self.ordinals[0])),
+                    self.locations[0],
+                    set_hadlokas_haneiros=True,
+                ).to_dict(),
+            )
+
+    def test_high_latitude(self) -> None:
+        """A zman the sun does not reach is `None`, the other zmanim are set."""
+        ordinals = [date(2024, 6, 21).toordinal()]
+        helsinki = Location(latitude=60.1699, longitude=24.9384)
+
+        numpy_batch = sun_batch.zmanim(ordinals, [helsinki])
+        with patch.object(sun_batch, 'HAS_NUMPY', new=False):
+            lists_batch = sun_batch.zmanim(ordinals, [helsinki])
+
+        for batch in (numpy_batch, lists_batch):
+            values = batch.to_dict(0, 0)
+            self.assertIsNone(values.pop('tzeis_hakochavim'))
+            self.assertNotIn(None, values.values())
+
+        for name in sun_batch.ZmanimBatch._fields:
+            with self.subTest(name=name):
+                expected = getattr(numpy_batch, name)[0][0]
+                self.assert_times_almost_equal(
+                    getattr(lists_batch, name),
+                    {(0, 0): sun_batch.to_datetime(expected)},
+                )
+
+
+def _sun_event(
+    date_: date,
+    lat: float,
+    lon: float,
+    event: str,
+    elevation: float | None,
+) -> datetime | None:
+    """Get the time of a sun event of `Sun`.
+
+    Args:
+        date_: The date.
+        lat: The latitude.
+        lon: The longitude.
+        event: The attribute of `Sun`.
+        elevation: The elevation for `SolarDay.at_elevation` at sunset.
+
+    Returns:
+        The time, `None` if the sun does not reach it.
+    """
+    try:
+        if elevation is not None:
+            return SolarDay(date_, lat, lon).at_elevation(elevation, SunEvent.SET)
+        time: datetime = getattr(Sun(date_, lat, lon), event)
+    except ValueError:
+        return None
+
+    return time
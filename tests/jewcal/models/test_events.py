@@ -2,8 +2,9 @@
 
 from unittest import TestCase
 
-from src.jewcal.constants import SHABBOS, YOMTOV, YOMTOV_ISRAEL, Action
+from src.jewcal.constants import SHABBOS, YOMTOV, YOMTOV_ISRAEL, Action, EventKind
 from src.jewcal.models.events import Events
+from src.jewcal.utils.calculations import keviah, year_type
 
 # ruff: noqa: SLF001
 # pylint: disable=W0212
@@ -460,3 +461,141 @@ class EventsTestCase(TestCase):
         self.assertTrue(events.yomtov, YOMTOV_ISRAEL[1][16].title)
         self.assertTrue(events.action, YOMTOV_ISRAEL[1][16].action)
         self.assertFalse(events._is_issur_melacha())
+
+
+class EventsGetTestCase(TestCase):
+    """Unittests for the shared Events of `Events.get`."""
+
+    def test_get(self) -> None:
+        """The shared events equal the created events."""
+        for diaspora in (True, False):
+            for month in range(1, 14):
+                for day in range(1, 31):
+                    for weekday in range(7):
+                        with self.subTest(
+                            weekday=weekday,
+                            month=month,
+                            day=day,
+                            diaspora=diaspora,
+                        ):
+                            self.assertEqual(
+                                Events.get(weekday, month, day, diaspora=diaspora),
+                                Events(weekday, month, day, diaspora),
+                            )
+
+    def test_get_shared(self) -> None:
+        """The same events are the same object."""
+        # Erev Shabbos
+        self.assertIs(
+            Events.get(5, 3, 15, diaspora=True),
+            Events.get(5, 8, 10, diaspora=False),
+        )
+        # Pesach 1 on Shabbos
+        self.assertIs(
+            Events.get(6, 1, 15, diaspora=True),
+            Events.get(6, 1, 15, diaspora=True),
+        )
+
+    def test_frozen(self) -> None:
+        """Events are immutable and hashable."""
+        events = Events(6, 1, 15, diaspora=True)
+        with self.assertRaises(AttributeError):
+            events.action = None  # type: ignore[misc]
+
+        self.assertEqual(hash(events), hash(Events(6, 1, 15, diaspora=True)))
+        self.assertFalse(hasattr(events, '__dict__'))
+
+
+class EventKindTestCase(TestCase):
+    """Unittests for the EventKind of Events."""
+
+    def test_kind(self) -> None:
+        """Test the kind of the events."""
+        # Erev Shabbos, Erev Pesach
+        events = Events(5, 1, 14, diaspora=True)
+        self.assertEqual(
+            events.kind,
+            EventKind.EREV_SHABBOS | EventKind.EREV_YOMTOV | EventKind.CANDLES,
+        )
+
+        # Shabbos, Pesach 1
+        events = Events(6, 1, 15, diaspora=True)
+        self.assertEqual(
+            events.kind,
+            EventKind.SHABBOS
+            | EventKind.YOMTOV
+            | EventKind.CANDLES
+            | EventKind.ISSUR_MELACHA,
+        )
+
+        # Chol HaMoed
+        self.assertEqual(Events(2, 1, 17, diaspora=True).kind, EventKind.CHOL_HAMOED)
+        self.assertEqual(Events(2, 1, 13, diaspora=True).kind, EventKind(0))
+
+    def test_kind_equals_titles(self) -> None:
+        """The predicates of the kind equal the predicates of the titles."""
+        for diaspora in (True, False):
+            for month in range(1, 14):
+                for day in range(1, 31):
+                    for weekday in range(7):
+                        events = Events(weekday, month, day, diaspora)
+                        with self.subTest(events=events):
+                            self.assertEqual(
+                                (
+                                    events._is_erev_shabbos(),
+                                    events._is_shabbos(),
+                                    events._is_erev_yomtov(),
+                                    events._is_yomtov(),
+                                    events._is_erev(),
+                                    events._is_issur_melacha(),
+                                ),
+                                _title_predicates(events),
+                            )
+
+    def test_kind_of(self) -> None:
+        """The kind of the template events equals the kind of the shared events."""
+        for code in {year_type(year) for year in range(5700, 5800)}:
+            template = keviah(code)
+            for diaspora, events in (
+                (True, template.events),
+                (False, template.events_israel),
+            ):
+                for day_of_year, (shabbos, yomtov) in enumerate(events):
+                    month, day = template.dates[day_of_year]
+                    weekday = template.weekdays[day_of_year]
+                    with self.subTest(code=code, diaspora=diaspora, day=day_of_year):
+                        self.assertEqual(
+                            Events.kind_of(shabbos, yomtov),
+                            Events.get(weekday, month, day, diaspora=diaspora).kind,
+                        )
+
+
+def _title_predicates(events: Events) -> tuple[bool, ...]:
+    """The predicates of events found in the titles."""
+    shabbos, yomtov = events.shabbos or '', events.yomtov or ''
+
+    is_erev_shabbos = 'Erev' in shabbos
+    is_shabbos = bool(shabbos) and not is_erev_shabbos
+    is_erev_yomtov = any(
+        title in yomtov for title in ('Erev', 'Hoshana Rabba', 'Pesach 6')
+    )
+    is_chol_hamoed = 'Chol HaMoed' in yomtov
+    is_yomtov = bool(yomtov) and not is_erev_yomtov and not is_chol_hamoed
+    is_erev = events.action == Action.CANDLES.value and any(
+        [
+            is_erev_shabbos and not yomtov,
+            not shabbos and is_erev_yomtov,
+            is_erev_shabbos and is_erev_yomtov,
+            is_erev_shabbos and is_chol_hamoed,
+        ],
+    )
+    is_issur_melacha = events.action is not None and not is_erev
+
+    return (
+        is_erev_shabbos,
+        is_shabbos,
+        is_erev_yomtov,
+        is_yomtov,
+        is_erev,
+        is_issur_melacha,
+    )
@@ -1,9 +1,16 @@
 """Unittests for jewcal.models.jewish_date."""
 
+import subprocess
+import sys
 from datetime import date
 from unittest import TestCase
 
-from src.jewcal.models.jewish_date import JewishDate, Month
+from src.jewcal.models.jewish_date import (
+    JewishDate,
+    Month,
+    from_jewish,
+    from_jewish_bulk,
+)
 
 
 class MonthTestCase(TestCase):
@@ -24,6 +31,24 @@ class MonthTestCase(TestCase):
         self.assertEqual(Month.get(12, is_leap=True), Month.ADAR_1)
         self.assertEqual(Month.get(13, is_leap=True), Month.ADAR_2)
 
+    def test_month_enum_member_to_number(self) -> None:
+        """Test month enum member to number."""
+        # non-leap year
+        self.assertEqual(Month.NISAN.to_number(is_leap=False), 1)
+        self.assertEqual(Month.ADAR.to_number(is_leap=False), 12)
+        self.assertEqual(Month.ADAR_1.to_number(is_leap=False), 12)
+        self.assertEqual(Month.ADAR_2.to_number(is_leap=False), 12)
+
+        # leap year
+        self.assertEqual(Month.NISAN.to_number(is_leap=True), 1)
+        self.assertEqual(Month.ADAR.to_number(is_leap=True), 12)
+        self.assertEqual(Month.ADAR_1.to_number(is_leap=True), 12)
+        self.assertEqual(Month.ADAR_2.to_number(is_leap=True), 13)
+
+        for number in (1, 7, 12, 13):
+            month = Month.get(number, is_leap=True)
+            self.assertEqual(month.to_number(is_leap=True), number)
+
 
 class JewishDateTestCase(TestCase):
     """Unittests for JewishDate."""
@@ -49,3 +74,102 @@ class JewishDateTestCase(TestCase):
 
         date_ = JewishDate(5784, 13, 1, date(2024, 3, 11), _is_leap_year=True)
         self.assertEqual(str(date_), '1 Adar 2 5784')
+
+    def test_from_jewish(self) -> None:
+        """Test a Jewish date from the year, month and day."""
+        date_ = JewishDate.from_jewish(5782, Month.ADAR_2, 13)
+        self.assertEqual(
+            date_,
+            JewishDate(5782, 13, 13, date(2022, 3, 16), _is_leap_year=True),
+        )
+        self.assertEqual(str(date_), '13 Adar 2 5782')
+
+    def test_to_gregorian(self) -> None:
+        """Test the Jewish date to a Gregorian date."""
+        date_ = JewishDate(5784, 13, 1, date(2024, 3, 11), _is_leap_year=True)
+        self.assertEqual(date_.to_gregorian(), date(2024, 3, 11))
+
+        # the stored date is returned, not converted again
+        date_ = JewishDate(5784, 14, 1, date(2024, 2, 10), _is_leap_year=True)
+        self.assertIs(date_.to_gregorian(), date_.gregorian_date)
+
+    def test_frozen(self) -> None:
+        """A Jewish date is immutable and hashable."""
+        date_ = JewishDate(5784, 13, 1, date(2024, 3, 11), _is_leap_year=True)
+        with self.assertRaises(AttributeError):
+            date_.day = 2  # type: ignore[misc]
+
+        self.assertIn(date_, {JewishDate.from_jewish(5784, Month.ADAR_2, 1)})
+        self.assertFalse(hasattr(date_, '__dict__'))
+
+
+class FromJewishTestCase(TestCase):
+    """Unittests for the conversion from Jewish to Gregorian dates."""
+
+    def test_from_jewish(self) -> None:
+        """Test a Jewish date to a Gregorian date."""
+        self.assertEqual(from_jewish(5782, 1, 15), date(2022, 4, 16))
+        self.assertEqual(from_jewish(5785, Month.TISHREI, 1), date(2024, 10, 3))
+
+        # leap year
+        self.assertEqual(from_jewish(5782, Month.ADAR_1, 26), date(2022, 2, 27))
+        self.assertEqual(from_jewish(5782, Month.ADAR, 26), date(2022, 2, 27))
+        self.assertEqual(from_jewish(5782, Month.ADAR_2, 13), date(2022, 3, 16))
+
+        # non-leap year
+        self.assertEqual(from_jewish(5783, Month.ADAR, 22), date(2023, 3, 15))
+        self.assertEqual(from_jewish(5783, Month.ADAR_2, 22), date(2023, 3, 15))
+
+    def test_from_jewish_day_not_in_month(self) -> None:
+        """A day outside of the month raises an error."""
+        with self.assertRaises(ValueError):
+            from_jewish(5784, Month.CHESHVAN, 30)  # short Cheshvan
+
+        with self.assertRaises(ValueError):
+            from_jewish(5784, Month.TISHREI, 0)
+
+        with self.assertRaises(ValueError):
+            from_jewish_bulk([(5784, Month.CHESHVAN, 30)])
+
+    def test_from_jewish_month_not_a_month(self) -> None:
+        """A month that is not a month raises an error."""
+        for month in (0, 15):
+            with self.subTest(month=month):
+                with self.assertRaises(ValueError):
+                    from_jewish(5784, month, 1)
+
+                with self.assertRaises(ValueError):
+                    JewishDate.from_jewish(5784, month, 1)
+
+                with self.assertRaises(ValueError):
+                    from_jewish_bulk([(5784, month, 1)])
+
+    def test_from_jewish_bulk(self) -> None:
+        """Test Jewish dates to Gregorian dates."""
+        dates = [
+            (5782, Month.NISAN, 15),
+            (5782, Month.ADAR_1, 26),
+            (5782, Month.ADAR_2, 13),
+            (5783, Month.ADAR_2, 22),
+        ]
+
+        self.assertEqual(
+            from_jewish_bulk(dates),
+            [from_jewish(year, month, day) for year, month, day in dates],
+        )
+        self.assertEqual(from_jewish_bulk([]), [])
+
+    def test_import_without_numpy(self) -> None:
+        """Importing the calendar does not import NumPy of the bulk conversion."""
+        result = subprocess.run(
+            [
+                sys.executable,
+                '-c',
+                'import sys, src.jewcal; print("numpy" in sys.modules)',
+            ],
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+        self.assertEqual(result.stdout.strip(), 'False')
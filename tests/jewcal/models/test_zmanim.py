@@ -1,10 +1,16 @@
 """Unit tests for jewcal.models.zmanim."""
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from unittest import TestCase
 from unittest.mock import Mock, patch
 
-from src.jewcal.models.zmanim import Location, Zmanim
+from src.jewcal.helpers.sun import SolarDay, Sun
+from src.jewcal.models.zmanim import (
+    SUN_EVENTS_CACHE,
+    Location,
+    Zmanim,
+    ZmanimTable,
+)
 
 
 class ZmanimTestCase(TestCase):
@@ -140,3 +146,221 @@ class ZmanimTestCase(TestCase):
                 use_tzeis_hakochavim=location.use_tzeis_hakochavim,
             ),
         )
+
+    def test_slots(self) -> None:
+        """Zmanim have no instance dictionary."""
+        location = Location(latitude=51.22047, longitude=4.40026)  # Antwerp
+        zmanim = Zmanim(date(2024, 5, 31), location)
+        self.assertFalse(hasattr(zmanim, '__dict__'))
+
+    def test_cache(self) -> None:
+        """The sun events of a date and coordinates are calculated once."""
+        SUN_EVENTS_CACHE.clear()
+        antwerp = Location(latitude=51.22047, longitude=4.40026)
+        minutes = Location(
+            latitude=51.22047,
+            longitude=4.40026,
+            use_tzeis_hakochavim=False,
+            tzeis_minutes=50,
+        )
+
+        with patch(
+            'src.jewcal.models.zmanim.Sun',
+            side_effect=Sun,
+        ) as sun:
+            first = Zmanim(date(2024, 5, 31), antwerp)
+            second = Zmanim(date(2024, 5, 31), minutes, set_hadlokas_haneiros=True)
+            Zmanim(date(2024, 6, 1), antwerp)
+
+        self.assertEqual(sun.call_count, 2)
+        self.assertEqual(SUN_EVENTS_CACHE.info().hits, 1)
+        self.assertEqual(first.sunset, second.sunset)
+        self.assertEqual(
+            second.tzeis_minutes,
+            datetime(2024, 5, 31, 20, 37, 48, 504226, tzinfo=timezone.utc),
+        )
+
+        SUN_EVENTS_CACHE.clear()
+        self.assertEqual(SUN_EVENTS_CACHE.info().currsize, 0)
+
+    def test_extra_zmanim(self) -> None:
+        """The extra zmanim are the GRA, Magen Avraham and degree based zmanim."""
+        jerusalem = Location(latitude=31.7683, longitude=35.2137)
+        zmanim = Zmanim(date(2024, 5, 31), jerusalem)
+
+        utc = timezone.utc
+        self.assertEqual(
+            zmanim.alos_hashachar,
+            datetime(2024, 5, 31, 1, 8, 51, 66486, tzinfo=utc),
+        )
+        self.assertEqual(
+            zmanim.misheyakir,
+            datetime(2024, 5, 31, 1, 36, 0, 629149, tzinfo=utc),
+        )
+        self.assertEqual(
+            zmanim.sof_zman_shema_mga,
+            datetime(2024, 5, 31, 5, 29, 56, 828914, tzinfo=utc),
+        )
+        self.assertEqual(
+            zmanim.sof_zman_shema_gra,
+            datetime(2024, 5, 31, 6, 5, 56, 828914, tzinfo=utc),
+        )
+        self.assertEqual(
+            zmanim.sof_zman_tefila_mga,
+            datetime(2024, 5, 31, 6, 52, 18, 625058, tzinfo=utc),
+        )
+        self.assertEqual(
+            zmanim.sof_zman_tefila_gra,
+            datetime(2024, 5, 31, 7, 16, 18, 625058, tzinfo=utc),
+        )
+        self.assertEqual(
+            zmanim.chatzos,
+            datetime(2024, 5, 31, 9, 37, 2, 217346, tzinfo=utc),
+        )
+        self.assertEqual(
+            zmanim.mincha_gedola,
+            datetime(2024, 5, 31, 10, 12, 13, 115418, tzinfo=utc),
+        )
+        self.assertEqual(
+            zmanim.mincha_ketana,
+            datetime(2024, 5, 31, 13, 43, 18, 503850, tzinfo=utc),
+        )
+        self.assertAlmostEqual(
+            zmanim.sunset - zmanim.chatzos,
+            zmanim.chatzos - zmanim.sunrise,
+            delta=timedelta(microseconds=1),
+        )
+
+    def test_extra_zmanim_lazy(self) -> None:
+        """The degree based zmanim share the position of the sun of the sun events."""
+        SUN_EVENTS_CACHE.clear()
+        antwerp = Location(latitude=51.22047, longitude=4.40026)
+
+        with (
+            patch('src.jewcal.models.zmanim.Sun', side_effect=Sun) as sun,
+            patch.object(
+                SolarDay,
+                'at_elevation',
+                autospec=True,
+                side_effect=SolarDay.at_elevation,
+            ) as at_elevation,
+        ):
+            zmanim = Zmanim(date(2024, 3, 1), antwerp)
+            self.assertEqual((sun.call_count, at_elevation.call_count), (1, 1))
+
+            self.assertLess(zmanim.alos_hashachar, zmanim.misheyakir)
+            self.assertEqual((sun.call_count, at_elevation.call_count), (1, 3))
+
+            again = Zmanim(date(2024, 3, 1), antwerp)
+            self.assertEqual(again.misheyakir, zmanim.misheyakir)
+            self.assertEqual(sun.call_count, 1)
+
+        self.assertNotIn('alos_hashachar', zmanim.to_dict())
+        SUN_EVENTS_CACHE.clear()
+
+    def test_evening(self) -> None:
+        """The evening of a date is on the date in the local mean time."""
+        antwerp = Location(latitude=51.22047, longitude=4.40026)
+        zmanim = Zmanim(date(2024, 6, 7), antwerp)
+        self.assertEqual(
+            Zmanim.evening(antwerp, date(2024, 6, 7)),
+            (zmanim.sunset, zmanim.tzeis_hakochavim),
+        )
+
+        # Friday 20:25 and 21:15 EDT, the sunset on the date in UTC is of Thursday
+        new_york = Location(latitude=40.71427, longitude=-74.00597)
+        utc = timezone.utc
+        self.assertEqual(
+            Zmanim.evening(new_york, date(2024, 6, 7)),
+            (
+                datetime(2024, 6, 8, 0, 25, 7, 431432, tzinfo=utc),
+                datetime(2024, 6, 8, 1, 15, 42, 340827, tzinfo=utc),
+            ),
+        )
+
+        minutes = Location(
+            latitude=40.71427,
+            longitude=-74.00597,
+            use_tzeis_hakochavim=False,
+        )
+        sunset, nightfall = Zmanim.evening(minutes, date(2024, 6, 7))
+        self.assertEqual(nightfall - sunset, timedelta(minutes=72))
+        self.assertEqual(new_york.mean_time_offset, timedelta(hours=-74.00597 / 15))
+
+    def test_extra_zmanim_summer(self) -> None:
+        """There is no Alos Hashachar at 16.1 degrees in the summer up north."""
+        antwerp = Location(latitude=51.22047, longitude=4.40026)
+        zmanim = Zmanim(date(2024, 6, 21), antwerp)
+
+        self.assertIsNone(zmanim.alos_hashachar)
+        self.assertIsNotNone(zmanim.misheyakir)
+
+    def test_table(self) -> None:
+        """The zmanim of a table are within a second of `Zmanim`."""
+        start = date(2024, 1, 1)
+        locations = (
+            Location(latitude=51.22047, longitude=4.40026),  # Antwerp
+            Location(latitude=31.7683, longitude=35.2137),  # Jerusalem
+            Location(
+                latitude=40.7128,  # New York
+                longitude=-74.0060,
+                hadlokas_haneiros_minutes=18,
+                tzeis_minutes=50,
+            ),
+        )
+        for location in locations:
+            table = Zmanim.table(location, start, date(2025, 1, 1))
+            self.assertEqual(len(table.dates), 366)
+
+            for day, gregorian_date in enumerate(table.dates):
+                self.assertEqual(gregorian_date, start + timedelta(days=day))
+                try:
+                    expected = Zmanim(
+                        gregorian_date,
+                        location,
+                        set_hadlokas_haneiros=True,
+                    )
+                except ValueError:
+                    # the sunset of New York is around midnight UTC in May
+                    self.assertIsNone(table.sunset[day])
+                    continue
+
+                for name in ZmanimTable._fields[1:]:
+                    with self.subTest(location=location, day=day, name=name):
+                        time = getattr(table, name)[day]
+                        self.assertIsNotNone(time)
+                        self.assertLessEqual(
+                            abs(time - getattr(expected, name)),
+                            timedelta(seconds=1),
+                        )
+
+    def test_table_polar(self) -> None:
+        """The zmanim are `None` on the dates the sun does not reach them."""
+        longyearbyen = Location(latitude=78.2232, longitude=15.6267)
+        table = Zmanim.table(longyearbyen, date(2024, 12, 21), date(2024, 12, 22))
+
+        self.assertEqual(table.dates, [date(2024, 12, 21)])
+        self.assertEqual({column[0] for column in table[1:]}, {None})
+
+    def test_table_empty(self) -> None:
+        """A table of no dates has empty columns."""
+        antwerp = Location(latitude=51.22047, longitude=4.40026)
+        table = Zmanim.table(antwerp, date(2024, 1, 2), date(2024, 1, 1))
+
+        self.assertEqual(set(map(len, table)), {0})
+
+
+class LocationTestCase(TestCase):
+    """Unit tests for Location."""
+
+    def test_frozen(self) -> None:
+        """A location is immutable and hashable."""
+        location = Location(latitude=51.22047, longitude=4.40026)  # Antwerp
+        with self.assertRaises(AttributeError):
+            location.latitude = 0  # type: ignore[misc]
+
+        self.assertEqual(
+            hash(location),
+            hash(Location(latitude=51.22047, longitude=4.40026)),
+        )
+        self.assertFalse(hasattr(location, '__dict__'))
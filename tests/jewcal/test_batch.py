@@ -0,0 +1,87 @@
+"""Unit tests for jewcal.batch."""
+
+from datetime import date
+from doctest import DocTestSuite
+from typing import no_type_check
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from src.jewcal import batch
+from src.jewcal.utils.calculations import absdate_to_jewish, jewish_to_absdate
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.batch.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.batch'))
+    return tests
+
+
+class BatchTestCase(TestCase):
+    """Unit tests for batch."""
+
+    def setUp(self) -> None:
+        """Initialize."""
+        start = date(1990, 1, 1).toordinal()
+        self.ordinals = np.arange(start, start + 40 * 366)
+
+    def test_to_jewish(self) -> None:
+        """The batch conversion equals the scalar conversion."""
+        years, months, days = batch.to_jewish(self.ordinals)
+
+        expected = [absdate_to_jewish(int(ordinal)) for ordinal in self.ordinals]
+        self.assertEqual(list(zip(years, months, days, strict=True)), expected)
+
+    def test_to_gregorian(self) -> None:
+        """The batch conversion to Gregorian is the inverse of `to_jewish`."""
+        years, months, days = batch.to_jewish(self.ordinals)
+
+        ordinals = batch.to_gregorian(years, months, days)
+        self.assertTrue(np.array_equal(ordinals, self.ordinals))
+
+        self.assertEqual(
+            list(batch.to_gregorian([5782, 5782], [13, 1], [13, 15])),
+            [jewish_to_absdate(5782, 13, 13), jewish_to_absdate(5782, 1, 15)],
+        )
+
+    def test_invalid_month(self) -> None:
+        """A month out of range raises a ValueError, with or without NumPy."""
+        for month in (0, 14):
+            with self.subTest(month=month):
+                with self.assertRaises(ValueError):
+                    batch.to_gregorian([5784], [month], [1])
+
+                with (
+                    patch.object(batch, 'HAS_NUMPY', new=False),
+                    self.assertRaises(ValueError),
+                ):
+                    batch.to_gregorian([5784], [month], [1])
+
+    def test_empty(self) -> None:
+        """Converting no dates returns empty arrays."""
+        years, months, days = batch.to_jewish([])
+        self.assertEqual((len(years), len(months), len(days)), (0, 0, 0))
+        self.assertEqual(len(batch.to_gregorian([], [], [])), 0)
+
+    def test_without_numpy(self) -> None:
+        """Without NumPy the dates are converted one by one."""
+        ordinals = [int(ordinal) for ordinal in self.ordinals[:400]]
+        expected = batch.to_jewish(ordinals)
+
+        with patch.object(batch, 'HAS_NUMPY', new=False):
+            years, months, days = batch.to_jewish(ordinals)
+            self.assertIsInstance(years, list)
+            self.assertEqual(years, list(expected[0]))
+            self.assertEqual(months, list(expected[1]))
+            self.assertEqual(days, list(expected[2]))
+
+            self.assertEqual(batch.to_gregorian(years, months, days), ordinals)
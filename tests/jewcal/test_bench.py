@@ -0,0 +1,47 @@
+"""Unittests for jewcal.bench."""
+
+import json
+import sys
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.jewcal.bench import main, run
+
+
+class BenchTestCase(TestCase):
+    """Unittests for bench."""
+
+    def test_run(self) -> None:
+        """Test the selected benchmarks are run."""
+        results = run(['absdate_to_jewish', 'jewcal_year_location'], repeat=1)
+
+        timings = {result['name']: result for result in results['timings']}
+        self.assertEqual(
+            sorted(timings),
+            ['absdate_to_jewish', 'jewcal_year_location'],
+        )
+        self.assertGreater(timings['absdate_to_jewish']['best'], 0)
+
+        memory = {result['name']: result for result in results['memory']}
+        self.assertEqual(sorted(memory), ['jewcal_year_location'])
+        self.assertEqual(memory['jewcal_year_location']['objects'], 365)
+        self.assertGreater(memory['jewcal_year_location']['bytes_per_object'], 0)
+
+    def test_main(self) -> None:
+        """Test the results are written as JSON."""
+        with patch.object(sys, 'stdout', StringIO()) as output:
+            main(['events', '--repeat', '1'])
+
+        results = json.loads(output.getvalue())
+        self.assertEqual(results['timings'][0]['name'], 'events')
+        self.assertIn('python', results)
+
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'bench.json'
+            main(['events', '--repeat', '1', '--output', str(path)])
+
+            results = json.loads(path.read_text(encoding='utf-8'))
+            self.assertEqual(results['timings'][0]['name'], 'events')
@@ -0,0 +1,92 @@
+"""Unit tests for jewcal.bitmap."""
+
+from datetime import date, timedelta
+from doctest import DocTestSuite
+from typing import no_type_check
+from unittest import TestCase
+
+from src.jewcal import JewCal
+from src.jewcal.bitmap import IssurMelachaIndex
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.bitmap.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.bitmap'))
+    return tests
+
+
+class IssurMelachaIndexTestCase(TestCase):
+    """Unit tests for IssurMelachaIndex."""
+
+    def test_is_issur_melacha(self) -> None:
+        """The index equals `JewCal.is_issur_melacha` for every day."""
+        for diaspora in (True, False):
+            index = IssurMelachaIndex(5783, 5786, diaspora=diaspora)
+            start = date(2022, 9, 26)  # Rosh Hashana 5783
+            end = date(2026, 9, 12)  # Rosh Hashana 5787
+            for day in range((end - start).days):
+                date_ = start + timedelta(days=day)
+                with self.subTest(date=date_, diaspora=diaspora):
+                    self.assertEqual(
+                        index.is_issur_melacha(date_),
+                        JewCal(date_, diaspora=diaspora).is_issur_melacha(),
+                    )
+
+    def test_is_issur_melacha_outside_years(self) -> None:
+        """A date outside of the years of the index is an error."""
+        index = IssurMelachaIndex(5784, 5784)
+        with self.assertRaises(ValueError):
+            index.is_issur_melacha(date(2023, 9, 15))  # Erev Rosh Hashana 5784
+        with self.assertRaises(ValueError):
+            index.is_issur_melacha(date(2024, 10, 3))  # Rosh Hashana 5785
+        with self.assertRaises(ValueError):
+            IssurMelachaIndex(5785, 5784)
+
+    def test_count(self) -> None:
+        """The count equals the number of Issur Melacha days."""
+        index = IssurMelachaIndex(5784, 5785, diaspora=False)
+        start = date(2023, 9, 16)  # Rosh Hashana 5784
+        for first, last in ((0, 0), (0, 1), (3, 11), (5, 400), (0, 738), (700, 738)):
+            with self.subTest(first=first, last=last):
+                expected = sum(
+                    JewCal(
+                        start + timedelta(days=day),
+                        diaspora=False,
+                    ).is_issur_melacha()
+                    for day in range(first, last)
+                )
+                self.assertEqual(
+                    index.count(
+                        start + timedelta(days=first),
+                        start + timedelta(days=last),
+                    ),
+                    expected,
+                )
+
+        self.assertEqual(index.count(start + timedelta(days=9), start), 0)
+
+    def test_bytes(self) -> None:
+        """The exported index is loaded."""
+        index = IssurMelachaIndex(5700, 5799, diaspora=False)
+        data = index.to_bytes()
+        self.assertLess(len(data), 5000)
+
+        loaded = IssurMelachaIndex.from_bytes(data)
+        self.assertEqual(loaded.to_bytes(), data)
+        self.assertEqual(
+            (loaded.first_year, loaded.last_year, loaded.diaspora),
+            (5700, 5799, False),
+        )
+
+        with self.assertRaises(ValueError):
+            IssurMelachaIndex.from_bytes(data[:5])
+        with self.assertRaises(ValueError):
+            IssurMelachaIndex.from_bytes(data[:-1])
@@ -1,6 +1,6 @@
 """Unit tests for jewcal.core."""
 
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from doctest import NORMALIZE_WHITESPACE, DocTestSuite
 from typing import no_type_check
 from unittest import TestCase
@@ -169,6 +169,10 @@ class JewCalTestCase(TestCase):
         jewcal = JewCal(location=Location(latitude=lat, longitude=lon))
         self.assertIsNotNone(jewcal.zmanim)
 
+    def test_slots(self) -> None:
+        """A Jewish date has no instance dictionary."""
+        self.assertFalse(hasattr(JewCal(date(2024, 5, 31)), '__dict__'))
+
     def test_zmanim_init_fail(self) -> None:
         """Zmanim should be `None` when no `Location` is given."""
         jewcal = JewCal()
@@ -294,3 +298,132 @@ class JewCalTestCase(TestCase):
         if not jewcal.zmanim:
             raise TypeError
         self.assertIsNone(jewcal.zmanim.hadlokas_haneiros)
+
+
+class JewCalLazyTestCase(TestCase):
+    """Unit tests for a lazy `JewCal`."""
+
+    @patch('src.jewcal.core.Zmanim', autospec=True)
+    def test_lazy_jewish_date(self, mock_zmanim: Mock) -> None:
+        """A lazy Jewish date does not calculate zmanim until they are accessed."""
+        lat, lon = 51.22047, 4.40026  # Antwerp
+        location = Location(latitude=lat, longitude=lon)
+
+        jewcal = JewCal(date(2024, 5, 31), location, lazy=True)
+        self.assertEqual(jewcal.jewish_date, JewCal(date(2024, 5, 31)).jewish_date)
+        self.assertEqual(jewcal.events.shabbos, SHABBOS[5].title)
+        mock_zmanim.assert_not_called()
+
+        self.assertIs(jewcal.zmanim, mock_zmanim.return_value)
+        self.assertIs(jewcal.zmanim, mock_zmanim.return_value)
+        mock_zmanim.assert_called_once_with(
+            date(2024, 5, 31),
+            location,
+            set_hadlokas_haneiros=True,
+        )
+
+    def test_lazy_equals_eager(self) -> None:
+        """A lazy Jewish date equals the eager one, also after candle lighting."""
+        lat, lon = 51.22047, 4.40026  # Antwerp
+        location = Location(latitude=lat, longitude=lon)
+
+        for date_ in (date(2024, 5, 31), date(2024, 6, 1), date(2024, 6, 13)):
+            with self.subTest(date=date_):
+                jewcal = JewCal(date_, location, lazy=True)
+                self.assertEqual(repr(jewcal), repr(JewCal(date_, location)))
+
+        jewcal = JewCal(date(2024, 6, 1), location, lazy=True)
+        if not jewcal.zmanim:
+            raise TypeError
+        self.assertIsNone(jewcal.zmanim.hadlokas_haneiros)
+        self.assertIs(jewcal.events, jewcal.events)
+
+    @patch('src.jewcal.core.date_today', autospec=True)
+    @patch('src.jewcal.core.Zmanim.is_now_after_nightfall', autospec=True)
+    def test_lazy_is_now_after_nightfall(
+        self,
+        mock_zmanim: Mock,
+        mock_today: Mock,
+    ) -> None:
+        """A lazy Jewish date of today is the next date after nightfall."""
+        lat, lon = 51.22047, 4.40026  # Antwerp
+        location = Location(latitude=lat, longitude=lon)
+
+        date_ = date(2024, 5, 31)
+        mock_today.return_value = date_
+        mock_zmanim.return_value = True
+        jewcal = JewCal(date_, location, lazy=True)
+        mock_zmanim.assert_not_called()
+
+        self.assertEqual(jewcal.jewish_date.gregorian_date, date(2024, 6, 1))
+        mock_zmanim.assert_called_once()
+        if not jewcal.zmanim:
+            raise TypeError
+        self.assertEqual(jewcal.zmanim.sunset.date(), date(2024, 6, 1))
+        self.assertIsNone(jewcal.zmanim.hadlokas_haneiros)
+
+
+class JewCalRangeTestCase(TestCase):
+    """Unit tests for `JewCal.range`."""
+
+    def test_range(self) -> None:
+        """The dates equal the dates created one by one."""
+        start, end = date(2023, 9, 1), date(2026, 10, 1)
+
+        for diaspora in (True, False):
+            jewcals = list(JewCal.range(start, end, diaspora=diaspora))
+            self.assertEqual(len(jewcals), (end - start).days)
+
+            for offset, jewcal in enumerate(jewcals):
+                expected = JewCal(start + timedelta(days=offset), diaspora=diaspora)
+                self.assertEqual(repr(jewcal), repr(expected))
+
+    def test_range_step(self) -> None:
+        """The dates are stepped by a number of days."""
+        start, end = date(2023, 9, 1), date(2026, 10, 1)
+
+        jewcals = list(JewCal.range(start, end, step=30))
+        self.assertEqual(len(jewcals), len(range(0, (end - start).days, 30)))
+
+        for offset, jewcal in zip(range(0, 2000, 30), jewcals, strict=False):
+            expected = JewCal(start + timedelta(days=offset))
+            self.assertEqual(repr(jewcal), repr(expected))
+
+        with self.assertRaises(ValueError):
+            list(JewCal.range(start, end, step=0))
+
+    def test_range_empty(self) -> None:
+        """No dates if end is not after start."""
+        self.assertEqual(list(JewCal.range(date(2024, 6, 1), date(2024, 6, 1))), [])
+
+    def test_range_location(self) -> None:
+        """The zmanim equal the zmanim created one by one."""
+        lat, lon = 51.22047, 4.40026  # Antwerp
+        location = Location(latitude=lat, longitude=lon)
+        start = date(2024, 6, 10)
+
+        jewcals = JewCal.range(start, date(2024, 6, 17), location=location)
+        for offset, jewcal in enumerate(jewcals):
+            expected = JewCal(start + timedelta(days=offset), location)
+            if not jewcal.zmanim or not expected.zmanim:
+                raise TypeError
+            self.assertEqual(jewcal.zmanim.to_dict(), expected.zmanim.to_dict())
+
+    @patch('src.jewcal.core.date_today', autospec=True)
+    @patch('src.jewcal.core.Zmanim.is_now_after_nightfall', autospec=True)
+    def test_range_today_after_nightfall(
+        self,
+        mock_zmanim: Mock,
+        mock_today: Mock,
+    ) -> None:
+        """After nightfall today is the next Jewish date."""
+        lat, lon = 51.22047, 4.40026  # Antwerp
+        location = Location(latitude=lat, longitude=lon)
+
+        mock_today.return_value = date(2024, 5, 31)
+        mock_zmanim.return_value = True
+
+        start, end = date(2024, 5, 30), date(2024, 6, 1)
+        jewcals = list(JewCal.range(start, end, location=location))
+        self.assertEqual(jewcals[0].jewish_date.gregorian_date, date(2024, 5, 30))
+        self.assertEqual(jewcals[1].jewish_date.gregorian_date, date(2024, 6, 1))
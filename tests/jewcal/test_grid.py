@@ -0,0 +1,163 @@
+"""Unittests for jewcal.grid."""
+
+import sys
+from datetime import date, timedelta
+from doctest import DocTestSuite
+from io import BytesIO, StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import no_type_check
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.jewcal.grid import HEADER, ZmanimGrid, main, nodes, precompute
+from src.jewcal.models.zmanim import Location, Zmanim
+
+ANTWERP = (51.22047, 4.40026)
+NEW_YORK = (40.7128, -74.0060)
+LONGYEARBYEN = (78.2232, 15.6267)
+START = date(2024, 1, 1)
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.grid.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.grid'))
+    return tests
+
+
+class ZmanimGridTestCase(TestCase):
+    """Unittests for ZmanimGrid."""
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Precompute the grid of a year."""
+        output = BytesIO()
+        precompute(output, [ANTWERP, NEW_YORK, LONGYEARBYEN], START, 366)
+        cls.data = output.getvalue()
+
+    def setUp(self) -> None:
+        """Initialize."""
+        self.grid = ZmanimGrid(self.data)
+
+    def test_nodes(self) -> None:
+        """The corners of the cells are unique."""
+        self.assertEqual(
+            nodes([(0.005, -0.005), (0.001, -0.001)], 0.01),
+            [(0, -1), (0, 0), (1, -1), (1, 0)],
+        )
+
+    def test_sun_events(self) -> None:
+        """The sun events are within a second of `Zmanim`."""
+        self.assertEqual(self.grid.start, START)
+        self.assertEqual(self.grid.days, 366)
+        self.assertEqual(self.grid.step, 0.01)
+
+        for lat, lon in (ANTWERP, NEW_YORK):
+            for day in range(0, 366, 5):
+                gregorian_date = START + timedelta(days=day)
+                events = self.grid.sun_events(gregorian_date, lat, lon)
+                try:
+                    zmanim = Zmanim(gregorian_date, Location(lat, lon))
+                except ValueError:
+                    # the sunset of New York is around midnight UTC in May
+                    self.assertIsNone(events)
+                    continue
+
+                with self.subTest(lat=lat, date=gregorian_date):
+                    self.assertIsNotNone(events)
+                    assert events is not None  # noqa: S101
+                    expected = (
+                        zmanim.sunrise,
+                        zmanim.sunset,
+                        zmanim.tzeis_hakochavim,
+                    )
+                    for time, expected_time in zip(events, expected, strict=True):
+                        self.assertLessEqual(
+                            abs(time - expected_time),
+                            timedelta(seconds=1),
+                        )
+
+    def test_off_grid(self) -> None:
+        """The sun events off the grid, the dates or the elevation are `None`."""
+        self.assertIsNone(self.grid.sun_events(START, 31.7683, 35.2137))
+        self.assertIsNone(self.grid.sun_events(START - timedelta(days=1), *ANTWERP))
+        self.assertIsNone(self.grid.sun_events(date(2025, 1, 1), *ANTWERP))
+        self.assertIsNone(self.grid.sun_events(date(2024, 12, 21), *LONGYEARBYEN))
+
+    def test_around_midnight(self) -> None:
+        """A sunset around midnight UTC is not interpolated between two dates."""
+        self.assertIsNone(self.grid.sun_events(date(2024, 5, 9), *NEW_YORK))
+
+    def test_lookup(self) -> None:
+        """`Zmanim` reads the grid, and calculates the sun events off the grid."""
+        antwerp = Location(*ANTWERP, lookup=self.grid)
+        jerusalem = Location(31.7683, 35.2137, lookup=self.grid)
+        expected = Zmanim(START, Location(31.7683, 35.2137))
+
+        with patch('src.jewcal.models.zmanim.Sun') as sun:
+            zmanim = Zmanim(START, antwerp)
+        sun.assert_not_called()
+        self.assertEqual(zmanim.sunset, self.grid.sun_events(START, *ANTWERP)[1])
+
+        self.assertEqual(Zmanim(START, jerusalem), expected)
+        self.assertEqual(antwerp, Location(*ANTWERP))
+
+    def test_file(self) -> None:
+        """The file of the grid is read through a memory map."""
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'zmanim.grid'
+            path.write_bytes(self.data)
+
+            grid = ZmanimGrid(path)
+            self.assertEqual(
+                grid.sun_events(START, *ANTWERP),
+                self.grid.sun_events(START, *ANTWERP),
+            )
+            grid.close()
+
+    def test_invalid(self) -> None:
+        """The data of a grid is validated."""
+        with self.assertRaisesRegex(ValueError, 'too short'):
+            ZmanimGrid(b'JCZG')
+        with self.assertRaisesRegex(ValueError, 'not a zmanim grid'):
+            ZmanimGrid(b'XXXX' + self.data[4:])
+        with self.assertRaisesRegex(ValueError, 'not a zmanim grid'):
+            ZmanimGrid(self.data[:-1])
+        with self.assertRaises(ValueError):
+            precompute(BytesIO(), [ANTWERP], START, 1, step=0)
+
+    def test_main(self) -> None:
+        """The grid of the locations of a CSV file is written."""
+        with TemporaryDirectory() as directory:
+            locations = Path(directory) / 'locations.csv'
+            locations.write_text(
+                'name,latitude,longitude\nAntwerp,51.22047,4.40026\n',
+                encoding='utf-8',
+            )
+            output = Path(directory) / 'zmanim.grid'
+
+            with patch.object(sys, 'stdout', StringIO()) as stdout:
+                self.assertEqual(
+                    main(
+                        [
+                            str(locations),
+                            '--from',
+                            '2024-01-01',
+                            '--to',
+                            '2024-01-08',
+                            '--output',
+                            str(output),
+                        ],
+                    ),
+                    0,
+                )
+            self.assertIn('4 corners', stdout.getvalue())
+            self.assertEqual(output.stat().st_size, HEADER.size + 4 * (8 + 7 * 12))
@@ -0,0 +1,163 @@
+"""Unittests for jewcal.live."""
+
+from datetime import date, datetime, timedelta, timezone
+from doctest import DocTestSuite
+from typing import no_type_check
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.jewcal.core import JewCal
+from src.jewcal.live import CalendarClock
+from src.jewcal.models.zmanim import Location, Zmanim
+from src.jewcal.periods import PeriodIndex
+
+ANTWERP = Location(latitude=51.22047, longitude=4.40026)
+JERUSALEM = Location(
+    latitude=31.76904,
+    longitude=35.21633,
+    use_tzeis_hakochavim=False,
+    hadlokas_haneiros_minutes=40,
+)
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.live.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.live'))
+    return tests
+
+
+class CalendarClockTestCase(TestCase):
+    """Unittests for CalendarClock."""
+
+    def test_equals_jewcal(self) -> None:
+        """The calendar of now equals `JewCal()` and the Issur Melacha periods.
+
+        The days are Shabbos and Shavuos 2024, every 100 minutes.
+        """
+        start = datetime(2024, 5, 31, tzinfo=timezone.utc)
+        for location, diaspora in ((ANTWERP, True), (JERUSALEM, False)):
+            clock = CalendarClock(location, diaspora=diaspora)
+            index = PeriodIndex(
+                date(2024, 5, 30),
+                date(2024, 6, 16),
+                location,
+                diaspora=diaspora,
+            )
+            for minutes in range(0, 15 * 24 * 60, 100):
+                moment = start + timedelta(minutes=minutes)
+                with (
+                    patch('src.jewcal.live.datetime_now', return_value=moment),
+                    patch('src.jewcal.models.zmanim.datetime_now', return_value=moment),
+                    patch(
+                        'src.jewcal.models.zmanim.date_today',
+                        return_value=moment.date(),
+                    ),
+                    patch('src.jewcal.core.date_today', return_value=moment.date()),
+                    self.subTest(diaspora=diaspora, moment=moment),
+                ):
+                    expected = JewCal(location=location, diaspora=diaspora)
+                    self.assertEqual(repr(clock.now()), repr(expected))
+                    self.assertEqual(
+                        clock.is_issur_melacha(),
+                        index.is_issur_melacha(moment),
+                    )
+                    self.assertGreater(clock.next_transition(), moment)
+
+    def test_transitions(self) -> None:
+        """The transitions of Erev Shabbos are candles, nightfall and midnight."""
+        clock = CalendarClock(ANTWERP)
+        zmanim = Zmanim(date(2024, 5, 31), ANTWERP, set_hadlokas_haneiros=True)
+        midnight = datetime(2024, 6, 1, tzinfo=timezone.utc) - ANTWERP.mean_time_offset
+
+        moment = datetime(2024, 5, 31, tzinfo=timezone.utc)
+        transitions = []
+        while moment < midnight:
+            state = clock.state_at(moment)
+            self.assertLessEqual(state.since, moment)
+            transitions.append(state.until)
+            moment = state.until
+
+        self.assertEqual(
+            transitions,
+            [
+                zmanim.hadlokas_haneiros,
+                zmanim.tzeis_hakochavim,
+                midnight,
+            ],
+        )
+
+    def test_west(self) -> None:
+        """West of Greenwich the state follows the local evenings."""
+        new_york = Location(latitude=40.71427, longitude=-74.00597)
+        clock = CalendarClock(new_york)
+        index = PeriodIndex(date(2024, 6, 1), date(2024, 6, 15), new_york)
+
+        # Thursday 20:30 EDT, Friday 12:00 and 20:30 EDT, Shabbos 21:00 and 21:30 EDT
+        for moment, expected in (
+            (datetime(2024, 6, 7, 0, 30, tzinfo=timezone.utc), '29 Iyar 5784'),
+            (
+                datetime(2024, 6, 7, 16, tzinfo=timezone.utc),
+                '1 Sivan 5784: Erev Shabbos',
+            ),
+            (
+                datetime(2024, 6, 8, 0, 30, tzinfo=timezone.utc),
+                '1 Sivan 5784: Erev Shabbos',
+            ),
+            (datetime(2024, 6, 9, 1, tzinfo=timezone.utc), '2 Sivan 5784: Shabbos'),
+            (datetime(2024, 6, 9, 1, 30, tzinfo=timezone.utc), '3 Sivan 5784'),
+        ):
+            state = clock.state_at(moment)
+            with self.subTest(moment=moment):
+                self.assertEqual(str(state.jewcal), expected)
+                self.assertEqual(
+                    state.issur_melacha,
+                    index.is_issur_melacha(moment),
+                )
+
+        start = datetime(2024, 6, 1, tzinfo=timezone.utc)
+        for minutes in range(0, 13 * 24 * 60, 100):
+            moment = start + timedelta(minutes=minutes)
+            state = clock.state_at(moment)
+            with self.subTest(moment=moment):
+                self.assertEqual(state.issur_melacha, index.is_issur_melacha(moment))
+                self.assertLessEqual(state.since, moment)
+                self.assertGreater(state.until, moment)
+
+    def test_cache(self) -> None:
+        """The state is calculated again only at its next transition."""
+        clock = CalendarClock(ANTWERP)
+        noon = datetime(2024, 5, 31, 12, tzinfo=timezone.utc)
+
+        with (
+            patch('src.jewcal.live.datetime_now', return_value=noon) as now,
+            patch.object(Zmanim, 'evening', side_effect=Zmanim.evening) as zmanim,
+        ):
+            state = clock.state()
+            now.return_value = noon + timedelta(hours=7)
+            self.assertIs(clock.state(), state)
+            self.assertEqual(zmanim.call_count, 1)
+
+            now.return_value = state.until
+            candles = clock.state()
+            self.assertTrue(candles.issur_melacha)
+            self.assertIs(candles.jewcal, state.jewcal)
+            self.assertEqual(zmanim.call_count, 2)
+
+            now.return_value = noon
+            self.assertEqual(clock.state(), state)
+            self.assertEqual(zmanim.call_count, 3)
+
+    def test_properties(self) -> None:
+        """The location and Diaspora or Israel are kept."""
+        clock = CalendarClock(JERUSALEM, diaspora=False)
+
+        self.assertEqual(clock.location, JERUSALEM)
+        self.assertFalse(clock.diaspora)
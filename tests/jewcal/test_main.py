@@ -22,3 +22,10 @@ class MainTestCase(TestCase):
         self.assertIn('Zmanim for Jerushalayim:', output.getvalue())
         self.assertIn('sunrise', output.getvalue())
         self.assertIn('Location(latitude=31.76904', output.getvalue())
+
+    def test_zmanim_batch(self) -> None:
+        """The subcommand zmanim-batch is run with the other arguments."""
+        with patch('src.jewcal.__main__.zmanim_batch.main', return_value=0) as batch:
+            self.assertEqual(main(['zmanim-batch', 'locations.csv']), 0)
+
+        batch.assert_called_once_with(['locations.csv'])
@@ -0,0 +1,216 @@
+"""Unit tests for jewcal.periods."""
+
+from datetime import date, datetime, timedelta, timezone
+from doctest import DocTestSuite
+from typing import no_type_check
+from unittest import TestCase
+from unittest.mock import patch
+
+import numpy as np
+
+from src.jewcal import JewCal
+from src.jewcal import periods as periods_module
+from src.jewcal.models.zmanim import Location
+from src.jewcal.periods import PeriodIndex, periods
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.periods.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.periods'))
+    return tests
+
+
+class PeriodsTestCase(TestCase):
+    """Unit tests for periods."""
+
+    def setUp(self) -> None:
+        """Initialize."""
+        self.location = Location(latitude=51.22047, longitude=4.40026)  # Antwerp
+
+    def test_periods(self) -> None:
+        """The periods equal the Issur Melacha days and zmanim of JewCal."""
+        start, end = date(2024, 9, 1), date(2024, 11, 1)
+        for diaspora in (True, False):
+            days = [
+                jewcal.jewish_date.gregorian_date
+                for jewcal in JewCal.range(start, end, diaspora=diaspora)
+                if jewcal.is_issur_melacha()
+            ]
+
+            found = list(periods(start, end, self.location, diaspora=diaspora))
+            self.assertEqual(
+                [
+                    period.first_date + timedelta(days=day)
+                    for period in found
+                    for day in range((period.last_date - period.first_date).days + 1)
+                ],
+                days,
+            )
+
+            for period in found:
+                with self.subTest(period=period, diaspora=diaspora):
+                    erev = JewCal(
+                        period.first_date - timedelta(days=1),
+                        self.location,
+                        diaspora=diaspora,
+                    )
+                    last = JewCal(period.last_date, self.location, diaspora=diaspora)
+                    if not erev.zmanim or not last.zmanim:
+                        raise TypeError
+
+                    self.assertTrue(erev.is_erev())
+                    self.assertEqual(period.start, erev.zmanim.hadlokas_haneiros)
+                    self.assertEqual(period.end, last.zmanim.tzeis_hakochavim)
+
+    def test_periods_merged(self) -> None:
+        """Yom Tov followed by Shabbos is one period."""
+        # Shmini Atzeres, Simchas Tora and Shabbos
+        found = list(periods(date(2024, 10, 24), date(2024, 10, 27), self.location))
+        self.assertEqual(len(found), 1)
+        self.assertEqual(found[0].first_date, date(2024, 10, 24))
+        self.assertEqual(found[0].last_date, date(2024, 10, 26))
+
+        # a period in the span is not cut
+        self.assertEqual(
+            list(periods(date(2024, 10, 25), date(2024, 10, 26), self.location)),
+            found,
+        )
+        self.assertEqual(
+            list(periods(date(2024, 10, 20), date(2024, 10, 23), self.location)),
+            [],
+        )
+
+    def test_periods_tzeis_minutes(self) -> None:
+        """A period ends at Tzeis after minutes with `use_tzeis_hakochavim`."""
+        location = Location(
+            latitude=51.22047,
+            longitude=4.40026,
+            use_tzeis_hakochavim=False,
+        )
+
+        period = next(periods(date(2024, 6, 1), date(2024, 6, 2), location))
+        jewcal = JewCal(date(2024, 6, 1), location)
+        if not jewcal.zmanim:
+            raise TypeError
+        self.assertEqual(period.end, jewcal.zmanim.tzeis_minutes)
+
+    def test_periods_west(self) -> None:
+        """A period west of Greenwich is from the local evening to nightfall."""
+        new_york = Location(latitude=40.71427, longitude=-74.00597)
+        los_angeles = Location(latitude=34.05223, longitude=-118.24368)
+
+        # Shabbos, Friday 20:07 to Shabbos 21:16 EDT
+        period = next(periods(date(2024, 6, 8), date(2024, 6, 9), new_york))
+        self.assertEqual(
+            (period.start, period.end),
+            (
+                datetime(2024, 6, 8, 0, 7, 7, 431432, tzinfo=timezone.utc),
+                datetime(2024, 6, 9, 1, 16, 21, 358619, tzinfo=timezone.utc),
+            ),
+        )
+
+        for location in (new_york, los_angeles):
+            for period in periods(date(2024, 6, 1), date(2024, 7, 1), location):
+                with self.subTest(location=location, period=period):
+                    hours = (period.last_date - period.first_date).days * 24 + 26
+                    self.assertLess(period.end - period.start, timedelta(hours=hours))
+                    self.assertEqual(
+                        (period.start + location.mean_time_offset).date(),
+                        period.first_date - timedelta(days=1),
+                    )
+                    self.assertEqual(
+                        (period.end + location.mean_time_offset).date(),
+                        period.last_date,
+                    )
+
+
+class PeriodIndexTestCase(TestCase):
+    """Unit tests for PeriodIndex."""
+
+    def setUp(self) -> None:
+        """Initialize."""
+        location = Location(latitude=51.22047, longitude=4.40026)  # Antwerp
+        self.index = PeriodIndex(date(2024, 9, 1), date(2024, 11, 1), location)
+
+        # every 17 minutes over the span
+        start = datetime(2024, 9, 1, tzinfo=timezone.utc)
+        self.moments = [start + timedelta(minutes=17 * step) for step in range(5400)]
+
+    def test_is_issur_melacha(self) -> None:
+        """A moment is Issur Melacha from the start to the end of a period."""
+        period = self.index.periods[0]
+        second = timedelta(seconds=1)
+
+        self.assertFalse(self.index.is_issur_melacha(period.start - second))
+        self.assertTrue(self.index.is_issur_melacha(period.start))
+        self.assertTrue(self.index.is_issur_melacha(period.end - second))
+        self.assertFalse(self.index.is_issur_melacha(period.end))
+        self.assertTrue(self.index.is_issur_melacha(period.start.timestamp()))
+
+        self.assertIs(self.index.period_at(period.start), period)
+        self.assertIsNone(self.index.period_at(period.end))
+
+        self.assertFalse(
+            self.index.is_issur_melacha(datetime(2000, 1, 1, tzinfo=timezone.utc)),
+        )
+
+    def test_is_issur_melacha_bulk(self) -> None:
+        """Many moments equal the moments one by one."""
+        expected = [self.index.is_issur_melacha(moment) for moment in self.moments]
+        self.assertGreater(sum(expected), 0)
+
+        timestamps = np.array([moment.timestamp() for moment in self.moments])
+        datetimes64 = np.array(
+            [moment.replace(tzinfo=None) for moment in self.moments],
+            dtype='datetime64[us]',
+        )
+        for moments in (self.moments, timestamps, datetimes64):
+            with self.subTest(type=type(moments)):
+                self.assertEqual(
+                    list(self.index.is_issur_melacha_bulk(moments)),
+                    expected,
+                )
+
+        with patch.object(periods_module, 'HAS_NUMPY', new=False):
+            self.assertEqual(self.index.is_issur_melacha_bulk(self.moments), expected)
+
+    def test_is_issur_melacha_west(self) -> None:
+        """West of Greenwich a moment is looked up in the local evenings."""
+        new_york = Location(latitude=40.71427, longitude=-74.00597)
+        index = PeriodIndex(date(2024, 6, 1), date(2024, 6, 15), new_york)
+
+        # Thursday 20:30 EDT, Friday 20:30 EDT, Shabbos 21:00 and 21:30 EDT
+        moments = [
+            datetime(2024, 6, 7, 0, 30, tzinfo=timezone.utc),
+            datetime(2024, 6, 8, 0, 30, tzinfo=timezone.utc),
+            datetime(2024, 6, 9, 1, tzinfo=timezone.utc),
+            datetime(2024, 6, 9, 1, 30, tzinfo=timezone.utc),
+        ]
+        expected = [False, True, True, False]
+
+        self.assertEqual(
+            [index.is_issur_melacha(moment) for moment in moments],
+            expected,
+        )
+        self.assertEqual(list(index.is_issur_melacha_bulk(moments)), expected)
+        timestamps = np.array([moment.timestamp() for moment in moments])
+        self.assertEqual(list(index.is_issur_melacha_bulk(timestamps)), expected)
+
+    def test_is_issur_melacha_bulk_without_periods(self) -> None:
+        """Without periods no moment is Issur Melacha."""
+        location = Location(latitude=51.22047, longitude=4.40026)  # Antwerp
+        index = PeriodIndex(date(2024, 6, 2), date(2024, 6, 7), location)
+
+        self.assertEqual(index.periods, ())
+        self.assertEqual(
+            list(index.is_issur_melacha_bulk(np.array([1717321600.0]))),
+            [False],
+        )
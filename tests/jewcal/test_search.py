@@ -0,0 +1,165 @@
+"""Unit tests for jewcal.search."""
+
+from datetime import date, datetime, timedelta, timezone
+from doctest import DocTestSuite
+from itertools import pairwise
+from typing import no_type_check
+from unittest import TestCase
+from unittest.mock import Mock, patch
+
+from src.jewcal import JewCal
+from src.jewcal.constants import EventKind
+from src.jewcal.models.zmanim import Location
+from src.jewcal.search import events_between, next_event, previous_event
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.search.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.search'))
+    return tests
+
+
+def _matches(jewcal: JewCal, kind: EventKind) -> bool:
+    """Does the day have an event of the kind."""
+    return bool(jewcal.events.kind & kind)
+
+
+class SearchTestCase(TestCase):
+    """Unit tests for the search of events."""
+
+    def setUp(self) -> None:
+        """Initialize."""
+        self.start = date(2023, 9, 1)
+        self.end = date(2025, 10, 1)
+        self.kinds = (
+            EventKind.YOMTOV,
+            EventKind.CANDLES,
+            EventKind.CHOL_HAMOED | EventKind.EREV_YOMTOV,
+            EventKind.ISSUR_MELACHA,
+        )
+
+    def _scan(self, kind: EventKind, *, diaspora: bool) -> list[date]:
+        """The matching days of a linear scan."""
+        return [
+            jewcal.jewish_date.gregorian_date
+            for jewcal in JewCal.range(self.start, self.end, diaspora=diaspora)
+            if _matches(jewcal, kind)
+        ]
+
+    def test_events_between(self) -> None:
+        """The days between two dates equal a linear scan."""
+        for diaspora in (True, False):
+            for kind in self.kinds:
+                with self.subTest(kind=kind, diaspora=diaspora):
+                    self.assertEqual(
+                        [
+                            jewcal.jewish_date.gregorian_date
+                            for jewcal in events_between(
+                                self.start,
+                                self.end,
+                                kind=kind,
+                                diaspora=diaspora,
+                            )
+                        ],
+                        self._scan(kind, diaspora=diaspora),
+                    )
+
+        self.assertEqual(list(events_between(self.end, self.start)), [])
+
+    def test_next_and_previous_event(self) -> None:
+        """The next and previous day equal a linear scan."""
+        for diaspora in (True, False):
+            for kind in self.kinds:
+                days = self._scan(kind, diaspora=diaspora)
+                for first, second in pairwise(days):
+                    with self.subTest(kind=kind, diaspora=diaspora, day=first):
+                        found = next_event(first, kind=kind, diaspora=diaspora)
+                        if not found:
+                            raise TypeError
+                        self.assertEqual(found.jewish_date.gregorian_date, second)
+
+                        found = previous_event(second, kind=kind, diaspora=diaspora)
+                        if not found:
+                            raise TypeError
+                        self.assertEqual(found.jewish_date.gregorian_date, first)
+
+    def test_next_event_location(self) -> None:
+        """The next day has zmanim at the location."""
+        location = Location(latitude=51.22047, longitude=4.40026)  # Antwerp
+        jewcal = next_event(
+            date(2024, 5, 29),
+            kind=EventKind.CANDLES,
+            location=location,
+        )
+        if not jewcal or not jewcal.zmanim:
+            raise TypeError
+
+        self.assertEqual(jewcal.jewish_date.gregorian_date, date(2024, 5, 31))
+        self.assertIsNotNone(jewcal.zmanim.hadlokas_haneiros)
+
+    @patch('src.jewcal.models.zmanim.datetime_now', autospec=True)
+    @patch('src.jewcal.models.zmanim.date_today', autospec=True)
+    @patch('src.jewcal.core.date_today', autospec=True)
+    def test_after_nightfall(
+        self,
+        mock_core_today: Mock,
+        mock_today: Mock,
+        mock_now: Mock,
+    ) -> None:
+        """A day found after nightfall of today is not the next Jewish date."""
+        location = Location(latitude=51.22047, longitude=4.40026)  # Antwerp
+        mock_core_today.return_value = date(2024, 5, 31)  # Erev Shabbos
+        mock_today.return_value = date(2024, 5, 31)
+        mock_now.return_value = datetime(2024, 5, 31, 22, tzinfo=timezone.utc)
+
+        found = [
+            next_event(
+                date(2024, 5, 30),
+                kind=EventKind.EREV_SHABBOS,
+                location=location,
+            ),
+            previous_event(
+                date(2024, 6, 1),
+                kind=EventKind.EREV_SHABBOS,
+                location=location,
+            ),
+            *events_between(
+                date(2024, 5, 31),
+                date(2024, 6, 1),
+                kind=EventKind.EREV_SHABBOS,
+                location=location,
+            ),
+        ]
+        for jewcal in found:
+            if not jewcal:
+                raise TypeError
+            with self.subTest(jewcal=jewcal):
+                self.assertEqual(str(jewcal), '23 Iyar 5784: Erev Shabbos')
+                self.assertTrue(jewcal.is_erev_shabbos())
+
+        self.assertEqual(len(found), 3)
+
+    def test_outside_of_calendar(self) -> None:
+        """There is no day outside of the Gregorian calendar."""
+        self.assertIsNone(next_event(date.max))
+        self.assertIsNone(previous_event(date.min))
+
+        jewcal = next_event(date.max - timedelta(days=7))
+        self.assertIsNotNone(jewcal)
+
+    def test_no_kind(self) -> None:
+        """A kind without flags is an error."""
+        with self.assertRaises(ValueError):
+            next_event(date(2024, 5, 31), kind=EventKind(0))
+        with self.assertRaises(ValueError):
+            list(
+                events_between(date(2024, 5, 31), date(2024, 6, 30), kind=EventKind(0)),
+            )
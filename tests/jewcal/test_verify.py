@@ -0,0 +1,78 @@
+"""Unittests for jewcal.verify."""
+
+import sys
+from io import StringIO
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.jewcal.utils.calculations import absdate_to_jewish as _absdate_to_jewish
+from src.jewcal.utils.calculations import jewish_to_absdate
+from src.jewcal.verify import main, verify, verify_chunk
+
+BROKEN_ENGINE = 'tests.jewcal.test_verify'
+ROSH_HASHANA_5785 = 739162  # 2024-10-03
+
+
+def absdate_to_jewish(absdate: int) -> tuple[int, int, int]:
+    """An engine with Rosh Hashana 5785 one day late.
+
+    Args:
+        absdate: The absolute date number.
+
+    Returns:
+        A tuple with the Jewish year, month and day.
+    """
+    if absdate == ROSH_HASHANA_5785:
+        return (5784, 6, 30)
+    return _absdate_to_jewish(absdate)
+
+
+# the functions of the broken engine
+__all__ = ['absdate_to_jewish', 'jewish_to_absdate']
+
+
+class VerifyTestCase(TestCase):
+    """Unittests for verify."""
+
+    def test_verify(self) -> None:
+        """The calculations equal the reference implementation."""
+        result = verify(start_year=2024, end_year=2025, workers=2)
+
+        self.assertEqual(result.checked, 731)
+        self.assertEqual(result.mismatches, [])
+
+    def test_verify_mismatches(self) -> None:
+        """The mismatches of an engine are reported."""
+        result = verify(BROKEN_ENGINE, start_year=2024, end_year=2024, workers=1)
+
+        self.assertEqual(result.checked, 366)
+        self.assertEqual(
+            [mismatch.check for mismatch in result.mismatches],
+            ['absdate_to_jewish', 'events', 'events_israel'],
+        )
+        self.assertEqual(result.mismatches[0].expected, (5785, 7, 1))
+        self.assertEqual(result.mismatches[0].actual, (5784, 6, 30))
+        self.assertIn('2024-10-03', str(result.mismatches[0]))
+
+    def test_verify_chunk_checked(self) -> None:
+        """A chunk that stops at the limit counts the days it compared."""
+        start = ROSH_HASHANA_5785 - 9
+        result = verify_chunk(BROKEN_ENGINE, start, start + 99, 1)
+
+        self.assertEqual(result.checked, 10)
+        self.assertEqual(len(result.mismatches), 1)
+
+    def test_main(self) -> None:
+        """Test the exit code and the report."""
+        argv = ['--start-year', '2024', '--end-year', '2024', '--workers', '1']
+
+        with patch.object(sys, 'stdout', StringIO()) as output:
+            self.assertEqual(main(argv), 0)
+        self.assertIn('366 days checked, 0 mismatches', output.getvalue())
+
+        with patch.object(sys, 'stdout', StringIO()) as output:
+            self.assertEqual(
+                main([*argv, '--engine', BROKEN_ENGINE, '--limit', '1']),
+                1,
+            )
+        self.assertIn('1 mismatches', output.getvalue())
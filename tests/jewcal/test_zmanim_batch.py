@@ -0,0 +1,181 @@
+"""Unittests for jewcal.zmanim_batch."""
+
+import json
+import sys
+from datetime import date, datetime, timedelta
+from doctest import DocTestSuite
+from io import StringIO
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from typing import no_type_check
+from unittest import TestCase
+from unittest.mock import patch
+
+from src.jewcal.models.zmanim import Location, Zmanim
+from src.jewcal.zmanim_batch import (
+    FIELDS,
+    calculate,
+    main,
+    read_locations,
+    work_units,
+    write,
+    zmanim_batch,
+)
+
+LOCATIONS_CSV = """name,latitude,longitude,use_tzeis_hakochavim,tzeis_minutes
+Antwerp,51.22047,4.40026,,
+Jerusalem,31.7683,35.2137,false,40
+,40.7128,-74.0060,,
+"""
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.zmanim_batch.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.zmanim_batch'))
+    return tests
+
+
+class ZmanimBatchTestCase(TestCase):
+    """Unittests for zmanim_batch."""
+
+    def setUp(self) -> None:
+        """Initialize."""
+        self.locations = read_locations(StringIO(LOCATIONS_CSV))
+        self.start = date(2024, 5, 1)
+        self.end = date(2024, 6, 1)
+
+    def test_read_locations(self) -> None:
+        """The locations are read with the defaults of `Location`."""
+        self.assertEqual(
+            [location.name for location in self.locations],
+            ['Antwerp', 'Jerusalem', '4'],
+        )
+        self.assertEqual(self.locations[0].location, Location(51.22047, 4.40026))
+        self.assertEqual(
+            self.locations[1].location,
+            Location(31.7683, 35.2137, use_tzeis_hakochavim=False, tzeis_minutes=40),
+        )
+
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            read_locations(StringIO('latitude,longitude\nnorth,4.4\n'))
+        with self.assertRaisesRegex(ValueError, 'line 2'):
+            read_locations(StringIO('name,latitude\nAntwerp,51.2\n'))
+
+    def test_work_units(self) -> None:
+        """Every location and date is in one unit."""
+        many = self.locations * 100
+        for locations, workers in (
+            (self.locations, 1),
+            (self.locations, 4),
+            (many, 2),
+            (many, 32),
+        ):
+            units = work_units(locations, self.start, self.end, workers)
+            with self.subTest(locations=len(locations), workers=workers):
+                self.assertGreaterEqual(len(units), min(workers * 8, 31 * 3))
+                cells = [
+                    (id(location), unit.start + timedelta(days=day))
+                    for unit in units
+                    for location in unit.locations
+                    for day in range((unit.end - unit.start).days)
+                ]
+                self.assertEqual(len(cells), len(locations) * 31)
+                self.assertEqual(len(set(cells)), len(set(map(id, locations))) * 31)
+
+        self.assertEqual(work_units([], self.start, self.end, 4), [])
+        self.assertEqual(work_units(self.locations, self.end, self.start, 4), [])
+
+    def test_calculate(self) -> None:
+        """The rows equal `Zmanim` within a second."""
+        unit = work_units(self.locations[:1], self.start, self.end, 1)[0]
+        rows = calculate(unit)
+
+        self.assertEqual(tuple(rows[0]), FIELDS)
+        self.assertEqual(rows[0]['date'], '2024-05-01')
+        zmanim = Zmanim(self.start, Location(51.22047, 4.40026))
+        self.assertLessEqual(
+            abs(datetime.fromisoformat(str(rows[0]['sunset'])) - zmanim.sunset),
+            timedelta(seconds=1),
+        )
+        self.assertEqual(len(rows), (unit.end - unit.start).days)
+
+    def test_zmanim_batch(self) -> None:
+        """The rows of a process pool equal the rows of this process."""
+        expected = list(zmanim_batch(self.locations, self.start, self.end, workers=1))
+        self.assertEqual(len(expected), 3 * 31)
+
+        rows = list(zmanim_batch(self.locations, self.start, self.end, workers=2))
+
+        def key(row: dict[str, str | None]) -> tuple[str, str]:
+            return str(row['name']), str(row['date'])
+
+        self.assertEqual(sorted(rows, key=key), sorted(expected, key=key))
+
+    def test_write(self) -> None:
+        """The rows are written as CSV or JSON Lines."""
+        rows = list(zmanim_batch(self.locations, self.start, self.end, workers=1))
+
+        output = StringIO()
+        self.assertEqual(write(rows, output), 93)
+        lines = output.getvalue().splitlines()
+        self.assertEqual(lines[0], ','.join(FIELDS))
+        self.assertEqual(len(lines), 94)
+
+        output = StringIO()
+        self.assertEqual(write(rows, output, 'jsonl'), 93)
+        self.assertEqual(json.loads(output.getvalue().splitlines()[0]), rows[0])
+
+        with self.assertRaises(ValueError):
+            write(rows, output, 'xml')
+
+    def test_main(self) -> None:
+        """The zmanim of a CSV file are written to a file or stdout."""
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'locations.csv'
+            path.write_text(LOCATIONS_CSV, encoding='utf-8')
+            output = Path(directory) / 'zmanim.jsonl'
+
+            argv = [str(path), '--from', '2024-05-01', '--to', '2024-05-08']
+            self.assertEqual(
+                main(
+                    [
+                        *argv,
+                        '--workers',
+                        '1',
+                        '--format',
+                        'jsonl',
+                        '--output',
+                        str(output),
+                    ],
+                ),
+                0,
+            )
+            self.assertEqual(len(output.read_text(encoding='utf-8').splitlines()), 21)
+
+        with (
+            patch.object(sys, 'stdin', StringIO(LOCATIONS_CSV)),
+            patch.object(sys, 'stdout', StringIO()) as stdout,
+        ):
+            self.assertEqual(
+                main(
+                    [
+                        '-',
+                        '--from',
+                        '2024-05-01',
+                        '--to',
+                        '2024-05-02',
+                        '--workers',
+                        '1',
+                    ],
+                ),
+                0,
+            )
+        self.assertEqual(len(stdout.getvalue().splitlines()), 4)
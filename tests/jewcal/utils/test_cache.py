@@ -0,0 +1,121 @@
+"""Unittests for jewcal.utils.cache."""
+
+from doctest import DocTestSuite
+from threading import Barrier, Thread
+from typing import no_type_check
+from unittest import TestCase
+
+from src.jewcal.utils.cache import CacheInfo, LRUCache
+
+
+@no_type_check
+# pylint: disable=unused-argument
+def load_tests(loader, tests, ignore):  # noqa: ANN201, ANN001, ARG001
+    """Run the doc tests in jewcal.utils.cache.
+
+    # noqa: DAR101 loader
+    # noqa: DAR101 tests
+    # noqa: DAR101 ignore
+    # noqa: DAR201 return
+    """
+    tests.addTests(DocTestSuite('src.jewcal.utils.cache'))
+    return tests
+
+
+class LRUCacheTestCase(TestCase):
+    """Unittests for LRUCache."""
+
+    def test_least_recently_used(self) -> None:
+        """The least recently used value is removed."""
+        cache = LRUCache[str, int](maxsize=2)
+        cache.get_or_set('a', lambda: 1)
+        cache.get_or_set('b', lambda: 2)
+        cache.get_or_set('a', lambda: 0)  # b is the least recently used
+        cache.get_or_set('c', lambda: 3)
+
+        self.assertEqual(cache.get_or_set('a', lambda: 0), 1)
+        self.assertEqual(cache.get_or_set('b', lambda: 4), 4)
+        self.assertEqual(cache.info(), CacheInfo(2, 4, 2, 2))
+
+    def test_ttl(self) -> None:
+        """A value is calculated again after its time to live."""
+        now = [0.0]
+        cache = LRUCache[str, int](ttl=10, clock=lambda: now[0])
+        cache.get_or_set('a', lambda: 1)
+
+        now[0] = 9.9
+        self.assertEqual(cache.get_or_set('a', lambda: 2), 1)
+
+        now[0] = 10.0
+        self.assertEqual(cache.get_or_set('a', lambda: 2), 2)
+        self.assertEqual(cache.info(), CacheInfo(1, 2, 128, 1))
+
+    def test_clear(self) -> None:
+        """Clear removes the values and resets the statistics."""
+        cache = LRUCache[str, int]()
+        cache.get_or_set('a', lambda: 1)
+        cache.get_or_set('a', lambda: 1)
+
+        cache.clear()
+        self.assertEqual(cache.info(), CacheInfo(0, 0, 128, 0))
+        self.assertEqual(cache.get_or_set('a', lambda: 2), 2)
+
+    def test_configure(self) -> None:
+        """A smaller cache removes the least recently used values."""
+        cache = LRUCache[int, int](maxsize=10)
+        for key in range(10):
+            cache.get_or_set(key, lambda key=key: key)  # type: ignore[misc]
+
+        cache.configure(3, ttl=60)
+        self.assertEqual((cache.maxsize, cache.ttl), (3, 60))
+        self.assertEqual(cache.info().currsize, 3)
+        self.assertEqual(cache.get_or_set(9, lambda: 0), 9)
+        self.assertEqual(cache.get_or_set(6, lambda: 0), 0)
+
+        cache.configure(0)
+        self.assertEqual((cache.maxsize, cache.ttl), (0, 60))
+        self.assertEqual(cache.get_or_set(9, lambda: 1), 1)
+        self.assertEqual(cache.info().currsize, 0)
+
+        cache.configure(5, ttl=None)
+        self.assertEqual((cache.maxsize, cache.ttl), (5, None))
+
+        with self.assertRaises(ValueError):
+            cache.configure(-1)
+        with self.assertRaises(ValueError):
+            cache.configure(1, ttl=-1)
+
+    def test_exception(self) -> None:
+        """An exception is not cached."""
+        cache = LRUCache[str, int]()
+
+        def fail() -> int:
+            raise ValueError
+
+        with self.assertRaises(ValueError):
+            cache.get_or_set('a', fail)
+        self.assertEqual(cache.get_or_set('a', lambda: 1), 1)
+
+    def test_threads(self) -> None:
+        """The cache is shared by threads."""
+        cache = LRUCache[int, int](maxsize=50)
+        threads = 8
+        barrier = Barrier(threads)
+
+        def work() -> None:
+            barrier.wait()
+            for key in range(1000):
+                self.assertEqual(
+                    cache.get_or_set(key % 100, lambda key=key: key % 100),  # type: ignore[misc]
+                    key % 100,
+                )
+
+        workers = [Thread(target=work) for _ in range(threads)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+
+        info = cache.info()
+        self.assertEqual(info.hits + info.misses, threads * 1000)
+        self.assertEqual(info.currsize, 50)
@@ -0,0 +1,167 @@
+"""Unittests for jewcal.utils.calculations."""
+
+from datetime import date
+from unittest import TestCase
+
+from src.jewcal.constants import SHABBOS, YOMTOV, YOMTOV_ISRAEL
+from src.jewcal.utils import calculations, reference
+from src.jewcal.utils.calculations import (
+    absdate_to_jewish,
+    days_in_jewish_month,
+    days_in_jewish_year,
+    decode_year_type,
+    encode_year_type,
+    gregorian_to_absdate,
+    jewish_to_absdate,
+    jewish_year,
+    keviah,
+    weekday_from_absdate,
+    year_type,
+)
+
+
+class CalculationsTestCase(TestCase):
+    """Unittests for calculations."""
+
+    def test_absdate_to_jewish(self) -> None:
+        """Test absolute date to Jewish date."""
+        self.assertEqual(absdate_to_jewish(1), (3761, 10, 18))
+
+        pesach_1 = gregorian_to_absdate(2022, 4, 16)
+        self.assertEqual(absdate_to_jewish(pesach_1), (5782, 1, 15))
+
+        purim = gregorian_to_absdate(2022, 3, 16)
+        self.assertEqual(absdate_to_jewish(purim), (5782, 13, 13))
+
+        rosh_hashana = gregorian_to_absdate(2024, 10, 3)
+        self.assertEqual(absdate_to_jewish(rosh_hashana), (5785, 7, 1))
+
+        self.assertEqual(absdate_to_jewish(date.max.toordinal()), (13760, 8, 28))
+
+    def test_absdate_to_jewish_equals_reference(self) -> None:
+        """The closed-form conversion equals the reference implementation."""
+        # every day of a full Metonic cycle
+        start = gregorian_to_absdate(2000, 1, 1)
+        absdates = list(range(start, start + 19 * 366))
+
+        # samples over the full range of the Gregorian calendar
+        absdates.extend(range(1, date.max.toordinal() + 1, 997))
+
+        for absdate in absdates:
+            with self.subTest(absdate=absdate):
+                self.assertEqual(
+                    absdate_to_jewish(absdate),
+                    reference.absdate_to_jewish(absdate),
+                )
+
+    def test_jewish_to_absdate_equals_reference(self) -> None:
+        """The conversion from a Jewish date equals the reference implementation."""
+        for year in range(5700, 5800):
+            for month in range(1, 14):
+                for day in (1, 29):
+                    with self.subTest(year=year, month=month, day=day):
+                        self.assertEqual(
+                            jewish_to_absdate(year, month, day),
+                            reference.jewish_to_absdate(year, month, day),
+                        )
+
+    def test_days_equal_reference(self) -> None:
+        """The days in a year and month equal the reference implementation."""
+        for year in range(5700, 5800):
+            self.assertEqual(
+                days_in_jewish_year(year),
+                reference.days_in_jewish_year(year),
+            )
+            for month in range(1, 14):
+                self.assertEqual(
+                    days_in_jewish_month(year, month),
+                    reference.days_in_jewish_month(year, month),
+                )
+
+    def test_jewish_year(self) -> None:
+        """Test the structure of a Jewish year."""
+        # leap year with a short Cheshvan and Kislev
+        structure = jewish_year(5784)
+        self.assertEqual(structure.first_day, gregorian_to_absdate(2023, 9, 16))
+        self.assertEqual(structure.days, 383)
+        self.assertTrue(structure.is_leap)
+        self.assertEqual(structure.months, (7, 8, 9, 10, 11, 12, 13, 1, 2, 3, 4, 5, 6))
+        self.assertEqual(structure.month_days[8], 29)
+        self.assertEqual(structure.month_days[9], 29)
+        self.assertEqual(structure.month_offsets[7], 0)
+        self.assertEqual(structure.month_offsets[1], 383 - 177)
+
+        # the structure is calculated once per year
+        self.assertIs(jewish_year(5784), structure)
+
+    def test_jewish_year_outside_rosh_hashana_table(self) -> None:
+        """Years outside of the precomputed table are calculated."""
+        for year in (10000, 10001, 12345):
+            with self.subTest(year=year):
+                structure = jewish_year(year)
+                self.assertEqual(
+                    structure.first_day,
+                    reference.jewish_to_absdate(year, 7, 1),
+                )
+                self.assertEqual(structure.days, reference.days_in_jewish_year(year))
+
+    def test_rosh_hashana_table(self) -> None:
+        """The precomputed table equals the reference implementation."""
+        table = calculations._ROSH_HASHANA  # noqa: SLF001  # pylint: disable=W0212
+        if table is None:
+            self.skipTest('The Rosh Hashana table is not available')
+
+        for year in (1, 2, 3761, 5784, 5785, 9999, 10000):
+            with self.subTest(year=year):
+                first_day = reference.jewish_to_absdate(year, 7, 1)
+                self.assertEqual(table.first_days[year - 1], first_day)
+                self.assertEqual(
+                    decode_year_type(table.year_types[year - 1]),
+                    (
+                        reference.is_jewish_leap(year),
+                        reference.days_in_jewish_year(year),
+                        first_day % 7,
+                    ),
+                )
+
+    def test_year_type(self) -> None:
+        """Test the year type code."""
+        for is_leap, days in ((False, 353), (False, 355), (True, 383), (True, 385)):
+            for weekday in (1, 2, 4, 6):
+                code = encode_year_type(is_leap=is_leap, days=days, weekday=weekday)
+                self.assertLess(code, 256)
+                self.assertEqual(decode_year_type(code), (is_leap, days, weekday))
+
+    def test_year_types(self) -> None:
+        """A Jewish year has one of 14 types."""
+        codes = {year_type(year) for year in range(1, 10001)}
+        self.assertEqual(len(codes), 14)
+
+    def test_keviah(self) -> None:
+        """The year data is the template of the year type offset by Rosh Hashana."""
+        keviah.cache_clear()
+
+        for year in range(5750, 5850):
+            structure = jewish_year(year)
+            template = keviah(year_type(year))
+            self.assertEqual(template.days, structure.days)
+            self.assertEqual(template.month_offsets, structure.month_offsets)
+
+            for day_of_year in range(0, template.days, 17):
+                absdate = structure.first_day + day_of_year
+                month, day = template.dates[day_of_year]
+                weekday = template.weekdays[day_of_year]
+
+                self.assertEqual(absdate_to_jewish(absdate), (year, month, day))
+                self.assertEqual(weekday, weekday_from_absdate(absdate))
+                self.assertEqual(
+                    template.events[day_of_year],
+                    (SHABBOS.get(weekday), YOMTOV.get(month, {}).get(day)),
+                )
+                self.assertEqual(
+                    template.events_israel[day_of_year],
+                    (SHABBOS.get(weekday), YOMTOV_ISRAEL.get(month, {}).get(day)),
+                )
+
+        # a calendar of 100 years builds at most 14 templates
+        self.assertLessEqual(keviah.cache_info().misses, 14)
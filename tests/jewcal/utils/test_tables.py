@@ -0,0 +1,20 @@
+"""Unittests for jewcal.utils.tables."""
+
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from src.jewcal.utils.calculations import ROSH_HASHANA_TABLE
+from src.jewcal.utils.tables import write_rosh_hashana_table
+
+
+class TablesTestCase(TestCase):
+    """Unittests for tables."""
+
+    def test_rosh_hashana_table_is_up_to_date(self) -> None:
+        """The shipped Rosh Hashana table equals a newly generated table."""
+        with TemporaryDirectory() as directory:
+            path = Path(directory) / 'rosh_hashana.bin'
+            write_rosh_hashana_table(path)
+
+            self.assertEqual(path.read_bytes(), ROSH_HASHANA_TABLE.read_bytes())